@@ -245,13 +245,23 @@ class PipelineControlService:
             sections_by_num = {}
         return section_inputs_hash(section_number, planspace, sections_by_num)
 
-    def coordination_recheck_hash(self, sec_num, planspace, codespace, sections_by_num=None, modified_files=None) -> str:
+    def coordination_recheck_hash(
+        self, sec_num, planspace, codespace, sections_by_num=None, modified_files=None,
+        modified_contents=None,
+    ) -> str:
         from staleness.service.input_hasher import coordination_recheck_hash
         if sections_by_num is None:
             sections_by_num = {}
         if modified_files is None:
             modified_files = []
-        return coordination_recheck_hash(sec_num, planspace, codespace, sections_by_num, modified_files)
+        return coordination_recheck_hash(
+            sec_num, planspace, codespace, sections_by_num, modified_files,
+            modified_contents,
+        )
+
+    def read_modified_contents(self, codespace, modified_files) -> bytes:
+        from staleness.service.input_hasher import read_modified_contents
+        return read_modified_contents(codespace, modified_files)
 
 
 class Communicator:
@@ -267,6 +277,10 @@ class Communicator:
     def log_artifact(self, planspace, artifact_name):
         return self._get().log_artifact(planspace, artifact_name)
 
+    def batched_artifact_logs(self, join=None):
+        from signals.service.section_communicator import batched_artifact_logs
+        return batched_artifact_logs(join)
+
     def log_summary(self, planspace, message):
         return self._get().log_summary(planspace, message)
 
@@ -274,6 +288,10 @@ class Communicator:
         from signals.service.section_communicator import _record_traceability
         return _record_traceability(planspace, section_number, file_path, source, category)
 
+    def record_traceability_many(self, planspace, section_number, file_paths, source, category=""):
+        from signals.service.section_communicator import _record_traceability_many
+        return _record_traceability_many(planspace, section_number, file_paths, source, category)
+
     def mailbox_register(self, planspace):
         return self._get().mailbox_register(planspace)
 
@@ -290,22 +308,10 @@ class LogService:
 
     def log_lifecycle(self, planspace, event: str, status: str) -> None:
         """Log a lifecycle event to the coordination database."""
-        import subprocess
+        from signals.service.database_client import DatabaseClient
         cfg = Services.config()
-        subprocess.run(  # noqa: S603
-            [
-                "bash",
-                str(cfg.db_sh),  # noqa: S607
-                "log",
-                str(planspace / "run.db"),
-                "lifecycle",
-                event,
-                status,
-                "--agent",
-                cfg.agent_name,
-            ],
-            capture_output=True,
-            text=True,
+        DatabaseClient.for_planspace(planspace, cfg.db_sh).log_event(
+            "lifecycle", event, status, agent=cfg.agent_name, check=False,
         )
 
 
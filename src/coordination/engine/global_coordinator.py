@@ -142,7 +142,10 @@ class GlobalCoordinator:
     ) -> dict | None:
         """Dispatch planner agent with retry, return parsed plan or None."""
         coord_dir = PathRegistry(planspace).coordination_dir()
-        plan_prompt = self._planner.write_coordination_plan_prompt(problems, planspace)
+        # _collect_and_persist_problems already wrote this problem list.
+        plan_prompt = self._planner.write_coordination_plan_prompt(
+            problems, planspace, problems_persisted=True,
+        )
         plan_output = coord_dir / "coordination-plan-output.md"
         self._logger.log("  coordinator: dispatching coordination-planner agent")
         plan_result = self._dispatcher.dispatch(
@@ -234,14 +237,19 @@ class GlobalCoordinator:
         groups_path = coord_dir / "groups.json"
         groups_data = []
         for i, group in enumerate(groups):
+            group_sections: set[str] = set()
+            group_files: set[str] = set()
+            for problem in group.problems:
+                group_sections.add(problem.section)
+                group_files.update(problem.files)
             groups_data.append({
                 "group_id": i,
                 "problem_count": len(group.problems),
                 "strategy": str(group.strategy),
                 "interaction_type": group.interaction_type,
                 "reason": group.reason,
-                "sections": sorted({p.section for p in group.problems}),
-                "files": sorted({f for p in group.problems for f in p.files}),
+                "sections": sorted(group_sections),
+                "files": sorted(group_files),
             })
         self._artifact_io.write_json(groups_path, groups_data)
         self._communicator.log_artifact(planspace,"coordination:groups")
@@ -430,6 +438,12 @@ class GlobalCoordinator:
         self._logger.log(f"  coordinator: re-checking alignment for sections "
             f"{affected_sections}")
 
+        # Rechecks only read the codespace, so the coordinator-modified
+        # files are read once and shared by every section's input hash.
+        modified_files = list(all_modified)
+        modified_contents = self._pipeline_control.read_modified_contents(
+            ctx.codespace, modified_files,
+        )
         for sec_num in affected_sections:
             section = sections_by_num.get(sec_num)
             if not section:
@@ -437,7 +451,7 @@ class GlobalCoordinator:
 
             current_hash = self._pipeline_control.coordination_recheck_hash(
                 sec_num, ctx.planspace, ctx.codespace, sections_by_num,
-                list(all_modified),
+                modified_files, modified_contents=modified_contents,
             )
             prev_hash_file = inputs_hash_dir / f"section-{sec_num}.hash"
             if prev_hash_file.exists():
@@ -640,10 +654,11 @@ class GlobalCoordinator:
         modified_files = sorted(all_modified)
 
         # Phase 4: Re-check alignment on affected sections
-        recheck = self._recheck_affected_sections(
-            affected_sections, all_modified, sections_by_num,
-            section_results, problems, recurrence, ctx,
-        )
+        with self._communicator.batched_artifact_logs():
+            recheck = self._recheck_affected_sections(
+                affected_sections, all_modified, sections_by_num,
+                section_results, problems, recurrence, ctx,
+            )
         if recheck is None:
             return CoordinationRoundResult(
                 all_done=False,
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,12 +15,14 @@ from coordination.types import CoordinationStrategy, ProblemGroup
 from orchestrator.path_registry import PathRegistry
 from orchestrator.types import PauseType
 from pipeline.context import DispatchContext
-from coordination.prompt.writers import Writers
+from coordination.prompt.writers import SharedFixBlocks, Writers
 from orchestrator.types import Section, ControlSignal
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
 
 _MAX_PARALLEL_FIX_WORKERS = 4
 from signals.types import SIGNAL_NEED_DECISION
+from staleness.helpers.path_resolver import realpath_under
 
 _NOTE_FINGERPRINT_LENGTH = 12
 
@@ -35,6 +39,7 @@ if TYPE_CHECKING:
         PipelineControlService,
         TaskRouterService,
     )
+    from signals.service.section_communicator import ArtifactLogBatch
 
 
 class CoordinationExecutionExit(Exception):
@@ -81,14 +86,17 @@ class PlanExecutor:
             for group in groups
         ]
 
+        # batch_unions[i] is the running union of files in batches[i], so
+        # each placement is one set intersection per candidate batch.
+        batches: list[list[int]] = []
+        batch_unions: list[set[str]] = []
         if agent_batches is not None:
-            batches: list[list[int]] = []
             for agent_batch in agent_batches:
                 allowed = set(agent_batch)
                 for group_index in agent_batch:
                     _try_place_in_batch(
                         group_index, group_file_sets[group_index],
-                        batches, group_file_sets, allowed_indices=allowed,
+                        batches, batch_unions, allowed_indices=allowed,
                     )
             self._logger.log(
                 f"  coordinator: using agent-specified batch ordering "
@@ -97,9 +105,8 @@ class PlanExecutor:
             )
             return batches
 
-        batches = []
         for group_index, files in enumerate(group_file_sets):
-            _try_place_in_batch(group_index, files, batches, group_file_sets)
+            _try_place_in_batch(group_index, files, batches, batch_unions)
         return batches
 
     def _write_overlap_stats(
@@ -108,24 +115,25 @@ class PlanExecutor:
         group_index: int,
         group: list[Problem],
     ) -> None:
-        group_section_nums = sorted({problem.section for problem in group})
-        if len(group_section_nums) < 2:
-            return
-
         section_file_sets: dict[str, set[str]] = {}
         for problem in group:
             section_file_sets.setdefault(problem.section, set()).update(
                 problem.files,
             )
+        if len(section_file_sets) < 2:
+            return
 
-        section_numbers = list(section_file_sets.keys())
-        overlap_count = 0
-        for idx in range(len(section_numbers)):
-            for jdx in range(idx + 1, len(section_numbers)):
-                overlap_count += len(
-                    section_file_sets[section_numbers[idx]]
-                    & section_file_sets[section_numbers[jdx]],
-                )
+        # A file shared by c sections contributes c*(c-1)/2 to the sum of
+        # pairwise section intersections, so one count pass replaces both
+        # the pairwise loop and the per-file membership scan below.
+        section_counts = Counter(
+            file_path
+            for file_set in section_file_sets.values()
+            for file_path in file_set
+        )
+        overlap_count = sum(
+            count * (count - 1) // 2 for count in section_counts.values()
+        )
 
         if overlap_count <= 0:
             return
@@ -138,13 +146,14 @@ class PlanExecutor:
         )
         overlap_signal = {
             "group": group_index,
-            "sections": group_section_nums,
+            "sections": sorted(section_file_sets),
             "overlap_count": overlap_count,
+            # One entry per section holding the file, as before.
             "overlapping_files": sorted(
                 file_path
-                for file_set in section_file_sets.values()
-                for file_path in file_set
-                if sum(1 for candidate in section_file_sets.values() if file_path in candidate) > 1
+                for file_path, count in section_counts.items()
+                if count > 1
+                for _ in range(count)
             ),
         }
         (coord_dir / f"overlap-stats-group-{group_index}.json").write_text(
@@ -280,19 +289,42 @@ class PlanExecutor:
             f"contract delta at {contract_delta_path}",
         )
 
+    def _resolve_fix_model(self, ctx: DispatchContext) -> tuple[str, str | None]:
+        """Return ``(fix_model, escalated_from)`` for coordination fixes.
+
+        The escalation file is written before planning, so one lookup
+        serves every group in the plan.
+        """
+        fix_model = ctx.resolve_model("coordination_fix")
+        escalation_file = ctx.paths.coordination_model_escalation()
+        try:
+            escalated_model = escalation_file.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return fix_model, None
+        self._logger.log(f"  coordinator: using escalated model {escalated_model}")
+        return escalated_model, fix_model
+
     def _dispatch_fix_group(
         self,
         group: list[Problem], group_id: int,
         ctx: DispatchContext,
-        default_fix_model: str = "",
+        fix_model: str = "",
+        shared_blocks: SharedFixBlocks | None = None,
+        *,
+        escalated_from: str | None = None,
     ) -> tuple[int, list[str] | None]:
         """Dispatch an agent to fix a single problem group.
 
+        *fix_model* and *escalated_from* come from :meth:`_resolve_fix_model`;
+        an empty *fix_model* resolves them here.
+
         Returns (group_id, list_of_modified_files) on success.
         Returns (group_id, None) if ALIGNMENT_CHANGED_PENDING sentinel received.
         """
         coord_dir = ctx.paths.coordination_dir()
-        fix_prompt = self._writers.write_fix_prompt(group, ctx.planspace, ctx.codespace, group_id)
+        fix_prompt = self._writers.write_fix_prompt(
+            group, ctx.planspace, ctx.codespace, group_id, shared_blocks,
+        )
         if fix_prompt is None:
             self._logger.log(f"  coordinator: fix group {group_id} prompt blocked "
                 f"by template safety \u2014 skipping dispatch")
@@ -300,22 +332,15 @@ class PlanExecutor:
         fix_output = coord_dir / f"fix-{group_id}-output.md"
         modified_report = ctx.paths.coordination_fix_modified(group_id)
 
-        if not default_fix_model:
-            default_fix_model = ctx.resolve_model("coordination_fix")
-        fix_model = default_fix_model
-        coord_escalated_from = None
-        escalation_file = ctx.paths.coordination_model_escalation()
-        if escalation_file.exists():
-            coord_escalated_from = fix_model
-            fix_model = escalation_file.read_text(encoding="utf-8").strip()
-            self._logger.log(f"  coordinator: using escalated model {fix_model}")
+        if not fix_model:
+            fix_model, escalated_from = self._resolve_fix_model(ctx)
 
         self._dispatch_helpers.write_model_choice_signal(
             ctx.planspace, f"coord-{group_id}", "coordination-fix",
             fix_model,
-            "escalated due to coordination churn" if coord_escalated_from
+            "escalated due to coordination churn" if escalated_from
             else "default model",
-            coord_escalated_from,
+            escalated_from,
         )
 
         self._logger.log(f"  coordinator: dispatching fix for group {group_id} "
@@ -429,14 +454,14 @@ class PlanExecutor:
         descriptions = "\n".join(
             f"- Section {p.section}: {p.description}" for p in group
         )
-        explore_prompt_path.write_text(
+        write_prompt_if_changed(
+            explore_prompt_path,
             f"# Exploration: Coordination Group {group_id}\n\n"
             f"## Problems Requiring Research\n\n{descriptions}\n\n"
             f"## Files Involved\n\n"
             + "\n".join(f"- `{f}`" for p in group for f in p.files)
             + "\n\nInvestigate these problems and produce findings that "
             "the coordination planner can use to formulate a fix plan.\n",
-            encoding="utf-8",
         )
 
         step = TaskSpec(
@@ -460,31 +485,33 @@ class PlanExecutor:
 
     def _collect_modified_files(self, modified_report: Path, codespace: Path) -> list[str]:
         """Parse the modified-files report, validating paths stay within codespace."""
-        if not modified_report.exists():
+        try:
+            report_text = modified_report.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return []
-        codespace_resolved = codespace.resolve()
+        root = str(codespace.resolve())
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        real_dirs: dict[str, str] = {}
         modified: list[str] = []
-        for line in modified_report.read_text(encoding="utf-8").strip().split("\n"):
+        for line in report_text.strip().split("\n"):
             line = line.strip()
             if not line:
                 continue
-            pp = Path(line)
-            if pp.is_absolute():
-                try:
-                    rel = pp.resolve().relative_to(codespace_resolved)
-                except ValueError:
+            # Prefix check on the realpath instead of relative_to's
+            # exception flow; os.path.join keeps absolute lines as-is.
+            full = realpath_under(codespace, line, real_dirs)
+            if full == root:
+                modified.append(".")
+                continue
+            if not full.startswith(prefix):
+                if os.path.isabs(line):
                     self._logger.log(f"  coordinator: WARNING \u2014 fix path outside "
                         f"codespace, skipping: {line}")
-                    continue
-            else:
-                full = (codespace / pp).resolve()
-                try:
-                    rel = full.relative_to(codespace_resolved)
-                except ValueError:
+                else:
                     self._logger.log(f"  coordinator: WARNING \u2014 fix path escapes "
                         f"codespace, skipping: {line}")
-                    continue
-            modified.append(str(rel))
+                continue
+            modified.append(full[len(prefix):])
         return modified
 
     def _persist_modified_files(self, planspace: Path, modified_files: list[str]) -> None:
@@ -516,14 +543,14 @@ class PlanExecutor:
         for group in groups:
             if group.strategy != CoordinationStrategy.SCAFFOLD_ASSIGN:
                 continue
-            section_files: dict[str, list[str]] = {}
+            # Insertion-ordered dict keys dedupe in O(1) per file.
+            section_files: dict[str, dict[str, None]] = {}
             for problem in group.problems:
-                section_files.setdefault(problem.section, [])
-                for f in problem.files:
-                    if f not in section_files[problem.section]:
-                        section_files[problem.section].append(f)
+                section_files.setdefault(problem.section, {}).update(
+                    dict.fromkeys(problem.files),
+                )
             for section, files in sorted(section_files.items()):
-                assignments.append({"section": section, "files": files})
+                assignments.append({"section": section, "files": list(files)})
 
         if not assignments:
             return set()
@@ -545,12 +572,15 @@ class PlanExecutor:
         coord_dir: Path,
         ctx: DispatchContext,
     ) -> None:
+        # Each mailbox poll shells out to the message database, so poll only
+        # ahead of a bridge dispatch; overlap stats are a local file write
+        # and the caller polls again once the batch loop is done.
         for group_index in batch:
-            ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
-            if ctrl == ControlSignal.ALIGNMENT_CHANGED:
-                raise CoordinationExecutionExit
             group = groups[group_index]
             if group.bridge.needed:
+                ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
+                if ctrl == ControlSignal.ALIGNMENT_CHANGED:
+                    raise CoordinationExecutionExit
                 self._run_bridge_for_group(
                     group_index=group_index,
                     group=group.problems,
@@ -566,48 +596,64 @@ class PlanExecutor:
         batch_num: int,
         groups: list[ProblemGroup],
         ctx: DispatchContext,
-        fix_model_default: str,
+        fix_model: str,
+        escalated_from: str | None,
+        pool: ThreadPoolExecutor,
+        log_batch: ArtifactLogBatch,
     ) -> list[str]:
         self._logger.log(f"  coordinator: batch {batch_num} \u2014 {len(batch)} groups in parallel")
         modified: list[str] = []
-        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_FIX_WORKERS) as pool:
-            futures = {
-                pool.submit(
-                    self._dispatch_fix_group,
-                    groups[group_index].problems,
-                    group_index,
-                    ctx,
-                    fix_model_default,
-                ): group_index
-                for group_index in batch
-            }
-            sentinel_hit = False
-            for future in as_completed(futures):
-                group_index = futures[future]
-                try:
-                    _, group_modified = future.result()
-                    if group_modified is None:
-                        sentinel_hit = True
-                        for pending in futures:
-                            pending.cancel()
-                        break
-                    modified.extend(group_modified)
-                    self._logger.log(
-                        f"  coordinator: group {group_index} fix "
-                        f"complete ({len(group_modified)} files modified)",
-                    )
-                except Exception as exc:  # noqa: BLE001 — fail-open: individual group failures must not crash coordination
-                    self._logger.log(f"  coordinator: group {group_index} fix FAILED: {exc}")
-            if sentinel_hit:
-                raise CoordinationExecutionExit
+        # Fixers in earlier batches may change the tool registry or codemap,
+        # so the shared prompt blocks are refreshed per batch, not per plan.
+        shared_blocks = self._writers.shared_fix_blocks(ctx.planspace)
+        futures = {
+            pool.submit(
+                self._dispatch_fix_group_in_batch,
+                log_batch,
+                groups[group_index].problems,
+                group_index,
+                ctx,
+                fix_model,
+                shared_blocks,
+                escalated_from=escalated_from,
+            ): group_index
+            for group_index in batch
+        }
+        sentinel_hit = False
+        for future in as_completed(futures):
+            group_index = futures[future]
+            try:
+                _, group_modified = future.result()
+                if group_modified is None:
+                    sentinel_hit = True
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                modified.extend(group_modified)
+                self._logger.log(
+                    f"  coordinator: group {group_index} fix "
+                    f"complete ({len(group_modified)} files modified)",
+                )
+            except Exception as exc:  # noqa: BLE001 — fail-open: individual group failures must not crash coordination
+                self._logger.log(f"  coordinator: group {group_index} fix FAILED: {exc}")
+        if sentinel_hit:
+            raise CoordinationExecutionExit
         return modified
 
+    def _dispatch_fix_group_in_batch(
+        self, log_batch: ArtifactLogBatch, *args, **kwargs,
+    ) -> tuple[int, list[str] | None]:
+        """Run ``_dispatch_fix_group`` on a pool worker inside the plan's log batch."""
+        with self._communicator.batched_artifact_logs(join=log_batch):
+            return self._dispatch_fix_group(*args, **kwargs)
+
     def _dispatch_group_by_strategy(
         self,
         group_index: int,
         groups: list[ProblemGroup],
         ctx: DispatchContext,
-        fix_model_default: str,
+        fix_model: str,
+        escalated_from: str | None = None,
     ) -> list[str]:
         """Dispatch a single group based on its strategy. Returns modified files."""
         group = groups[group_index]
@@ -629,7 +675,8 @@ class PlanExecutor:
             group.problems,
             group_index,
             ctx,
-            default_fix_model=fix_model_default,
+            fix_model,
+            escalated_from=escalated_from,
         )
         if modified is None:
             raise CoordinationExecutionExit
@@ -683,42 +730,52 @@ class PlanExecutor:
         all_modified: list[str] = []
         coord_dir = ctx.paths.coordination_dir()
 
-        for batch_num, batch in enumerate(batches):
-            # Filter out non-dispatch groups.
-            batch = [gi for gi in batch if gi not in skip_group_indices]
-            if not batch:
-                continue
-            if self._halt_event and self._halt_event.is_set():
-                self._logger.log("  coordinator: halt event set — aborting execution")
-                raise CoordinationExecutionExit
-            ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
-            if ctrl == ControlSignal.ALIGNMENT_CHANGED:
-                raise CoordinationExecutionExit
-
-            self._run_bridges_and_overlaps_for_batch(
-                batch, groups, coord_dir, ctx,
-            )
+        fix_model, escalated_from = self._resolve_fix_model(ctx)
+
+        # One pool serves every parallel batch in the plan instead of
+        # spawning and joining a fresh set of threads per batch; workers
+        # join this thread's log batch, so artifact events from every
+        # group are written together once the pool has drained.
+        with self._communicator.batched_artifact_logs() as log_batch, ThreadPoolExecutor(
+            max_workers=_MAX_PARALLEL_FIX_WORKERS,
+            thread_name_prefix="coord-fix",
+        ) as pool:
+            for batch_num, batch in enumerate(batches):
+                # Filter out non-dispatch groups.
+                batch = [gi for gi in batch if gi not in skip_group_indices]
+                if not batch:
+                    continue
+                if self._halt_event and self._halt_event.is_set():
+                    self._logger.log("  coordinator: halt event set — aborting execution")
+                    raise CoordinationExecutionExit
+                ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
+                if ctrl == ControlSignal.ALIGNMENT_CHANGED:
+                    raise CoordinationExecutionExit
+
+                self._run_bridges_and_overlaps_for_batch(
+                    batch, groups, coord_dir, ctx,
+                )
 
-            ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
-            if ctrl == ControlSignal.ALIGNMENT_CHANGED:
-                raise CoordinationExecutionExit
+                ctrl = self._pipeline_control.poll_control_messages(ctx.planspace)
+                if ctrl == ControlSignal.ALIGNMENT_CHANGED:
+                    raise CoordinationExecutionExit
+
+                if len(batch) == 1:
+                    group_index = batch[0]
+                    all_modified.extend(
+                        self._dispatch_group_by_strategy(
+                            group_index, groups, ctx,
+                            fix_model, escalated_from,
+                        ),
+                    )
+                    continue
 
-            fix_model_default = ctx.resolve_model("coordination_fix")
-            if len(batch) == 1:
-                group_index = batch[0]
                 all_modified.extend(
-                    self._dispatch_group_by_strategy(
-                        group_index, groups, ctx, fix_model_default,
+                    self._dispatch_batch_parallel(
+                        batch, batch_num, groups,
+                        ctx, fix_model, escalated_from, pool, log_batch,
                     ),
                 )
-                continue
-
-            all_modified.extend(
-                self._dispatch_batch_parallel(
-                    batch, batch_num, groups,
-                    ctx, fix_model_default,
-                ),
-            )
 
         self._logger.log(f"  coordinator: fixes complete, {len(all_modified)} total files modified")
 
@@ -741,19 +798,21 @@ def _try_place_in_batch(
     group_index: int,
     files: set[str],
     batches: list[list[int]],
-    group_file_sets: list[set[str]],
+    batch_unions: list[set[str]],
     *,
     allowed_indices: set[int] | None = None,
 ) -> None:
-    """Place group_index into an existing compatible batch, or create a new one."""
-    if not files:
-        batches.append([group_index])
-        return
-    for batch in batches:
-        if allowed_indices is not None and any(i not in allowed_indices for i in batch):
-            continue
-        batch_files = set().union(*(group_file_sets[i] for i in batch))
-        if not batch_files or not (files & batch_files):
-            batch.append(group_index)
-            return
+    """Place group_index into an existing compatible batch, or create a new one.
+
+    *batch_unions* runs parallel to *batches* and is kept up to date here.
+    """
+    if files:
+        for batch, batch_files in zip(batches, batch_unions):
+            if allowed_indices is not None and not allowed_indices.issuperset(batch):
+                continue
+            if files.isdisjoint(batch_files):
+                batch.append(group_index)
+                batch_files |= files
+                return
     batches.append([group_index])
+    batch_unions.append(set(files))
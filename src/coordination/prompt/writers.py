@@ -5,6 +5,7 @@ Each function: collect context → render template → validate → write file.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,7 +13,9 @@ from coordination.problem_types import Problem
 from coordination.repository.notes import list_notes_to
 from orchestrator.path_registry import PathRegistry
 from pipeline.template import SRC_TEMPLATE_DIR, TASK_SUBMISSION_SEMANTICS, load_template, render
+from dispatch.prompt.prompt_formatters import scoped_context_block
 from dispatch.service.context_sidecar import ContextSidecar
+from dispatch.service.prompt_guard import write_prompt_if_changed
 
 if TYPE_CHECKING:
     from containers import (
@@ -24,6 +27,20 @@ if TYPE_CHECKING:
     )
 
 
+@dataclass(frozen=True)
+class SharedFixBlocks:
+    """Group-invariant parts of coordinator-fix prompts.
+
+    Computed once per execution batch so parallel fix groups do not each
+    re-stat the codemap, re-read the tool registry, and rewrite the same
+    fixer context sidecar.
+    """
+
+    codemap_block: str
+    tools_block: str
+    sidecar_path: Path | None
+
+
 class Writers:
     """Coordination prompt writer methods."""
 
@@ -42,16 +59,30 @@ class Writers:
         self._prompt_guard = prompt_guard
         self._task_router = task_router
 
+    def shared_fix_blocks(self, planspace: Path) -> SharedFixBlocks:
+        """Compute the fix-prompt pieces that do not depend on the group."""
+        paths = PathRegistry(planspace)
+        return SharedFixBlocks(
+            codemap_block=_format_codemap_block(paths),
+            tools_block=self._format_tools_block(paths),
+            sidecar_path=ContextSidecar(self._artifact_io).materialize_context_sidecar(
+                str(self._task_router.resolve_agent_path("coordination-fixer.md")),
+                planspace,
+            ),
+        )
+
     def write_fix_prompt(
         self,
         group: list[Problem], planspace: Path, codespace: Path,
         group_id: int,
+        shared: SharedFixBlocks | None = None,
     ) -> Path | None:
         """Write a prompt to fix a group of related problems.
 
         The prompt lists the grouped problems with section context, the
         affected files, and instructs the agent to fix ALL listed problems
-        in a coordinated way.
+        in a coordinated way.  Callers writing several fix prompts at once
+        pass *shared* from :meth:`shared_fix_blocks`.
         """
         paths = PathRegistry(planspace)
         prompt_path = paths.coordination_fix_prompt(group_id)
@@ -60,8 +91,10 @@ class Writers:
         problems_text = _format_problems(group)
         file_list = _format_file_list(group, codespace)
         section_specs, alignment_specs = _format_section_refs(group, paths)
-        codemap_block = _format_codemap_block(paths)
-        tools_block = self._format_tools_block(paths)
+        if shared is None:
+            shared = self.shared_fix_blocks(planspace)
+        codemap_block = shared.codemap_block
+        tools_block = shared.tools_block
 
         task_submission_path = paths.coordination_task_request(group_id)
 
@@ -85,19 +118,9 @@ class Writers:
                 f"violations: {violations}")
             return None
 
-        sidecar_path = ContextSidecar(self._artifact_io).materialize_context_sidecar(
-            str(self._task_router.resolve_agent_path("coordination-fixer.md")),
-            planspace,
+        write_prompt_if_changed(
+            prompt_path, rendered + scoped_context_block(shared.sidecar_path),
         )
-
-        prompt_path.write_text(rendered, encoding="utf-8")
-        if sidecar_path:
-            with prompt_path.open("a", encoding="utf-8") as f:
-                f.write(
-                    f"\n## Scoped Context\n"
-                    f"Agent context sidecar with resolved inputs: "
-                    f"`{sidecar_path}`\n"
-                )
         self._communicator.log_artifact(planspace, f"prompt:coordinator-fix-{group_id}")
         return prompt_path
 
@@ -144,14 +167,9 @@ class Writers:
             planspace,
         )
 
-        prompt_path.write_text(rendered, encoding="utf-8")
-        if sidecar_path:
-            with prompt_path.open("a", encoding="utf-8") as f:
-                f.write(
-                    f"\n## Scoped Context\n"
-                    f"Agent context sidecar with resolved inputs: "
-                    f"`{sidecar_path}`\n"
-                )
+        write_prompt_if_changed(
+            prompt_path, rendered + scoped_context_block(sidecar_path),
+        )
         self._communicator.log_artifact(planspace, f"prompt:coordinator-scaffold-{group_id}")
         return prompt_path
 
@@ -176,35 +194,39 @@ class Writers:
             {fp for p in group for fp in p.files},
         )
 
-        section_refs = "\n".join(
-            f"- Section {n}: "
-            f"`{sections_dir / f'section-{n}-proposal-excerpt.md'}`"
-            for n in group_sections
-        )
-        alignment_refs = "\n".join(
-            f"- Section {n}: "
-            f"`{sections_dir / f'section-{n}-alignment-excerpt.md'}`"
-            for n in group_sections
-        )
-        proposal_refs = "\n".join(
-            f"- `{proposals_dir / f'section-{n}-integration-proposal.md'}`"
-            for n in group_sections
-        )
-
-        consequence_refs = []
-        for section_num in group_sections:
-            for note in list_notes_to(paths, section_num):
+        # One pass over the sections fills every per-section reference list.
+        section_lines: list[str] = []
+        alignment_lines: list[str] = []
+        proposal_lines: list[str] = []
+        consequence_refs: list[str] = []
+        note_output_lines: list[str] = []
+        for n in group_sections:
+            section_lines.append(
+                f"- Section {n}: "
+                f"`{sections_dir / f'section-{n}-proposal-excerpt.md'}`",
+            )
+            alignment_lines.append(
+                f"- Section {n}: "
+                f"`{sections_dir / f'section-{n}-alignment-excerpt.md'}`",
+            )
+            proposal_lines.append(
+                f"- `{proposals_dir / f'section-{n}-integration-proposal.md'}`",
+            )
+            for note in list_notes_to(paths, n):
                 consequence_refs.append(f"- `{note}`")
+            note_output_lines.append(
+                f"- `{notes_dir / f'from-bridge-{group_index}-to-{n}.md'}`",
+            )
+        section_refs = "\n".join(section_lines)
+        alignment_refs = "\n".join(alignment_lines)
+        proposal_refs = "\n".join(proposal_lines)
+        note_output_refs = "\n".join(note_output_lines)
+
         consequence_block = ""
         if consequence_refs:
             consequence_block = "\n\n## Existing Consequence Notes\n" + "\n".join(
                 consequence_refs,
             )
-
-        note_output_refs = "\n".join(
-            f"- `{notes_dir / f'from-bridge-{group_index}-to-{n}.md'}`"
-            for n in group_sections
-        )
         shared_files_list = "\n".join(f"- `{fp}`" for fp in group_files)
         template = load_template("coordination/bridge-resolve.md", SRC_TEMPLATE_DIR)
         rendered = render(template, {
@@ -272,37 +294,34 @@ def _format_problems(group: list[Problem]) -> str:
 
 
 def _format_file_list(group: list[Problem], codespace: Path) -> str:
-    all_files: list[str] = []
-    seen: set[str] = set()
-    for p in group:
-        for f in p.files:
-            if f not in seen:
-                all_files.append(f)
-                seen.add(f)
+    all_files = dict.fromkeys(f for p in group for f in p.files)
     # project-spec.md is read-only user input — never present it as an
     # affected file that agents are invited to modify.
-    all_files = [f for f in all_files if Path(f).name != "project-spec.md"]
-    return "\n".join(f"- `{codespace / f}`" for f in all_files)
+    return "\n".join(
+        f"- `{codespace / f}`"
+        for f in all_files
+        if Path(f).name != "project-spec.md"
+    )
 
 
 def _format_section_refs(
     group: list[Problem], paths: PathRegistry,
 ) -> tuple[str, str]:
-    section_nums = sorted({p.section for p in group})
     sec_dir = paths.sections_dir()
-    section_specs = "\n".join(
-        f"- Section {n} specification:"
-        f" `{sec_dir / f'section-{n}.md'}`\n"
-        f"  - Proposal excerpt:"
-        f" `{sec_dir / f'section-{n}-proposal-excerpt.md'}`"
-        for n in section_nums
-    )
-    alignment_specs = "\n".join(
-        f"- Section {n} alignment excerpt:"
-        f" `{sec_dir / f'section-{n}-alignment-excerpt.md'}`"
-        for n in section_nums
-    )
-    return section_specs, alignment_specs
+    spec_lines: list[str] = []
+    alignment_lines: list[str] = []
+    for n in sorted({p.section for p in group}):
+        spec_lines.append(
+            f"- Section {n} specification:"
+            f" `{sec_dir / f'section-{n}.md'}`\n"
+            f"  - Proposal excerpt:"
+            f" `{sec_dir / f'section-{n}-proposal-excerpt.md'}`",
+        )
+        alignment_lines.append(
+            f"- Section {n} alignment excerpt:"
+            f" `{sec_dir / f'section-{n}-alignment-excerpt.md'}`",
+        )
+    return "\n".join(spec_lines), "\n".join(alignment_lines)
 
 
 def _format_codemap_block(paths: PathRegistry) -> str:
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
 from orchestrator.path_registry import PathRegistry
+from staleness.helpers.stat_cache import is_settled
+
+_NOTE_NAME_RE = re.compile(r"from-(.+)-to-(\d+)\.md$")
 
 
 def _note_path(planspace: Path, from_section: str, to_section: str) -> Path:
@@ -16,8 +20,69 @@ def _note_path(planspace: Path, from_section: str, to_section: str) -> Path:
 
 def list_notes_to(paths: PathRegistry, section: str) -> list[Path]:
     """Sorted inbound notes targeting *section*."""
-    d = paths.notes_dir()
-    return sorted(d.glob(f"from-*-to-{section}.md")) if d.is_dir() else []
+    if section.isdigit():
+        return list(_notes_index(paths.notes_dir()).get(section, ()))
+    prefix = "from-"
+    suffix = f"-to-{section}.md"
+    min_len = len(prefix) + len(suffix)
+    try:
+        with os.scandir(paths.notes_dir()) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if len(entry.name) >= min_len
+                and entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def index_notes_by_target(paths: PathRegistry) -> dict[str, list[Path]]:
+    """Map each target section to its sorted inbound notes.
+
+    One directory pass serves every section; the listing is shared with
+    :func:`list_notes_to` and reused until the notes directory changes.
+    """
+    return {
+        target: list(note_paths)
+        for target, note_paths in _notes_index(paths.notes_dir()).items()
+    }
+
+
+# notes dir -> (directory st_mtime_ns, inbound notes by target section)
+_NOTES_INDEX_CACHE: dict[str, tuple[int, dict[str, list[Path]]]] = {}
+
+
+def _notes_index(notes_dir: Path) -> dict[str, list[Path]]:
+    """Inbound-note index for *notes_dir*, rescanned only when it changes.
+
+    Creating, removing, or renaming a note advances the directory's
+    mtime, which invalidates the cached listing; edits to a note's
+    content do not change the listing and need no rescan.
+    """
+    try:
+        mtime_ns = os.stat(notes_dir).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    key = str(notes_dir)
+    cached = _NOTES_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    index: dict[str, list[Path]] = {}
+    try:
+        with os.scandir(notes_dir) as entries:
+            for entry in entries:
+                match = _NOTE_NAME_RE.match(entry.name)
+                if match:
+                    index.setdefault(match.group(2), []).append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    for note_paths in index.values():
+        note_paths.sort()
+    if is_settled(mtime_ns):
+        _NOTES_INDEX_CACHE[key] = (mtime_ns, index)
+    return index
 
 
 def list_notes_from(paths: PathRegistry, section: str) -> list[Path]:
@@ -32,12 +97,23 @@ def list_all_notes(paths: PathRegistry) -> list[Path]:
     return sorted(d.glob("*.md")) if d.is_dir() else []
 
 
-def read_incoming_notes(planspace: Path, section_number: str) -> list[dict]:
-    """Read note files targeting a section."""
-    paths = PathRegistry(planspace)
+def read_incoming_notes(
+    planspace: Path,
+    section_number: str,
+    notes_index: dict[str, list[Path]] | None = None,
+) -> list[dict]:
+    """Read note files targeting a section.
+
+    Callers reading notes for many sections pass *notes_index* from
+    :func:`index_notes_by_target` to skip the per-section directory scan.
+    """
+    if notes_index is None:
+        note_paths = list_notes_to(PathRegistry(planspace), section_number)
+    else:
+        note_paths = notes_index.get(section_number, [])
     notes: list[dict] = []
-    for note_path in list_notes_to(paths, section_number):
-        match = re.match(r"from-(.+)-to-(\d+)\.md$", note_path.name)
+    for note_path in note_paths:
+        match = _NOTE_NAME_RE.match(note_path.name)
         if not match:
             continue
         notes.append({
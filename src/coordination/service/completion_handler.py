@@ -11,6 +11,7 @@ not scanning concerns.
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,6 +19,9 @@ from typing import TYPE_CHECKING
 from coordination.types import NoteAction
 
 _NOTE_HASH_LENGTH = 12
+_DEPTH_MARKER = "**Consequence Depth**:"
+_NOTE_ID_RE = re.compile(r"\*\*Note ID\*\*:\s*`([^`]+)`")
+_NUMERIC_SECTION_RE = re.compile(r"\d+")
 # Consequence depth is tracked for observability but does NOT mechanically
 # cap propagation.  The coordination planner (an agent with context) decides
 # whether a deep cascade warrants strategic intervention — not a hardcoded
@@ -72,11 +76,11 @@ class CompletionHandler:
         parts = []
         for rel_path in sorted(modified_files):
             src = codespace / rel_path
-            if src.exists():
-                file_digest = self._hasher.file_hash(src)
-                file_hash = file_digest if file_digest else "unreadable"
-            else:
-                file_hash = "missing"
+            file_hash = self._hasher.file_hash(src)
+            if not file_hash:
+                # file_hash() yields "" for both cases; only the rare
+                # failure path pays for a second stat to tell them apart.
+                file_hash = "unreadable" if src.exists() else "missing"
             parts.append(f"{rel_path}:{file_hash}")
         return self._hasher.content_hash("\n".join(parts))
 
@@ -112,11 +116,12 @@ class CompletionHandler:
                     else "- (indirect coupling)"
                 )
                 contract_path.write_text(
-                    f"# Contract: Section {sec_num} \u2194 Section {target_num}\n\n"
-                    f"## Risk\n{reason}\n\n"
-                    f"## Shared Surface\n{shared_text}\n\n"
-                    f"## Invariants\n"
-                    f"(To be filled by bridge agent or next alignment check)\n",
+                    _CONTRACT_TEMPLATE.format_map({
+                        "sec_num": sec_num,
+                        "target_num": target_num,
+                        "reason": reason,
+                        "shared_text": shared_text,
+                    }),
                     encoding="utf-8",
                 )
                 self._logger.log(
@@ -134,8 +139,12 @@ class CompletionHandler:
         max_depth = 0
         for note in note_entries:
             content = note.get("content", "")
+            # A C-level substring search skips notes without the marker
+            # before any line splitting.
+            if _DEPTH_MARKER not in content:
+                continue
             for line in content.split("\n"):
-                if line.startswith("**Consequence Depth**:"):
+                if line.startswith(_DEPTH_MARKER):
                     try:
                         depth = int(line.split(":")[1].strip().strip("`"))
                         max_depth = max(max_depth, depth)
@@ -177,17 +186,21 @@ class CompletionHandler:
         incoming_depth = self._read_incoming_depth(planspace, sec_num)
         note_depth = incoming_depth + 1
 
-        for target_num, reason, _contract_risk, note_md in impacted_sections:
-            note_name = f"from-{sec_num}-to-{target_num}.md"
-            note_id = self._hasher.content_hash(f"{note_name}:{files_fingerprint}")[:_NOTE_HASH_LENGTH]
-            note_content = _build_consequence_note(
-                sec_num, target_num, reason, note_md, note_id,
-                section_summary, modified_files, planspace,
-                depth=note_depth,
-            )
-            note_path = write_consequence_note(planspace, sec_num, target_num, note_content)
-            self._communicator.log_artifact(planspace, f"note:from-{sec_num}-to-{target_num}")
-            self._logger.log(f"Section {sec_num}: left note for section {target_num} at {note_path}")
+        # The modified-file list is the same in every target's note.
+        file_changes = _format_file_changes(modified_files)
+        # One transaction for every note's artifact event, not one per note.
+        with self._communicator.batched_artifact_logs():
+            for target_num, reason, _contract_risk, note_md in impacted_sections:
+                note_name = f"from-{sec_num}-to-{target_num}.md"
+                note_id = self._hasher.content_hash(f"{note_name}:{files_fingerprint}")[:_NOTE_HASH_LENGTH]
+                note_content = _build_consequence_note(
+                    sec_num, target_num, reason, note_md, note_id,
+                    section_summary, modified_files, planspace,
+                    depth=note_depth, file_changes=file_changes,
+                )
+                note_path = write_consequence_note(planspace, sec_num, target_num, note_content)
+                self._communicator.log_artifact(planspace, f"note:from-{sec_num}-to-{target_num}")
+                self._logger.log(f"Section {sec_num}: left note for section {target_num} at {note_path}")
 
         baseline_hash_dir = paths.section_inputs_hashes_dir()
         completed_targets = [
@@ -248,7 +261,7 @@ class CompletionHandler:
         parts: list[str] = []
         for note in note_entries:
             note_text = note["content"]
-            note_id_match = re.search(r"\*\*Note ID\*\*:\s*`([^`]+)`", note_text)
+            note_id_match = _NOTE_ID_RE.search(note_text)
             if note_id_match and note_id_match.group(1) in resolved_ids:
                 continue
 
@@ -269,27 +282,15 @@ class CompletionHandler:
 
 _MAX_DIFF_LINES = 100
 
+_CONTRACT_TEMPLATE = (
+    "# Contract: Section {sec_num} \u2194 Section {target_num}\n\n"
+    "## Risk\n{reason}\n\n"
+    "## Shared Surface\n{shared_text}\n\n"
+    "## Invariants\n"
+    "(To be filled by bridge agent or next alignment check)\n"
+)
 
-def _build_consequence_note(
-    sec_num: str,
-    target_num: str,
-    reason: str,
-    note_md: str | None,
-    note_id: str,
-    section_summary: str,
-    modified_files: list[str],
-    planspace: Path,
-    *,
-    depth: int = 1,
-) -> str:
-    """Build the markdown content for a consequence note."""
-    paths = PathRegistry(planspace)
-    snapshot_dir = paths.snapshot_section(sec_num)
-    delta_content = note_md if note_md else f"Impact reason: {reason}"
-    file_changes = "\n".join(f"- `{rel_path}`" for rel_path in modified_files)
-    integration_proposal = paths.proposal(sec_num)
-    ack_signal_path = paths.note_ack_signal(target_num)
-    return f"""# Consequence Note: Section {sec_num} -> Section {target_num}
+_CONSEQUENCE_NOTE_TEMPLATE = """# Consequence Note: Section {sec_num} -> Section {target_num}
 
 **Note ID**: `{note_id}`
 **Consequence Depth**: `{depth}`
@@ -320,6 +321,60 @@ Snapshot directory: `{snapshot_dir}`
 """
 
 
+def _format_file_changes(modified_files: list[str]) -> str:
+    return "\n".join(f"- `{rel_path}`" for rel_path in modified_files)
+
+
+def _build_consequence_note(
+    sec_num: str,
+    target_num: str,
+    reason: str,
+    note_md: str | None,
+    note_id: str,
+    section_summary: str,
+    modified_files: list[str],
+    planspace: Path,
+    *,
+    depth: int = 1,
+    file_changes: str | None = None,
+) -> str:
+    """Build the markdown content for a consequence note.
+
+    *file_changes* is the pre-formatted modified-file list; callers
+    writing one note per impacted target pass it to format it once.
+    """
+    paths = PathRegistry(planspace)
+    snapshot_dir = paths.snapshot_section(sec_num)
+    delta_content = note_md if note_md else f"Impact reason: {reason}"
+    if file_changes is None:
+        file_changes = _format_file_changes(modified_files)
+    integration_proposal = paths.proposal(sec_num)
+    ack_signal_path = paths.note_ack_signal(target_num)
+    return _CONSEQUENCE_NOTE_TEMPLATE.format_map({
+        "sec_num": sec_num,
+        "target_num": target_num,
+        "note_id": note_id,
+        "depth": depth,
+        "delta_content": delta_content,
+        "reason": reason,
+        "ack_signal_path": ack_signal_path,
+        "section_summary": section_summary,
+        "file_changes": file_changes,
+        "integration_proposal": integration_proposal,
+        "snapshot_dir": snapshot_dir,
+    })
+
+
+def _snapshot_file_set(snapshot_dir: Path) -> set[str]:
+    """Relative paths of the files under *snapshot_dir*."""
+    root = str(snapshot_dir)
+    return {
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _dirnames, filenames in os.walk(root)
+        for name in filenames
+    }
+
+
 def _build_source_diffs(
     source_num: str,
     section: Section,
@@ -330,17 +385,21 @@ def _build_source_diffs(
 
     Returns formatted markdown diff block, or ``None`` if no diffs found.
     """
-    if not re.fullmatch(r"\d+", source_num):
+    if not _NUMERIC_SECTION_RE.fullmatch(source_num):
         return None
     source_snapshot_dir = paths.snapshot_section(source_num)
-    if not source_snapshot_dir.exists():
+    # Snapshots hold only the files a section modified, so one walk
+    # answers membership for every related file; a missing directory
+    # walks as empty.
+    snapshotted = _snapshot_file_set(source_snapshot_dir)
+    if not snapshotted:
         return None
 
     diff_parts: list[str] = []
     for rel_path in section.related_files:
-        snapshot_file = source_snapshot_dir / rel_path
-        if not snapshot_file.exists():
+        if os.path.normpath(rel_path) not in snapshotted:
             continue
+        snapshot_file = source_snapshot_dir / rel_path
         diff_text = compute_text_diff(snapshot_file, codespace / rel_path)
         if not diff_text:
             continue
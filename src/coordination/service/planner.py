@@ -34,7 +34,9 @@ class Planner:
         self, plan: dict[str, Any], n: int,
     ) -> bool:
         """Validate that all problem indices in groups are valid and complete."""
-        seen_indices: set[int] = set()
+        # Bit i of seen_mask records problem index i; one int OR/AND per
+        # index instead of set hashing, and completeness is one compare.
+        seen_mask = 0
         for group in plan["groups"]:
             if "problems" not in group or not isinstance(group["problems"], list):
                 self._logger.log("  coordinator: group missing 'problems' array")
@@ -43,13 +45,14 @@ class Planner:
                 if not isinstance(idx, int) or idx < 0 or idx >= n:
                     self._logger.log(f"  coordinator: invalid problem index {idx}")
                     return False
-                if idx in seen_indices:
+                bit = 1 << idx
+                if seen_mask & bit:
                     self._logger.log(f"  coordinator: duplicate problem index {idx}")
                     return False
-                seen_indices.add(idx)
+                seen_mask |= bit
 
-        if len(seen_indices) != n:
-            missing = set(range(n)) - seen_indices
+        if seen_mask != (1 << n) - 1:
+            missing = {i for i in range(n) if not seen_mask >> i & 1}
             self._logger.log(f"  coordinator: coordination plan missing indices: {missing}")
             return False
         return True
@@ -136,14 +139,21 @@ class Planner:
 
     def write_coordination_plan_prompt(
         self, problems: list[Problem], planspace: Path,
+        *, problems_persisted: bool = False,
     ) -> Path:
-        """Write an Opus prompt to plan coordination strategy for problems."""
+        """Write an Opus prompt to plan coordination strategy for problems.
+
+        Pass ``problems_persisted=True`` when *problems* were already
+        written to the coordination problems file this round, so the
+        (potentially large) list is not serialized a second time.
+        """
         paths = PathRegistry(planspace)
         coord_dir = paths.coordination_dir()
         prompt_path = coord_dir / "coordination-plan-prompt.md"
 
-        problems_path = coord_dir / "problems.json"
-        self._artifact_io.write_json(problems_path, problems)
+        problems_path = paths.coordination_problems()
+        if not problems_persisted:
+            self._artifact_io.write_json(problems_path, problems)
 
         codemap_path = paths.codemap()
         corrections_path = paths.corrections()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,16 +17,22 @@ from coordination.problem_types import (
     ScopeDeltaProblem,
     UnaddressedNoteProblem,
 )
-from coordination.repository.notes import read_incoming_notes as load_incoming_notes
+from coordination.repository.notes import (
+    index_notes_by_target,
+    read_incoming_notes as load_incoming_notes,
+)
 from coordination.repository.scope_deltas import list_scope_delta_files
 from orchestrator.path_registry import PathRegistry
 from coordination.types import NoteAction, RecurrenceReport
 from orchestrator.types import ProposalPassResult, Section, SectionResult
 from signals.types import SIGNAL_NEED_DECISION
+from staleness.helpers.stat_cache import is_settled
 
 if TYPE_CHECKING:
     from containers import ArtifactIOService, Communicator, LogService, SignalReader
 
+_NOTE_ID_RE = re.compile(r"\*\*Note ID\*\*:\s*`([^`]+)`")
+
 _SKIP_ACCEPTED = object()
 """Sentinel: note ack was accepted, skip without appending a problem."""
 
@@ -52,6 +59,9 @@ class ProblemResolver:
         self._communicator = communicator
         self._logger = logger
         self._signals = signals
+        # Note-ack indexes keyed by path, tagged with the (mtime_ns, size)
+        # they were read at, so unchanged acks are not reparsed each round.
+        self._ack_index_cache: dict[Path, tuple[tuple[int, int], dict[str, dict]]] = {}
 
     def _collect_blocker_and_misalignment_problems(
         self, section_results, sections_by_num, paths,
@@ -100,9 +110,14 @@ class ProblemResolver:
         self, section_results, sections_by_num, paths,
     ) -> list[Problem]:
         problems: list[Problem] = []
+        # Many notes share a target; read and index each ack signal once.
+        acks_by_target: dict[str, dict[str, dict]] = {}
         note_entries: list[dict[str, Any]] = []
+        notes_index = index_notes_by_target(paths)
         for target_num in sorted(section_results):
-            note_entries.extend(load_incoming_notes(paths.planspace, target_num))
+            note_entries.extend(
+                load_incoming_notes(paths.planspace, target_num, notes_index),
+            )
         for note in sorted(note_entries, key=lambda entry: entry["path"].name):
             note_path = note["path"]
             target_num = note["target"]
@@ -111,17 +126,18 @@ class ProblemResolver:
             if not target_result or not target_result.aligned:
                 continue
 
-            note_id_match = re.search(
-                r'\*\*Note ID\*\*:\s*`([^`]+)`', note["content"],
-            )
+            note_id_match = _NOTE_ID_RE.search(note["content"])
             if not note_id_match:
                 continue
             note_id = note_id_match.group(1)
 
             files = _section_files(sections_by_num, target_num)
-            ack_signal = self._signals.read(paths.note_ack_signal(target_num))
+            acks_by_id = acks_by_target.get(target_num)
+            if acks_by_id is None:
+                acks_by_id = self._load_note_acks(paths.note_ack_signal(target_num))
+                acks_by_target[target_num] = acks_by_id
             ack_result = _classify_note_ack(
-                note_id, target_num, source_label, ack_signal, files,
+                note_id, target_num, source_label, acks_by_id, files,
             )
             if ack_result is not None:
                 if ack_result is not _SKIP_ACCEPTED:
@@ -142,6 +158,26 @@ class ProblemResolver:
             ))
         return problems
 
+    def _load_note_acks(self, ack_path: Path) -> dict[str, dict]:
+        """Return the indexed acks in *ack_path*, reusing an unchanged read."""
+        try:
+            st = os.stat(ack_path)
+        except FileNotFoundError:
+            self._ack_index_cache.pop(ack_path, None)
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._ack_index_cache.get(ack_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        acks_by_id = _index_note_acks(self._signals.read(ack_path))
+        # Ack statuses share a length, so a rewrite within one mtime tick
+        # can keep the stamp; such a fresh read is not cached.
+        if is_settled(st.st_mtime_ns):
+            self._ack_index_cache[ack_path] = (stamp, acks_by_id)
+        else:
+            self._ack_index_cache.pop(ack_path, None)
+        return acks_by_id
+
     def _collect_scope_delta_problems(self, sections_by_num, paths) -> list[Problem]:
         problems: list[Problem] = []
         scope_deltas_dir = paths.scope_deltas_dir()
@@ -338,21 +374,25 @@ def _section_files(sections_by_num, sec_num):
     return list(section.related_files) if section else []
 
 
+def _index_note_acks(ack_signal: dict | None) -> dict[str, dict]:
+    """Map note IDs to their first acknowledgement entry."""
+    if not ack_signal:
+        return {}
+    acks_by_id: dict[str, dict] = {}
+    for ack in ack_signal.get("acknowledged", []):
+        acks_by_id.setdefault(ack.get("note_id"), ack)
+    return acks_by_id
+
+
 def _classify_note_ack(
     note_id: str, target_num: str, source_label: str,
-    ack_signal: dict | None, files: list[str],
+    acks_by_id: dict[str, dict], files: list[str],
 ) -> Problem | object | None:
     """Classify a note's ack status.
 
     Returns a ``Problem``, ``_SKIP_ACCEPTED`` sentinel, or ``None``.
     """
-    if not ack_signal:
-        return None
-    acks = ack_signal.get("acknowledged", [])
-    matching_ack = next(
-        (ack for ack in acks if ack.get("note_id") == note_id),
-        None,
-    )
+    matching_ack = acks_by_id.get(note_id)
     if not matching_ack:
         return None
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import signal
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,6 +15,8 @@ if TYPE_CHECKING:
     from containers import TaskRouterService
 
 _DEFAULT_AGENT_TIMEOUT_SECONDS = 600
+_HALT_POLL_SECONDS = 1.0
+_TERMINATE_GRACE_SECONDS = 5.0
 
 
 @dataclass
@@ -37,8 +42,14 @@ class AgentExecutor:
         agent_file: str,
         codespace: Path | None = None,
         timeout: int = _DEFAULT_AGENT_TIMEOUT_SECONDS,
+        halt_event: threading.Event | None = None,
     ) -> AgentResult:
-        """Run the ``agents`` binary and return the raw process result."""
+        """Run the ``agents`` binary and return the raw process result.
+
+        The agent is launched in its own session so a timeout or a set
+        *halt_event* tears down the whole process tree instead of
+        waiting out the remaining timeout.
+        """
 
         if not agent_file:
             raise ValueError(
@@ -63,22 +74,21 @@ class AgentExecutor:
         # Strip CLAUDECODE so nested agents sessions can launch
         env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
 
+        # close_fds keeps its default: dispatches run on worker threads, and
+        # an inherited pipe end from a sibling dispatch would hold off that
+        # sibling's EOF until this agent exits.
+        proc = subprocess.Popen(  # noqa: S603
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+            start_new_session=True,
+        )
         try:
-            result = subprocess.run(  # noqa: S603
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env=env,
-            )
-            return AgentResult(
-                output=result.stdout + result.stderr,
-                stdout=result.stdout,
-                stderr=result.stderr,
-                returncode=result.returncode,
-                timed_out=False,
-            )
+            stdout, stderr = _communicate(proc, timeout, halt_event)
         except subprocess.TimeoutExpired:
+            _terminate_group(proc)
             return AgentResult(
                 output=f"TIMEOUT: Agent exceeded {timeout}s time limit",
                 stdout="",
@@ -86,3 +96,56 @@ class AgentExecutor:
                 returncode=-1,
                 timed_out=True,
             )
+        except BaseException:
+            # The agent's own session does not receive a terminal Ctrl-C,
+            # so any other exit from the wait must reap its group here.
+            _terminate_group(proc)
+            raise
+        return AgentResult(
+            output=stdout + stderr,
+            stdout=stdout,
+            stderr=stderr,
+            returncode=proc.returncode,
+            timed_out=False,
+        )
+
+
+def _communicate(
+    proc: subprocess.Popen,
+    timeout: int,
+    halt_event: threading.Event | None,
+) -> tuple[str, str]:
+    """Wait for *proc*, killing its process group early if *halt_event* fires.
+
+    Raises ``subprocess.TimeoutExpired`` once *timeout* elapses.
+    """
+    if halt_event is None:
+        return proc.communicate(timeout=timeout)
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        try:
+            return proc.communicate(timeout=min(_HALT_POLL_SECONDS, remaining))
+        except subprocess.TimeoutExpired:
+            if halt_event.is_set():
+                return _terminate_group(proc)
+
+
+def _terminate_group(proc: subprocess.Popen) -> tuple[str, str]:
+    """SIGTERM the agent's whole process group, escalating to SIGKILL.
+
+    The agent runs in its own session, so the group id equals its pid
+    and any provider CLIs it spawned are reaped along with it.
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            break
+        try:
+            return proc.communicate(timeout=_TERMINATE_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            continue
+    return proc.communicate()
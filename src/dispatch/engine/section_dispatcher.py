@@ -11,6 +11,7 @@ from dispatch.types import DispatchResult, DispatchStatus
 from signals.service.database_client import DatabaseClient
 from dispatch.repository.metadata import Metadata
 from dispatch.service.monitor_service import MonitorService
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from orchestrator.path_registry import PathRegistry
 
 from pipeline.template import SRC_TEMPLATE_DIR, load_template, render, render_template
@@ -168,9 +169,8 @@ class SectionDispatcher:
         if violations:
             self._logger.log(f"  ERROR: monitor prompt blocked — dynamic violations: {violations}")
             return prompt_path
-        prompt_path.write_text(
-            render_template("monitor", dynamic_body),
-            encoding="utf-8",
+        write_prompt_if_changed(
+            prompt_path, render_template("monitor", dynamic_body),
         )
         self._communicator.log_artifact(planspace, f"prompt:agent-monitor-{agent_name}")
         return prompt_path
@@ -250,6 +250,7 @@ class SectionDispatcher:
         run_result = executor.run_agent(
             model, prompt_path,
             agent_file=agent_file, codespace=codespace, timeout=_SECTION_DISPATCH_TIMEOUT_SECONDS,
+            halt_event=self._halt_event,
         )
 
         if self._halt_event and self._halt_event.is_set():
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,16 +12,23 @@ from signals.types import SignalResult
 if TYPE_CHECKING:
     from containers import ArtifactIOService, SignalReader
 
+_SUMMARY_LINE_RE = re.compile(r"^\s*summary:(.*)$", re.IGNORECASE | re.MULTILINE)
+# A fence is any line whose stripped text starts with ```; the block body
+# runs up to the next such line.
+_FENCED_BLOCK_RE = re.compile(
+    r"^[^\S\n]*```[^\n]*\n(.*?)^[^\S\n]*```", re.MULTILINE | re.DOTALL,
+)
+
+
 def summarize_output(output: str, max_len: int = 0) -> str:
     """Extract a brief summary from agent output for status messages.
 
     If *max_len* is >0, truncate to that many chars.
     """
-    for line in output.split("\n"):
-        stripped = line.strip()
-        if stripped.lower().startswith("summary:"):
-            text = stripped[len("summary:"):].strip()
-            return text[:max_len] if max_len > 0 else text
+    match = _SUMMARY_LINE_RE.search(output)
+    if match is not None:
+        text = match.group(1).strip()
+        return text[:max_len] if max_len > 0 else text
     for line in output.split("\n"):
         stripped = line.strip()
         if stripped and not stripped.startswith("#") and not stripped.startswith("---"):
@@ -35,22 +43,18 @@ def extract_fenced_block(text: str, marker: str) -> str | None:
     (without the fence delimiters) of the first block containing *marker*.
     Returns ``None`` if no matching block is found.
     """
-    in_fence = False
-    fence_lines: list[str] = []
-    for line in text.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("```") and not in_fence:
-            in_fence = True
-            fence_lines = []
-            continue
-        if stripped.startswith("```") and in_fence:
-            candidate = "\n".join(fence_lines)
-            if marker in candidate:
-                return candidate
-            in_fence = False
-            continue
-        if in_fence:
-            fence_lines.append(line)
+    # No fence opening after the marker's last occurrence can contain it,
+    # so the scan stops there, and text without the marker skips it.
+    last_marker = text.rfind(marker)
+    if last_marker == -1:
+        return None
+    for match in _FENCED_BLOCK_RE.finditer(text):
+        if match.start() > last_marker:
+            break
+        # The lazy group keeps the newline that precedes the closing fence.
+        candidate = match.group(1)[:-1]
+        if marker in candidate:
+            return candidate
     return None
 
 
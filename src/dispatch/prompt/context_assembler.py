@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from orchestrator.types import Section
 
 from orchestrator.path_registry import PathRegistry
@@ -49,7 +50,7 @@ def build_proposal_context_extras(
     problems_block = ""
     if alignment_problems:
         problems_file = artifacts / f"intg-proposal-{sec}-problems.md"
-        problems_file.write_text(alignment_problems, encoding="utf-8")
+        write_prompt_if_changed(problems_file, alignment_problems)
         problems_block = (
             f"\n## Previous Alignment Problems\n\n"
             f"The alignment check found problems with your previous integration\n"
@@ -69,7 +70,7 @@ def build_proposal_context_extras(
     notes_block = ""
     if incoming_notes:
         notes_file = artifacts / f"intg-proposal-{sec}-notes.md"
-        notes_file.write_text(incoming_notes, encoding="utf-8")
+        write_prompt_if_changed(notes_file, incoming_notes)
         notes_block = (
             f"\n## Notes from Other Sections\n\n"
             f"Other sections have completed work that may affect this section. Read\n"
@@ -98,7 +99,7 @@ def build_impl_context_extras(
     problems_block = ""
     if alignment_problems:
         problems_file = artifacts / f"impl-{sec}-problems.md"
-        problems_file.write_text(alignment_problems, encoding="utf-8")
+        write_prompt_if_changed(problems_file, alignment_problems)
         problems_block = (
             f"\n## Previous Implementation Alignment Problems\n\n"
             f"The alignment check found problems with your previous implementation.\n"
@@ -178,8 +178,11 @@ def build_scope_grant_context(paths: PathRegistry, sec: str) -> dict:
         return {"scope_grant_line": scope_grant_line}
 
     scope_grant_path = paths.section_scope_grant(sec)
-    scope_grant_path.parent.mkdir(parents=True, exist_ok=True)
-    scope_grant_path.write_text(scope_grant + "\n", encoding="utf-8")
+    try:
+        scope_grant_path.write_text(scope_grant + "\n", encoding="utf-8")
+    except FileNotFoundError:
+        scope_grant_path.parent.mkdir(parents=True, exist_ok=True)
+        scope_grant_path.write_text(scope_grant + "\n", encoding="utf-8")
     scope_grant_line = (
         f"\n6. Parent scope grant (hard delegated constraint): "
         f"`{scope_grant_path}`"
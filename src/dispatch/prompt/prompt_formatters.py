@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,12 +13,37 @@ if TYPE_CHECKING:
     from containers import ConfigService
 
 
+# Prompt fragments depend only on their arguments and the shipped
+# templates, so retry loops re-rendering a section's prompts reuse them.
+_FRAGMENT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
 def signal_instructions(signal_path: Path) -> str:
     """Return signal instructions for an agent prompt."""
     template = load_template("dispatch/signal-instructions.md")
     return render(template, {"signal_path": signal_path})
 
 
+@lru_cache(maxsize=_FRAGMENT_CACHE_SIZE)
+def _mail_instructions(
+    db_sh: str,
+    run_db: Path,
+    agent_name: str,
+    monitor_name: str,
+) -> str:
+    mailbox_cmd = (
+        f'bash "{db_sh}" send "{run_db}" '
+        f"{agent_name} --from {agent_name}"
+    )
+    template = load_template("dispatch/mail-instructions.md")
+    return render(template, {
+        "agent_name": agent_name,
+        "monitor_name": monitor_name,
+        "mailbox_cmd": mailbox_cmd,
+    })
+
+
 class PromptFormatters:
     """Prompt formatting helpers that require service dependencies."""
 
@@ -31,17 +57,12 @@ class PromptFormatters:
         monitor_name: str,
     ) -> str:
         """Return narration-via-mailbox instructions for an agent."""
-        run_db = PathRegistry(planspace).run_db()
-        mailbox_cmd = (
-            f'bash "{self._config.db_sh}" send "{run_db}" '
-            f"{agent_name} --from {agent_name}"
+        return _mail_instructions(
+            str(self._config.db_sh),
+            PathRegistry(planspace).run_db(),
+            agent_name,
+            monitor_name,
         )
-        template = load_template("dispatch/mail-instructions.md")
-        return render(template, {
-            "agent_name": agent_name,
-            "monitor_name": monitor_name,
-            "mailbox_cmd": mailbox_cmd,
-        })
 
 
 def format_existing_file_listing(
@@ -22,6 +22,7 @@ from dispatch.prompt.prompt_formatters import (
 )
 
 from dispatch.service.context_sidecar import ContextSidecar
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from orchestrator.types import Section
 from dispatch.prompt.context_builder import ContextBuilder, build_scope_grant_context
 from pipeline.template import load_template, render
@@ -97,7 +98,7 @@ class Writers:
             When set, materializes a context sidecar for this agent name
             (e.g. ``"integration-proposer.md"``) and appends it after
             rendering.  Uses manual ``validate_dynamic_content`` +
-            ``write_text`` instead of ``write_validated_prompt``.
+            ``write_prompt_if_changed`` instead of ``write_validated_prompt``.
         """
         paths = PathRegistry(planspace)
         artifacts = paths.artifacts
@@ -127,11 +128,9 @@ class Writers:
                     f"violations: {violations}")
                 return None
 
-            prompt_path.write_text(rendered, encoding="utf-8")
-
-            if sidecar_path:
-                with prompt_path.open("a", encoding="utf-8") as f:
-                    f.write(scoped_context_block(sidecar_path))
+            write_prompt_if_changed(
+                prompt_path, rendered + scoped_context_block(sidecar_path),
+            )
         else:
             if not self._prompt_guard.write_validated(rendered, prompt_path):
                 self._logger.log(f"  ERROR: prompt {prompt_path.name} blocked — template violations")
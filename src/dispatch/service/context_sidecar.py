@@ -15,6 +15,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _read_optional(path: Path) -> str | None:
+    """Return *path*'s text, or ``None`` when the file does not exist."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _read_first(*paths: Path) -> str:
+    """Return the text of the first of *paths* that exists, else ``""``."""
+    for path in paths:
+        text = _read_optional(path)
+        if text is not None:
+            return text
+    return ""
+
+
 def _parse_inline_yaml_list(text: str) -> list[str]:
     """Parse a YAML inline list like ``[a, b, c]`` into string items."""
     if not (text.startswith("[") and text.endswith("]")):
@@ -29,12 +46,8 @@ def _parse_inline_yaml_list(text: str) -> list[str]:
 
 def parse_context_field(agent_file: str) -> list[str]:
     """Extract the ``context:`` list from an agent file's YAML frontmatter."""
-    path = Path(agent_file)
-    if not path.exists():
-        return []
-
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
+    text = _read_optional(Path(agent_file))
+    if text is None or not text.startswith("---"):
         return []
 
     end = text.find("\n---", 3)
@@ -117,10 +130,9 @@ class ContextSidecar:
         return self._artifact_io.read_if_exists(PathRegistry(planspace).governance_packet(section))
 
     def _resolve_user_entry(self, planspace: Path, _section: str | None) -> str:
-        spec_path = PathRegistry(planspace).artifacts / "spec.md"
-        if spec_path.exists():
-            return spec_path.read_text(encoding="utf-8")
-        return ""
+        return self._artifact_io.read_if_exists(
+            PathRegistry(planspace).artifacts / "spec.md"
+        )
 
     def _resolve_classification(self, planspace: Path, _section: str | None) -> str:
         return self._artifact_io.read_if_exists(
@@ -128,24 +140,18 @@ class ContextSidecar:
         )
 
     def _resolve_problems(self, planspace: Path, _section: str | None) -> str:
-        paths = PathRegistry(planspace)
-        explored = paths.global_problems_dir() / "explored-problems.json"
-        if explored.exists():
-            return explored.read_text(encoding="utf-8")
-        initial = paths.global_problems_dir() / "initial-problems.json"
-        if initial.exists():
-            return initial.read_text(encoding="utf-8")
-        return ""
+        problems_dir = PathRegistry(planspace).global_problems_dir()
+        return _read_first(
+            problems_dir / "explored-problems.json",
+            problems_dir / "initial-problems.json",
+        )
 
     def _resolve_values(self, planspace: Path, _section: str | None) -> str:
-        paths = PathRegistry(planspace)
-        explored = paths.global_values_dir() / "explored-values.json"
-        if explored.exists():
-            return explored.read_text(encoding="utf-8")
-        initial = paths.global_values_dir() / "initial-values.json"
-        if initial.exists():
-            return initial.read_text(encoding="utf-8")
-        return ""
+        values_dir = PathRegistry(planspace).global_values_dir()
+        return _read_first(
+            values_dir / "explored-values.json",
+            values_dir / "initial-values.json",
+        )
 
     def _resolve_proposal(self, planspace: Path, _section: str | None) -> str:
         return self._artifact_io.read_if_exists(
@@ -245,11 +251,14 @@ class ContextSidecar:
         if not agent_context:
             return None
         ctx_path = PathRegistry(planspace).context_sidecar(Path(agent_file_path).stem)
-        ctx_path.parent.mkdir(parents=True, exist_ok=True)
-        ctx_path.write_text(
-            json.dumps(agent_context, indent=2) + "\n",
-            encoding="utf-8",
-        )
+        payload = json.dumps(agent_context, indent=2) + "\n"
+        # The directory exists after the first sidecar, so only a failed
+        # write pays for creating it.
+        try:
+            ctx_path.write_text(payload, encoding="utf-8")
+        except FileNotFoundError:
+            ctx_path.parent.mkdir(parents=True, exist_ok=True)
+            ctx_path.write_text(payload, encoding="utf-8")
         return ctx_path
 
 
@@ -271,12 +280,11 @@ def _resolve_codemap(planspace: Path, section: str | None) -> str:
         except Exception:
             pass  # Fall through to global codemap
 
-    if not codemap_path.exists():
+    content = _read_optional(codemap_path)
+    if content is None:
         return ""
-    content = codemap_path.read_text(encoding="utf-8")
-    corrections_path = paths.corrections()
-    if corrections_path.exists():
-        corrections_text = corrections_path.read_text(encoding="utf-8")
+    corrections_text = _read_optional(paths.corrections())
+    if corrections_text is not None:
         content += (
             "\n\n## Codemap Corrections (authoritative)\n\n"
             "The following corrections override the routing claims above. "
@@ -291,13 +299,12 @@ def _resolve_related_files(planspace: Path, section: str | None) -> str:
     if not section:
         return ""
     paths = PathRegistry(planspace)
-    json_path = paths.related_files_signal(section)
-    if json_path.exists():
-        return json_path.read_text(encoding="utf-8")
+    signal_text = _read_optional(paths.related_files_signal(section))
+    if signal_text is not None:
+        return signal_text
 
-    spec_path = paths.section_spec(section)
-    if spec_path.exists():
-        text = spec_path.read_text(encoding="utf-8")
+    text = _read_optional(paths.section_spec(section))
+    if text is not None:
         marker = "## Related Files"
         index = text.find(marker)
         if index >= 0:
@@ -319,14 +326,11 @@ def _resolve_section_output(planspace: Path, section: str | None) -> str:
     if not section:
         return ""
     artifacts = PathRegistry(planspace).artifacts
-    for path in [
+    return _read_first(
         artifacts / f"intg-proposal-{section}-output.md",
         artifacts / f"intg-align-{section}-output.md",
         artifacts / f"section-{section}-output.md",
-    ]:
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-    return ""
+    )
 
 
 def _resolve_flow_context(planspace: Path, _section: str | None) -> str:
@@ -110,10 +110,9 @@ class MonitorService:
                         check=False,
                     )
 
-        self._db.cleanup(handle.agent_name, check=False)
-        self._db.unregister(handle.agent_name, check=False)
-        self._db.cleanup(handle.monitor_name, check=False)
-        self._db.unregister(handle.monitor_name, check=False)
+        for name in (handle.agent_name, handle.monitor_name):
+            self._db.run_quiet("cleanup", name)
+            self._db.run_quiet("unregister", name)
         return output
 
     def _log(self, message: str) -> None:
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from pipeline.template import render_template
 from orchestrator.path_registry import PathRegistry
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
 from signals.types import (
     SIGNAL_DEPENDENCY,
@@ -83,12 +84,12 @@ class OutputAdjudicator:
         if violations:
             self._logger.log(f"  ERROR: adjudicate prompt blocked — dynamic violations: {violations}")
             return None, ""
-        adj_prompt.write_text(
+        write_prompt_if_changed(
+            adj_prompt,
             render_template(
                 "adjudicate", dynamic_body,
                 file_paths=[str(output_path)],
             ),
-            encoding="utf-8",
         )
 
         result = self._dispatcher.dispatch(
@@ -13,6 +13,7 @@ section-loop internals.
 from __future__ import annotations
 
 import logging
+import os
 import re
 from pathlib import Path
 
@@ -69,6 +70,28 @@ def validate_dynamic_content(content: str) -> list[str]:
     return violations
 
 
+def write_prompt_if_changed(path: Path, content: str | bytes) -> bool:
+    """Write *content* to *path* atomically, skipping identical rewrites.
+
+    Regenerating a prompt with unchanged inputs leaves the existing file
+    (and its mtime) untouched.  Otherwise the content goes to a sibling
+    ``.tmp`` file that is renamed over *path*, so a concurrently reading
+    agent never sees a torn prompt.  ``str`` content is UTF-8 encoded;
+    ``bytes`` are written as given.  Returns ``True`` if the file was
+    written, ``False`` if it already held *content*.
+    """
+    data = content if isinstance(content, bytes) else content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
 def write_validated_prompt(content: str, path: Path) -> bool:
     """Validate dynamic content and write to *path*.
 
@@ -76,8 +99,7 @@ def write_validated_prompt(content: str, path: Path) -> bool:
     Returns ``True`` if validation passed.  Returns ``False`` on
     violation — caller must not dispatch.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    write_prompt_if_changed(path, content)
     violations = validate_dynamic_content(content)
     if violations:
         _logger.warning(
@@ -1,6 +1,7 @@
 """Tool registry surface writer — reads registry and presents tools to agents.
 
-Public API: ``surface_tool_registry()``, ``write_tool_surface()``.
+Public API: ``surface_tool_registry()``, ``write_tool_surface()``,
+``load_registry_tools()``.
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ from typing import TYPE_CHECKING
 from orchestrator.path_registry import PathRegistry
 from signals.service.blocker_manager import update_blocker_rollup
 from signals.types import SIGNAL_NEED_DECISION
+from staleness.helpers.stat_cache import is_settled
 
 if TYPE_CHECKING:
     from containers import (
@@ -28,17 +30,70 @@ def extract_tools(registry: dict | list) -> list:
     return registry if isinstance(registry, list) else registry.get("tools", [])
 
 
+# Positions of cross-section tools, and of every tool by its creator
+_ToolIndex = tuple[list[int], dict[str, list[int]]]
+
+# registry path -> (st_size, st_mtime_ns, all_tools, index)
+_REGISTRY_CACHE: dict[str, tuple[int, int, tuple, _ToolIndex]] = {}
+
+
+def index_tools(all_tools: list) -> _ToolIndex:
+    """Bucket tool positions by cross-section scope and by creator."""
+    cross_section: list[int] = []
+    by_creator: dict[str, list[int]] = {}
+    for position, tool in enumerate(all_tools):
+        if tool.get("scope") == "cross-section":
+            cross_section.append(position)
+        by_creator.setdefault(tool.get("created_by"), []).append(position)
+    return cross_section, by_creator
+
+
+def load_registry_tools(
+    artifact_io: ArtifactIOService, registry_path: Path,
+) -> tuple[list, _ToolIndex] | None:
+    """Return the registry's tools and their index, or None if malformed.
+
+    Sections in one run share the registry, so it is parsed and indexed
+    once and reused while its size and mtime are unchanged.  Each caller
+    gets its own copy of the tool list.  Raises ``FileNotFoundError``
+    when there is no registry; a malformed one is preserved by
+    ``read_json`` and not cached.
+    """
+    st = registry_path.stat()
+    key = str(registry_path)
+    cached = _REGISTRY_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return list(cached[2]), cached[3]
+    registry = artifact_io.read_json(registry_path)
+    if registry is None:
+        return None
+    all_tools = extract_tools(registry)
+    index = index_tools(all_tools)
+    if is_settled(st.st_mtime_ns):
+        _REGISTRY_CACHE[key] = (
+            st.st_size, st.st_mtime_ns, tuple(all_tools), index,
+        )
+    return list(all_tools), index
+
+
 def write_tool_surface(
     all_tools: list,
     section_number: str,
     tools_available_path: Path,
+    *,
+    index: _ToolIndex | None = None,
 ) -> int:
-    """Filter and write section-relevant tools surface."""
-    sec_key = f"section-{section_number}"
+    """Filter and write section-relevant tools surface.
+
+    *index* is the result of ``index_tools(all_tools)``; callers that
+    surface the same registry for many sections pass it to skip the scan.
+    """
+    cross_section, by_creator = index if index is not None else index_tools(all_tools)
+    local = by_creator.get(f"section-{section_number}", [])
+    # Registry order is kept; a tool in both buckets is listed once.
     relevant_tools = [
-        tool for tool in all_tools
-        if tool.get("scope") == "cross-section"
-        or tool.get("created_by") == sec_key
+        all_tools[position]
+        for position in sorted(set(cross_section).union(local))
     ]
     if relevant_tools:
         lines = ["# Available Tools\n", "Cross-section and section-local tools:\n"]
@@ -215,15 +270,16 @@ class ToolSurfaceWriter:
         """Load the tool registry, repair if needed, and write the tool surface."""
         paths = PathRegistry(planspace)
         tool_registry_path = paths.tool_registry()
-        if not tool_registry_path.exists():
+        try:
+            loaded = load_registry_tools(self._artifact_io, tool_registry_path)
+        except FileNotFoundError:
             return 0
         tools_available_path = paths.tools_available(section_number)
 
-        registry = self._artifact_io.read_json(tool_registry_path)
-        if registry is not None:
-            all_tools = extract_tools(registry)
+        if loaded is not None:
+            all_tools, index = loaded
             relevant_count = write_tool_surface(
-                all_tools, section_number, tools_available_path,
+                all_tools, section_number, tools_available_path, index=index,
             )
             self._log_surface_result(
                 section_number, relevant_count, len(all_tools), tools_available_path,
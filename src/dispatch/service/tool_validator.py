@@ -12,7 +12,7 @@ from orchestrator.path_registry import PathRegistry
 from signals.service.blocker_manager import update_blocker_rollup
 from signals.types import SIGNAL_NEED_DECISION
 
-from dispatch.service.tool_surface_writer import extract_tools
+from dispatch.service.tool_surface_writer import load_registry_tools
 
 if TYPE_CHECKING:
     from containers import (
@@ -208,12 +208,15 @@ class ToolValidator:
         paths = PathRegistry(planspace)
         tool_registry_path = paths.tool_registry()
         friction_signal_path = paths.tool_friction_signal(section_number)
-        if not tool_registry_path.exists():
+        try:
+            # An implementation that left the registry alone is answered
+            # from the parse cached when its tools were surfaced.
+            loaded = load_registry_tools(self._artifact_io, tool_registry_path)
+        except FileNotFoundError:
             return friction_signal_path
 
-        post_registry = self._artifact_io.read_json(tool_registry_path)
-        if post_registry is not None:
-            post_tools = extract_tools(post_registry)
+        if loaded is not None:
+            post_tools, _index = loaded
             if len(post_tools) > pre_tool_total:
                 self._dispatch_new_tool_validation(
                     section_number=section_number,
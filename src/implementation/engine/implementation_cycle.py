@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -142,9 +143,17 @@ class ImplementationCycle:
         if dispatch_action == _CONTINUE:
             return None
 
-        align_result = self._dispatch_alignment_check(
-            section, planspace, codespace,
-        )
+        # Which files changed depends only on the implementation dispatch,
+        # so diff them against the snapshot while the alignment judge runs.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            changed_future = pool.submit(
+                self._change_verifier.verify_changed_files,
+                planspace, codespace, section, pre_hashes,
+            )
+            align_result = self._dispatch_alignment_check(
+                section, planspace, codespace,
+            )
+            actually_changed = changed_future.result()
         if align_result is None:
             return None
 
@@ -153,7 +162,7 @@ class ImplementationCycle:
         )
         if timeout_action == _CONTINUE:
             # Timeout -- caller should retry
-            return self._finalize(planspace, codespace, section, pre_hashes)
+            return self._finalize(planspace, codespace, section, actually_changed)
 
         problems = self._extract_alignment_problems(
             align_result, section.number, planspace, codespace,
@@ -173,13 +182,13 @@ class ImplementationCycle:
                 planspace,
                 f"summary:impl-align:{section.number}:ALIGNED",
             )
-            return self._finalize(planspace, codespace, section, pre_hashes)
+            return self._finalize(planspace, codespace, section, actually_changed)
 
         # Misaligned -- log and return finalized result; state machine retries
         self._log_alignment_problems(
             section.number, impl_attempt, problems, planspace,
         )
-        return self._finalize(planspace, codespace, section, pre_hashes)
+        return self._finalize(planspace, codespace, section, actually_changed)
 
     # -----------------------------------------------------------------------
     # Logging helpers
@@ -416,22 +425,17 @@ class ImplementationCycle:
         planspace: Path,
         codespace: Path,
         section,
-        pre_hashes: dict[str, str],
+        actually_changed: list[str],
     ) -> list[str]:
-        """Verify changes, record traceability, build trace map, queue assessment."""
-        actually_changed = self._change_verifier.verify_changed_files(
-            planspace, codespace, section, pre_hashes,
+        """Record traceability for verified changes, build trace map, queue assessment."""
+        self._communicator.record_traceability_many(
+            planspace,
+            section.number,
+            actually_changed,
+            f"section-{section.number}-integration-proposal.md",
+            "implementation change",
         )
 
-        for changed_file in actually_changed:
-            self._communicator.record_traceability(
-                planspace,
-                section.number,
-                changed_file,
-                f"section-{section.number}-integration-proposal.md",
-                "implementation change",
-            )
-
         self._traceability_writer.write_traceability_index(planspace, section, actually_changed)
 
         self._trace_map_builder.build_trace_map(
@@ -7,6 +7,7 @@ positives from agent-reported file lists.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -20,6 +21,44 @@ if TYPE_CHECKING:
     )
 
 
+def _existing_paths(root: str, relative_paths: list[str]) -> set[str]:
+    """Return the members of *relative_paths* that exist under *root*.
+
+    Reported files cluster in a few directories, so paths that share a
+    parent are resolved with one ``scandir`` of it instead of a ``stat``
+    each.  A lone path, or a parent that cannot be listed, falls back to
+    ``os.path.exists``.
+    """
+    by_parent: dict[str, list[tuple[str, str]]] = {}
+    for relative_path in relative_paths:
+        parent, name = os.path.split(os.path.join(root, relative_path))
+        by_parent.setdefault(parent, []).append((relative_path, name))
+
+    present: set[str] = set()
+    for parent, members in by_parent.items():
+        entries = None
+        if len(members) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            except OSError:
+                pass
+        for relative_path, name in members:
+            if entries is None or name in ("", ".", ".."):
+                if os.path.exists(os.path.join(root, relative_path)):
+                    present.add(relative_path)
+                continue
+            entry = entries.get(name)
+            # A dangling symlink is listed but does not exist.
+            if entry is not None and (
+                not entry.is_symlink() or os.path.exists(entry.path)
+            ):
+                present.add(relative_path)
+    return present
+
+
 class ChangeVerifier:
     """Verify which files were actually changed during implementation.
 
@@ -50,23 +89,27 @@ class ChangeVerifier:
         trusted (they were created by the agent).
         """
         reported = self._section_alignment.collect_modified_files(planspace, section, codespace)
-        snapshotted_set = set(section.related_files)
-        snapshotted_candidates = sorted(
-            snapshotted_set | (set(reported) & set(pre_hashes))
+        # One pass over the report splits it into snapshotted candidates
+        # and the rest; only the rest is checked on disk.
+        snapshotted_candidates = set(section.related_files)
+        outside_snapshot: list[str] = []
+        for relative_path in reported:
+            if relative_path in pre_hashes:
+                snapshotted_candidates.add(relative_path)
+            else:
+                outside_snapshot.append(relative_path)
+        present = _existing_paths(os.fspath(codespace), outside_snapshot)
+        unsnapshotted_reported = [p for p in outside_snapshot if p in present]
+        verified_changed = self._staleness.diff_files(
+            codespace, pre_hashes, sorted(snapshotted_candidates),
         )
-        verified_changed = self._staleness.diff_files(codespace, pre_hashes, snapshotted_candidates)
 
-        unsnapshotted_reported = [
-            relative_path
-            for relative_path in reported
-            if relative_path not in pre_hashes and (codespace / relative_path).exists()
-        ]
         if unsnapshotted_reported:
             self._logger.log(
                 f"Section {section.number}: {len(unsnapshotted_reported)} "
                 f"reported files were outside the pre-snapshot set (trusted)"
             )
-        actually_changed = sorted(set(verified_changed) | set(unsnapshotted_reported))
+        actually_changed = sorted(set(verified_changed).union(unsnapshotted_reported))
         if len(reported) != len(actually_changed):
             self._logger.log(
                 f"Section {section.number}: {len(reported)} reported, "
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
+import os
 import shutil
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from orchestrator.path_registry import PathRegistry
+from staleness.helpers.path_resolver import realpath_under
+from staleness.helpers.stat_cache import is_settled
+
+_PARALLEL_COPY_MIN_FILES = 8
+_MAX_SNAPSHOT_COPY_WORKERS = 8
 
 
 def snapshot_modified_files(
@@ -33,47 +41,148 @@ def snapshot_modified_files(
 
     codespace_resolved = codespace.resolve()
     snapshot_resolved = snapshot_dir.resolve()
+    real_dirs: dict[str, str] = {}
+    # Modified files cluster in a few directories; each is created once.
+    made_dirs: set[Path] = set()
+    copies: list[tuple[Path, Path, os.stat_result]] = []
     for rel_path in modified_files:
-        src = (codespace / rel_path).resolve()
-        if not src.exists():
+        src = Path(realpath_under(codespace, rel_path, real_dirs))
+        try:
+            src_stat = src.stat()
+        except OSError:
             continue
         if not src.is_relative_to(codespace_resolved):
             if warn is not None:
                 warn(f"snapshot path escapes codespace, skipping: {rel_path}")
             continue
-        dest = (snapshot_dir / rel_path).resolve()
+        dest = Path(realpath_under(snapshot_dir, rel_path, real_dirs))
         if not dest.is_relative_to(snapshot_resolved):
             if warn is not None:
                 warn(f"dest path escapes snapshot dir, skipping: {rel_path}")
             continue
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(src), str(dest))
+        if dest.parent not in made_dirs:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(dest.parent)
+        copies.append((src, dest, src_stat))
+
+    # Checks and warnings stay serial and ordered; only the copies, which
+    # are independent and I/O-bound, overlap once there are enough.
+    if len(copies) < _PARALLEL_COPY_MIN_FILES:
+        for copy in copies:
+            _copy_snapshot_file(*copy)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=_MAX_SNAPSHOT_COPY_WORKERS,
+            thread_name_prefix="snapshot-copy",
+        ) as pool:
+            # list() re-raises the first copy failure, as the serial loop would.
+            list(pool.map(lambda copy: _copy_snapshot_file(*copy), copies))
 
     return snapshot_dir
 
 
+def _copy_snapshot_file(src: Path, dest: Path, src_stat: os.stat_result) -> None:
+    # Diffs only need the bytes and the mtime; copy2's copystat would
+    # also chase permission bits and xattrs on every file.
+    shutil.copyfile(src, dest)
+    os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
 def compute_text_diff(old_path: Path, new_path: Path) -> str:
-    """Compute a unified text diff between two files."""
-    if not old_path.exists() and not new_path.exists():
+    """Compute a unified text diff between two files.
+
+    Identical contents return ``""`` without splitting either file.
+    Diff hunks are cached by content digest, since many notes compare
+    unchanged snapshots of the same file against the same current copy;
+    only the ``---``/``+++`` labels are rebuilt per call.  Digests of
+    settled files are remembered by size and mtime, so a repeat
+    comparison can be answered from stats alone.
+    """
+    old = _DiffInput(old_path)
+    new = _DiffInput(new_path)
+    if old.digest == new.digest:
+        # Covers both-missing too: nothing differs, so there is no diff.
         return ""
-    if not old_path.exists():
-        old_lines: list[str] = []
-        old_label = "(did not exist)"
-    else:
-        old_lines = old_path.read_text(encoding="utf-8").splitlines(keepends=True)
-        old_label = str(old_path)
-    if not new_path.exists():
-        new_lines: list[str] = []
-        new_label = "(deleted)"
-    else:
-        new_lines = new_path.read_text(encoding="utf-8").splitlines(keepends=True)
-        new_label = str(new_path)
-
-    diff = difflib.unified_diff(
-        old_lines,
-        new_lines,
-        fromfile=old_label,
-        tofile=new_label,
-        lineterm="",
-    )
-    return "\n".join(diff)
+    old_label = "(did not exist)" if old.missing else str(old_path)
+    new_label = "(deleted)" if new.missing else str(new_path)
+
+    hunks = _DIFF_HUNK_CACHE.get((old.digest, new.digest))
+    if hunks is None:
+        # The first two lines are the file headers; labels are added below.
+        hunks = "\n".join(list(difflib.unified_diff(
+            _split_lines(old.data()),
+            _split_lines(new.data()),
+            lineterm="",
+        ))[2:])
+        # data() refreshes a digest if the file moved on since its stat.
+        if len(_DIFF_HUNK_CACHE) >= _DIFF_HUNK_CACHE_MAX:
+            del _DIFF_HUNK_CACHE[next(iter(_DIFF_HUNK_CACHE))]
+        _DIFF_HUNK_CACHE[(old.digest, new.digest)] = hunks
+    if not hunks:
+        # Only line endings differed, which read_text translation hides.
+        return ""
+    return f"--- {old_label}\n+++ {new_label}\n{hunks}"
+
+
+# (old digest, new digest) -> unified diff text without the file headers
+_DIFF_HUNK_CACHE: dict[tuple[bytes, bytes], str] = {}
+_DIFF_HUNK_CACHE_MAX = 256
+
+# path -> (st_size, st_mtime_ns, digest)
+_DIGEST_CACHE: dict[str, tuple[int, int, bytes]] = {}
+
+
+class _DiffInput:
+    """One side of a diff: its digest up front, its bytes only on demand."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._data: bytes | None = None
+        self.missing = False
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._set_missing()
+            return
+        cached = _DIGEST_CACHE.get(str(path))
+        if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+            self.digest = cached[2]
+            return
+        self._load()
+        if not self.missing and is_settled(st.st_mtime_ns):
+            _DIGEST_CACHE[str(path)] = (st.st_size, st.st_mtime_ns, self.digest)
+
+    def data(self) -> bytes | None:
+        if self._data is None and not self.missing:
+            self._load()
+        return self._data
+
+    def _load(self) -> None:
+        self._data = _read_bytes(self._path)
+        if self._data is None:
+            self._set_missing()
+        else:
+            self.digest = _digest(self._data)
+
+    def _set_missing(self) -> None:
+        self.missing = True
+        self.digest = b""
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _split_lines(data: bytes | None) -> list[str]:
+    """Decode like ``read_text``, including universal-newline translation."""
+    if data is None:
+        return []
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return text.splitlines(keepends=True)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import subprocess
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,6 +14,7 @@ from orchestrator.service.section_decision_store import (
     build_section_number_map,
     normalize_section_number,
 )
+from signals.service.database_client import DatabaseClient
 
 if TYPE_CHECKING:
     from containers import (
@@ -33,6 +33,8 @@ if TYPE_CHECKING:
 MaterialImpact = tuple[str, str, bool, str]
 
 _RELATED_FILES_DISPLAY_LIMIT = 10
+_IMPACTS_MARKER = '"impacts"'
+_JSON_DECODER = json.JSONDecoder()
 
 
 def collect_impact_candidates(
@@ -178,13 +180,8 @@ def _parse_material_impacts(
     output: str,
     sec_num_map: dict[int, str],
 ) -> list[MaterialImpact] | None:
-    json_text = _extract_json_block(output, marker='"impacts"')
-    if json_text is None:
-        return None
-
-    try:
-        data = json.loads(json_text)
-    except (json.JSONDecodeError, TypeError):
+    data = _extract_impacts_object(output)
+    if data is None:
         return None
 
     impacts: list[MaterialImpact] = []
@@ -203,16 +200,34 @@ def _parse_material_impacts(
     return impacts
 
 
-def _extract_json_block(output: str, *, marker: str) -> str | None:
-    result = extract_fenced_block(output, marker)
-    if result is not None:
-        return result
+def _extract_impacts_object(output: str) -> dict | None:
+    """Return the ``{"impacts": ...}`` object from agent *output*.
+
+    A fenced block mentioning ``"impacts"`` wins.  Otherwise each
+    top-level ``{`` is decoded in place with ``raw_decode`` until an
+    object carrying an ``impacts`` key turns up, so prose braces around
+    the JSON cannot corrupt it and no candidate slice is copied.
+    """
+    if _IMPACTS_MARKER not in output:
+        return None
+    fenced = extract_fenced_block(output, _IMPACTS_MARKER)
+    if fenced is not None:
+        try:
+            data = json.loads(fenced)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
+
     start = output.find("{")
-    end = output.rfind("}")
-    if start >= 0 and end > start:
-        candidate = output[start:end + 1]
-        if marker in candidate:
-            return candidate
+    while start >= 0:
+        try:
+            data, end = _JSON_DECODER.raw_decode(output, start)
+        except json.JSONDecodeError:
+            start = output.find("{", start + 1)
+            continue
+        if "impacts" in data:
+            return data
+        start = output.find("{", end)
     return None
 
 
@@ -414,20 +429,9 @@ class ImpactAnalyzer:
 
         self._logger.log(f"Section {section_number}: running impact analysis")
         cfg = self._config
-        subprocess.run(  # noqa: S603
-            [
-                "bash",
-                str(cfg.db_sh),
-                "log",
-                str(planspace / "run.db"),
-                "summary",
-                f"glm-explore:{section_number}",
-                "impact analysis",
-                "--agent",
-                cfg.agent_name,
-            ],
-            capture_output=True,
-            text=True,
+        DatabaseClient.for_planspace(planspace, cfg.db_sh).log_event(
+            "summary", f"glm-explore:{section_number}", "impact analysis",
+            agent=cfg.agent_name, check=False,
         )
 
         impact_result = self._dispatcher.dispatch(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,10 +20,16 @@ if TYPE_CHECKING:
 
 _TODO_CONTEXT_BEFORE = 3
 _TODO_CONTEXT_AFTER = 4
-# Match TODO/FIXME/HACK/XXX only when they appear as uppercase markers —
-# either after a comment delimiter (#, //, /*, --, <!--, %) or at a word
-# boundary.  This avoids false positives like "status: todo" in prose.
-_TODO_MARKER_RE = re.compile(r"(?:#|//|/\*|--|<!--|%|^)\s*\b(TODO|FIXME|HACK|XXX)\b|\b(TODO|FIXME|HACK|XXX)\b")
+# Match TODO/FIXME/HACK/XXX only when they appear as uppercase markers at
+# a word boundary, which covers markers after any comment delimiter (#,
+# //, /*, --, <!--, %).  This avoids false positives like "status: todo"
+# in prose, and a single alternation needs no per-line strip.
+_TODO_MARKER_RE = re.compile(rb"\b(?:TODO|FIXME|HACK|XXX)\b")
+# Every match contains one of these literals, so a file without any of
+# them is skipped before it is decoded or split into lines.
+_TODO_MARKER_BYTES = (b"TODO", b"FIXME", b"HACK", b"XXX")
+_PARALLEL_TODO_SCAN_MIN_FILES = 8
+_MAX_TODO_SCAN_WORKERS = 8
 
 
 def _list_proposal_signals(signals_dir: Path, section: str) -> list[Path]:
@@ -39,36 +47,65 @@ def extract_todos_from_files(
     Returns a markdown document with each TODO and its surrounding
     context (+-3 lines), grouped by file. Empty string if no TODOs found.
     """
-    parts: list[str] = []
-    for rel_path in related_files:
-        full_path = codespace / rel_path
-        if not full_path.exists():
-            continue
-        try:
-            lines = full_path.read_text(encoding="utf-8").splitlines()
-        except (OSError, UnicodeDecodeError):
-            continue
-        file_todos: list[str] = []
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if _TODO_MARKER_RE.search(stripped):
-                start = max(0, i - _TODO_CONTEXT_BEFORE)
-                end = min(len(lines), i + _TODO_CONTEXT_AFTER)
-                context = "\n".join(
-                    f"  {j + 1}: {lines[j]}" for j in range(start, end)
-                )
-                file_todos.append(
-                    f"**Line {i + 1}**: `{stripped}`\n\n"
-                    f"```\n{context}\n```\n"
-                )
-        if file_todos:
-            parts.append(f"### {rel_path}\n\n" + "\n".join(file_todos))
+    # Files are scanned independently; once there are enough of them the
+    # reads overlap on a pool, and map() keeps the output in input order.
+    root = os.fspath(codespace)
+    if len(related_files) < _PARALLEL_TODO_SCAN_MIN_FILES:
+        scanned = [_scan_file_todos(root, rel) for rel in related_files]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=_MAX_TODO_SCAN_WORKERS,
+            thread_name_prefix="todo-scan",
+        ) as pool:
+            scanned = list(pool.map(
+                lambda rel: _scan_file_todos(root, rel), related_files,
+            ))
+    parts = [part for part in scanned if part is not None]
 
     if not parts:
         return ""
     return "# TODO Blocks (In-Code Microstrategies)\n\n" + "\n".join(parts)
 
 
+def _scan_file_todos(root: str, rel_path: str) -> str | None:
+    """Return the markdown TODO block for one file, or None if it has none."""
+    try:
+        # Plain string joins; no Path is built per related file.
+        with open(os.path.join(root, rel_path), "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    if not any(marker in raw for marker in _TODO_MARKER_BYTES):
+        return None
+    # Lines are matched as bytes and only the context around a hit is
+    # decoded, so other encodings degrade to replacement characters
+    # instead of hiding the file's TODOs.
+    lines = raw.splitlines()
+    decoded: dict[int, str] = {}
+
+    def _line(j: int) -> str:
+        text = decoded.get(j)
+        if text is None:
+            text = decoded[j] = lines[j].decode("utf-8", errors="replace")
+        return text
+
+    file_todos: list[str] = []
+    for i, line in enumerate(lines):
+        if _TODO_MARKER_RE.search(line):
+            start = max(0, i - _TODO_CONTEXT_BEFORE)
+            end = min(len(lines), i + _TODO_CONTEXT_AFTER)
+            context = "\n".join(
+                f"  {j + 1}: {_line(j)}" for j in range(start, end)
+            )
+            file_todos.append(
+                f"**Line {i + 1}**: `{_line(i).strip()}`\n\n"
+                f"```\n{context}\n```\n"
+            )
+    if not file_todos:
+        return None
+    return f"### {rel_path}\n\n" + "\n".join(file_todos)
+
+
 def _gather_complexity_signals(
     planspace: Path, section_number: str,
     artifact_io: ArtifactIOService,
@@ -7,6 +7,7 @@ from orchestrator.path_registry import PathRegistry
 from pipeline.template import TASK_SUBMISSION_SEMANTICS
 from dispatch.prompt.prompt_formatters import PromptFormatters
 from implementation.service.microstrategy_decider import MicrostrategyDecider
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
 from orchestrator.types import ControlSignal
 from signals.types import BLOCKING_NEED_DECISION
@@ -244,16 +245,15 @@ class MicrostrategyGenerator:
                 model=self._policies.resolve(policy, "microstrategy_decider"),
                 escalation_model=self._policies.resolve(policy, "escalation_model"),
             )
-            and not microstrategy_path.exists()
         )
-        if not needs_microstrategy and not microstrategy_path.exists():
+        if microstrategy_path.exists():
+            return microstrategy_path
+        if not needs_microstrategy:
             self._logger.log(
                 f"Section {section.number}: microstrategy decider did not "
                 f"request microstrategy — skipping"
             )
             return None
-        if not needs_microstrategy:
-            return microstrategy_path if microstrategy_path.exists() else None
 
         self._logger.log(f"Section {section.number}: generating microstrategy")
         agent_name = f"microstrategy-{section.number}"
@@ -272,7 +272,7 @@ class MicrostrategyGenerator:
                 f"template violations: {violations}"
             )
             return None
-        micro_prompt_path.write_text(rendered, encoding="utf-8")
+        write_prompt_if_changed(micro_prompt_path, rendered)
         self._communicator.log_artifact(planspace, f"prompt:microstrategy-{section.number}")
 
         sentinel = self._dispatch_and_retry(
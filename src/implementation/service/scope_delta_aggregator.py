@@ -15,6 +15,7 @@ from implementation.service.scope_delta_parser import (
     parse_scope_delta_adjudication,
 )
 from reconciliation.service.detectors import consolidate_new_section_candidates
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
 from signals.types import TRUNCATE_REASON
 
@@ -29,6 +30,8 @@ if TYPE_CHECKING:
         TaskRouterService,
     )
 
+_SECTION_SPEC_NAME_RE = re.compile(r"section-(\d+)\.md")
+
 
 class ScopeDeltaAggregationExit(Exception):
     """Raised when scope-delta adjudication must fail closed."""
@@ -167,10 +170,10 @@ class ScopeDeltaAggregator:
         self._logger.log("  coordinator: scope-delta adjudication parse "
             "failed — retrying with escalation model")
         retry_prompt = adjudication_prompt.with_name("scope-delta-prompt-retry.md")
-        retry_prompt.write_text(
+        write_prompt_if_changed(
+            retry_prompt,
             adjudication_prompt.read_text(encoding="utf-8")
             + "\n\nOutput ONLY the JSON object, no prose.\n",
-            encoding="utf-8",
         )
         retry_output = adjudication_output.with_name("scope-delta-output-retry.md")
         retry_result = self._dispatcher.dispatch(
@@ -320,7 +323,7 @@ class ScopeDeltaAggregator:
         existing = sorted(sections_dir.glob("section-*.md"))
         max_num = 0
         for p in existing:
-            m = re.match(r"^section-(\d+)\.md$", p.name)
+            m = _SECTION_SPEC_NAME_RE.fullmatch(p.name)
             if m:
                 max_num = max(max_num, int(m.group(1)))
         return f"{max_num + 1:02d}"
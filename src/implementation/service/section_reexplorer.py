@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,6 +9,7 @@ from orchestrator.path_registry import PathRegistry
 from orchestrator.repository.decisions import list_section_decisions_md
 from pipeline.template import TASK_SUBMISSION_SEMANTICS
 from orchestrator.types import Section
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
 
 if TYPE_CHECKING:
@@ -154,14 +156,18 @@ def write_alignment_surface(
     sec = section.number
     surface_path = registry.alignment_surface(sec)
 
-    lines = [
-        f"# Alignment Surface: Section {sec}\n",
-        "Authoritative inputs for alignment judgement:\n",
-    ]
+    # Each line is encoded once into one buffer and written in one call,
+    # with no joined str to encode again on write.
+    buf = io.BytesIO()
+    buf.write(
+        f"# Alignment Surface: Section {sec}\n\n"
+        "Authoritative inputs for alignment judgement:\n\n".encode("utf-8"),
+    )
     for label, path in _collect_surface_entries(registry, sec):
-        lines.append(f"- **{label}**: `{path}`")
-    lines.append("")  # trailing newline
-    surface_path.write_text("\n".join(lines), encoding="utf-8")
+        buf.write(f"- **{label}**: `{path}`\n".encode("utf-8"))
+    # Re-running with the same artifacts leaves the surface (and its
+    # mtime) untouched instead of rewriting identical bytes.
+    write_prompt_if_changed(surface_path, buf.getvalue())
 
 
 class SectionReexplorer:
@@ -233,7 +239,7 @@ class SectionReexplorer:
                 f"violations: {violations}"
             )
             return None
-        prompt_path.write_text(rendered, encoding="utf-8")
+        write_prompt_if_changed(prompt_path, rendered)
         self._communicator.log_artifact(planspace, f"prompt:reexplore-{section.number}")
 
         result = self._dispatcher.dispatch(
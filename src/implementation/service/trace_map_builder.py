@@ -20,6 +20,8 @@ if TYPE_CHECKING:
         LogService,
     )
 
+_TODO_REF_RE = re.compile(r"TODO\[([^\]]+)\]")
+
 
 def _extract_problems(paths: PathRegistry, section_number: str) -> list[str]:
     """Extract problem statements from the section's problem frame."""
@@ -45,7 +47,7 @@ def _extract_todo_ids(
             continue
         try:
             content = full_path.read_text(encoding="utf-8")
-            for match in re.finditer(r"TODO\[([^\]]+)\]", content):
+            for match in _TODO_REF_RE.finditer(content):
                 todo_ids.append(
                     {"id": match.group(1), "file": relative_path}
                 )
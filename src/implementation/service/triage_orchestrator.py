@@ -23,6 +23,8 @@ if TYPE_CHECKING:
         TaskRouterService,
     )
 
+_NOTE_ID_RE = re.compile(r"\*\*Note ID\*\*:\s*`([^`]+)`")
+
 
 # ---------------------------------------------------------------------------
 # Pure helpers (no Services usage)
@@ -165,7 +167,7 @@ class TriageOrchestrator:
 
         # Validate that every incoming note was acknowledged.
         incoming_note_ids = set(
-            re.findall(r"\*\*Note ID\*\*:\s*`([^`]+)`", incoming_notes),
+            _NOTE_ID_RE.findall(incoming_notes),
         )
         acked_ids = {ack.get("note_id") for ack in triage_acks} | existing_ids
         if incoming_note_ids and not incoming_note_ids.issubset(acked_ids):
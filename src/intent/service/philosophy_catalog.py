@@ -37,6 +37,8 @@ def walk_md_bounded(
     if not root.is_dir():
         return
     root_s = str(root)
+    # str.endswith takes the whole tuple in one call per file name
+    suffixes = tuple(extensions)
     for dirpath, dirnames, filenames in os.walk(root_s):
         rel = os.path.relpath(dirpath, root_s)
         depth = 0 if rel == "." else rel.count(os.sep) + 1
@@ -55,7 +57,7 @@ def walk_md_bounded(
                 continue
 
         for fname in sorted(filenames):
-            if any(fname.endswith(ext) for ext in extensions):
+            if fname.endswith(suffixes):
                 yield Path(dirpath) / fname
 
 
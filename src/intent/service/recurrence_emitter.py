@@ -34,7 +34,8 @@ class RecurrenceEmitter:
             "escalate_to_coordinator": True,
         }
         recurrence_path = PathRegistry(planspace).recurrence_signal(section_number)
-        self._artifact_io.write_json(recurrence_path, recurrence_signal)
+        # Only the coordinator's problem resolver parses this signal
+        self._artifact_io.write_json(recurrence_path, recurrence_signal, indent=None)
         self._logger.log(
             f"Section {section_number}: recurrence signal written "
             f"(attempt {solve_count})"
@@ -18,7 +18,7 @@ from implementation.service.microstrategy_generator import MicrostrategyGenerato
 from pipeline.context import DispatchContext
 from proposal.service.readiness_resolver import ReadinessResolver
 from implementation.engine.implementation_cycle import ImplementationCycle
-from dispatch.service.tool_surface_writer import ToolSurfaceWriter
+from dispatch.service.tool_surface_writer import ToolSurfaceWriter, load_registry_tools
 from dispatch.service.tool_validator import ToolValidator
 from dispatch.service.tool_bridge import ToolBridge
 
@@ -199,13 +199,11 @@ class SectionPipeline:
 
     def _count_pre_impl_tools(self, paths: PathRegistry) -> int:
         """Read tool registry and return the tool count."""
-        tool_registry_path = paths.tool_registry()
-        registry = self._artifact_io.read_json(tool_registry_path)
-        if registry is None:
+        try:
+            loaded = load_registry_tools(self._artifact_io, paths.tool_registry())
+        except FileNotFoundError:
             return 0
-        all_tools = (registry if isinstance(registry, list)
-                     else registry.get("tools", []))
-        return len(all_tools)
+        return len(loaded[0]) if loaded is not None else 0
 
     def _run_implementation_pass(
         self,
@@ -11,13 +11,27 @@ requires only the decorator — no manual list maintenance.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 
 def _artifact_dir(fn):
-    """Mark a method as an artifact directory to be created at startup."""
-    fn._is_artifact_dir = True
-    return fn
+    """Mark a method as an artifact directory to be created at startup.
+
+    The directory path is built once per registry and reused, so file
+    accessors under it pay for a single join.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def accessor(self: PathRegistry) -> Path:
+        path = self._dirs.get(name)
+        if path is None:
+            path = self._dirs[name] = fn(self)
+        return path
+
+    accessor._is_artifact_dir = True
+    return accessor
 
 
 class PathRegistry:
@@ -26,6 +40,7 @@ class PathRegistry:
     def __init__(self, planspace: Path) -> None:
         self._planspace = planspace
         self._artifacts = planspace / "artifacts"
+        self._dirs: dict[str, Path] = {}
 
     @property
     def planspace(self) -> Path:
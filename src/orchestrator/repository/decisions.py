@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -36,8 +37,19 @@ class Decision:
 
 
 def list_section_decisions_md(decisions_dir: Path, section: str) -> list[Path]:
-    """Sorted decision markdown files for *section*."""
-    return sorted(decisions_dir.glob(f"section-{section}*.md")) if decisions_dir.is_dir() else []
+    """Sorted decision markdown files for *section* (``section-{section}*.md``)."""
+    prefix = f"section-{section}"
+    min_len = len(prefix) + len(".md")
+    try:
+        with os.scandir(decisions_dir) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if len(entry.name) >= min_len
+                and entry.name.startswith(prefix)
+                and entry.name.endswith(".md")
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def list_all_decisions_md(decisions_dir: Path) -> list[Path]:
@@ -12,9 +12,10 @@ from signals.service.database_client import DatabaseClient
 from signals.service.mailbox_service import MailboxService
 from orchestrator.types import ControlSignal, PipelineAbortError
 
-_PAUSE_POLL_TIMEOUT_SECONDS = 5
-_DB_BODY_COLUMN_INDEX = 4
-_DB_MIN_COLUMNS = 5
+# A long pause re-checks pipeline state at a backed-off cadence; any
+# mailbox message resets it, so control signals stay prompt.
+_PAUSE_POLL_INITIAL_SECONDS = 1
+_PAUSE_POLL_MAX_SECONDS = 30
 _PIPELINE_STATE_PAUSED = "paused"
 
 
@@ -70,16 +71,19 @@ class PipelineState:
         log("Pipeline paused — waiting for resume")
         mailbox.send(parent, "status:paused")
         buffered: list[str] = []
+        poll_timeout = _PAUSE_POLL_INITIAL_SECONDS
         while check_pipeline_state(planspace, db_sh=db_sh) == _PIPELINE_STATE_PAUSED:
-            msg = mailbox.recv(timeout=_PAUSE_POLL_TIMEOUT_SECONDS)
+            msg = mailbox.recv(timeout=poll_timeout)
             if msg == "TIMEOUT":
+                poll_timeout = min(poll_timeout * 2, _PAUSE_POLL_MAX_SECONDS)
                 continue
+            poll_timeout = _PAUSE_POLL_INITIAL_SECONDS
             result = self._handle_control_msg(msg, mailbox, planspace)
             if result is None:
                 continue
             buffered.append(result)
-        for msg in buffered:
-            mailbox.send(agent_name, msg)
+        if buffered:
+            mailbox.send_many(agent_name, buffered)
         log("Pipeline resumed")
         mailbox.send(parent, "status:resumed")
 
@@ -112,14 +116,7 @@ class PipelineState:
 
 def check_pipeline_state(planspace: Path, *, db_sh: Path) -> str:
     """Return the latest pipeline-state lifecycle value."""
-    line = DatabaseClient.for_planspace(planspace, db_sh).query(
-        "lifecycle",
-        tag="pipeline-state",
-        limit=1,
-        check=False,
-    ).strip()
-    if line:
-        parts = line.split("|")
-        if len(parts) >= _DB_MIN_COLUMNS and parts[_DB_BODY_COLUMN_INDEX]:
-            return parts[_DB_BODY_COLUMN_INDEX]
-    return "running"
+    state = DatabaseClient.for_planspace(planspace, db_sh).latest_event_body(
+        "lifecycle", "pipeline-state",
+    )
+    return state or "running"
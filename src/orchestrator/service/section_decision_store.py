@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from orchestrator.path_registry import PathRegistry
 from signals.types import TRUNCATE_DETAIL
+from staleness.helpers.stat_cache import is_settled
 
 if TYPE_CHECKING:
     from orchestrator.types import Section
@@ -21,14 +22,36 @@ def read_decisions(planspace: Path, section_number: str) -> str:
     return ""
 
 
+_FRONTMATTER_SUMMARY_RE = re.compile(
+    r"^---\s*\n.*?^summary:\s*(.+?)$.*?^---",
+    re.MULTILINE | re.DOTALL,
+)
+
+# path -> (st_size, st_mtime_ns, summary)
+_SUMMARY_CACHE: dict[str, tuple[int, int, str]] = {}
+
+
 def extract_section_summary(section_path: Path) -> str:
-    """Extract summary from YAML frontmatter of a section file."""
-    text = section_path.read_text(encoding="utf-8")
-    match = re.search(
-        r"^---\s*\n.*?^summary:\s*(.+?)$.*?^---",
-        text,
-        re.MULTILINE | re.DOTALL,
-    )
+    """Extract summary from YAML frontmatter of a section file.
+
+    Results are cached per path and reused while the file's size and
+    mtime are unchanged, so repeated prompt builds do not re-read and
+    re-scan every section spec.
+    """
+    st = section_path.stat()
+    key = str(section_path)
+    cached = _SUMMARY_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return cached[2]
+    summary = _parse_section_summary(section_path.read_text(encoding="utf-8"))
+    if is_settled(st.st_mtime_ns):
+        _SUMMARY_CACHE[key] = (st.st_size, st.st_mtime_ns, summary)
+    return summary
+
+
+def _parse_section_summary(text: str) -> str:
+    """Return the frontmatter summary, else the first content line."""
+    match = _FRONTMATTER_SUMMARY_RE.search(text)
     if match:
         return match.group(1).strip()
     for line in text.split("\n"):
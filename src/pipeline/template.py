@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 SYSTEM_CONSTRAINTS = """\
@@ -66,10 +67,19 @@ SRC_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
 DEFAULT_TEMPLATE_DIR = SRC_TEMPLATE_DIR
 
 
+@lru_cache(maxsize=None)
+def _read_template(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
 def load_template(name: str, template_dir: Path | None = None) -> str:
-    """Load a markdown template from the templates directory."""
+    """Load a markdown template from the templates directory.
+
+    Templates ship with the skill and do not change during a run, so each
+    file is read once per process.
+    """
     root = template_dir or DEFAULT_TEMPLATE_DIR
-    return (root / name).read_text(encoding="utf-8")
+    return _read_template(root / name)
 
 
 def render(template_text: str, context: dict) -> str:
@@ -70,8 +70,6 @@ class CycleControl:
         "proposal") and is used in the delta ID.
         """
         paths = PathRegistry(planspace)
-        scope_delta_dir = paths.scope_deltas_dir()
-        scope_delta_dir.mkdir(parents=True, exist_ok=True)
         signal_payload = self._artifact_io.read_json_or_default(signal_path, {})
         scope_delta = {
             "delta_id": f"delta-{section_number}-{origin}-oos",
@@ -98,9 +96,12 @@ class CycleControl:
         Returns ``ACTION_ABORT`` if the parent rejected or alignment changed,
         ``ACTION_CONTINUE`` otherwise.  Persists any payload decision.
         """
-        if not response.startswith(RESUME_PREFIX):
+        # One split yields both the command and its payload; the command
+        # must match exactly so replies like "resumed" are not a resume.
+        command, _, payload = response.partition(":")
+        if command != RESUME_PREFIX:
             return ACTION_ABORT
-        payload = response.partition(":")[2].strip()
+        payload = payload.strip()
         if payload:
             self._cross_section.persist_decision(planspace, section_number, payload)
         if self._pipeline_control.alignment_changed_pending(planspace):
@@ -202,6 +203,28 @@ class CycleControl:
         if not signal:
             return None
 
+        return self.handle_parent_signal(
+            planspace, section_number, signal, detail,
+            signal_path=paths.proposal_signal(section_number),
+            origin="proposal",
+        )
+
+    def handle_parent_signal(
+        self,
+        planspace: Path,
+        section_number: str,
+        signal: str,
+        detail: str,
+        *,
+        signal_path: Path,
+        origin: str,
+    ) -> str:
+        """Surface an agent signal upward and pause for the parent.
+
+        Records open problems and, for out-of-scope signals, the scope
+        delta, then refreshes the blocker rollup before pausing.  Returns
+        the action from ``handle_pause_response``.
+        """
         if signal in (SIGNAL_NEED_DECISION, SIGNAL_OUT_OF_SCOPE):
             append_open_problem(planspace, section_number, detail, signal)
             self._communicator.log_summary(
@@ -210,8 +233,7 @@ class CycleControl:
             )
         if signal == SIGNAL_OUT_OF_SCOPE:
             self.write_scope_delta(
-                planspace, paths.proposal_signal(section_number),
-                section_number, detail, "proposal",
+                planspace, signal_path, section_number, detail, origin,
             )
         update_blocker_rollup(planspace)
         response = self._pipeline_control.pause_for_parent(
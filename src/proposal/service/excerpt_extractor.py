@@ -18,12 +18,8 @@ if TYPE_CHECKING:
 
 from proposal.repository.excerpts import EXCERPT_PROPOSAL, exists as excerpt_exists
 from orchestrator.path_registry import PathRegistry
-from signals.service.blocker_manager import (
-    append_open_problem,
-    update_blocker_rollup,
-)
 from dispatch.types import ALIGNMENT_CHANGED_PENDING
-from signals.types import ACTION_ABORT, SIGNAL_NEED_DECISION, SIGNAL_OUT_OF_SCOPE, TRUNCATE_DETAIL
+from signals.types import ACTION_ABORT
 
 
 class ExcerptExtractor:
@@ -49,28 +45,6 @@ class ExcerptExtractor:
         self._cycle_control = cycle_control
         self._prompt_writers = prompt_writers
 
-    def _handle_setup_signal(
-        self,
-        signal: str, detail: str, planspace: Path,
-        section_number: str,
-    ) -> str | None:
-        """Handle a setup agent signal. Returns 'abort' or 'continue'."""
-        if signal in (SIGNAL_NEED_DECISION, SIGNAL_OUT_OF_SCOPE):
-            append_open_problem(planspace, section_number, detail, signal)
-            self._communicator.log_summary(
-                planspace,
-                f"open-problem:{section_number}:{signal}:{detail[:TRUNCATE_DETAIL]}",
-            )
-        if signal == SIGNAL_OUT_OF_SCOPE:
-            sig_path = PathRegistry(planspace).signals_dir() / f"setup-{section_number}-signal.json"
-            self._cycle_control.write_scope_delta(planspace, sig_path, section_number, detail, "setup")
-        update_blocker_rollup(planspace)
-        response = self._pipeline_control.pause_for_parent(
-            planspace,
-            f"pause:{signal}:{section_number}:{detail}",
-        )
-        return self._cycle_control.handle_pause_response(planspace, section_number, response)
-
     def extract_excerpts(
         self,
         section,
@@ -80,7 +54,7 @@ class ExcerptExtractor:
         """Run the setup loop until both proposal and alignment excerpts exist."""
         policy = self._policies.load(planspace)
         paths = PathRegistry(planspace)
-        signal_dir = paths.signals_dir()
+        setup_signal = paths.setup_signal(section.number)
 
         while (
             not excerpt_exists(planspace, section.number, EXCERPT_PROPOSAL)
@@ -108,12 +82,13 @@ class ExcerptExtractor:
             )
 
             signal, detail = self._dispatch_helpers.check_agent_signals(
-                signal_path=signal_dir / f"setup-{section.number}-signal.json",
+                signal_path=setup_signal,
             )
             if signal:
-                result = self._handle_setup_signal(
-                    signal, detail, planspace,
-                    section.number,
+                result = self._cycle_control.handle_parent_signal(
+                    planspace, section.number, signal, detail,
+                    signal_path=setup_signal,
+                    origin="setup",
                 )
                 if result == ACTION_ABORT:
                     return None
@@ -225,5 +225,4 @@ class ProblemFrameGate:
             write_alignment_surface(planspace, section)
 
     def _write_problem_frame_signal(self, signal_path: Path, payload: dict) -> None:
-        signal_path.parent.mkdir(parents=True, exist_ok=True)
         self._artifact_io.write_json(signal_path, payload)
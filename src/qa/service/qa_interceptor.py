@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from orchestrator.path_registry import PathRegistry
 from qa.helpers.qa_verdict import parse_qa_verdict
 
@@ -260,7 +261,7 @@ class QaInterceptor:
 
             intercepts_dir = PathRegistry(planspace).qa_intercepts_dir()
             prompt_path = intercepts_dir / f"qa-{task_id}-prompt.md"
-            prompt_path.write_text(qa_prompt_text, encoding="utf-8")
+            write_prompt_if_changed(prompt_path, qa_prompt_text)
 
             safety_violations = self._prompt_guard.validate_dynamic(payload_content)
             if safety_violations:
@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from orchestrator.path_registry import PathRegistry
 from pipeline.template import render_template
 
@@ -99,9 +100,9 @@ class Adjudicator:
             )
             return []
 
-        prompt_path.write_text(
+        write_prompt_if_changed(
+            prompt_path,
             render_template("reconciliation-adjudicate", dynamic_body),
-            encoding="utf-8",
         )
 
         policy = self._policies.load(planspace)
@@ -16,28 +16,24 @@ def compute_codespace_fingerprint(codespace: Path) -> str:
     the verifier for heuristic freshness checks instead of brute-force
     full-tree traversal.
     """
-    # Check if codespace is inside a git repo
-    is_git = (codespace / ".git").is_dir()
-    if not is_git:
-        try:
-            subprocess.run(
-                ["git", "-C", str(codespace), "rev-parse", "--git-dir"],
-                capture_output=True, check=True,
-            )
-            is_git = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-    if not is_git:
+    # One ``rev-parse`` both detects the repo (git-dir on the first line)
+    # and resolves HEAD, instead of spawning git separately for each.
+    try:
+        probe = subprocess.run(
+            ["git", "-C", str(codespace), "rev-parse", "--git-dir", "HEAD"],
+            capture_output=True, text=True, check=False,
+        )
+        probe_lines = probe.stdout.splitlines()
+    except FileNotFoundError:
+        probe, probe_lines = None, []
+
+    if not probe_lines and not (codespace / ".git").is_dir():
         return NON_GIT_SENTINEL
 
     # git HEAD
-    try:
-        head = subprocess.run(
-            ["git", "-C", str(codespace), "rev-parse", "HEAD"],
-            capture_output=True, text=True, check=True,
-        ).stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if probe is not None and probe.returncode == 0 and len(probe_lines) > 1:
+        head = probe_lines[1].strip()
+    else:
         head = "no-head"
 
     # git diff --stat HEAD (last line = summary)
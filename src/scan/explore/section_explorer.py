@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,6 +24,43 @@ from scan.scan_dispatcher import dispatch_agent, read_scan_model_policy
 if TYPE_CHECKING:
     from containers import PromptGuard, TaskRouterService
 
+_MAX_PARALLEL_EXPLORE_WORKERS = 4
+_EXPLORE_STDERR_LOG = "explore.stderr.jsonl"
+_EXPLORE_FILE_NOTES_DIR = "explore-file-notes"
+
+# Explore workers share one stderr log; serialize appends so records
+# from concurrent sections never interleave.
+_stderr_log_lock = threading.Lock()
+
+
+def _has_related_files_marker(section_file: Path) -> bool:
+    """Return whether the spec mentions a ``## Related Files`` block.
+
+    Memory-maps the file so the search is a single C-level scan with no
+    decode or per-line allocation.
+    """
+    with section_file.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b"## Related Files") != -1
+
+
+def _append_explore_stderr(
+    scan_log_dir: Path, section_name: str, stderr: str,
+) -> None:
+    """Append one section's agent stderr to the shared JSONL log."""
+    if not stderr:
+        return
+    record = json.dumps(
+        {"section": section_name, "stream": "stderr", "data": stderr},
+        separators=(",", ":"),
+    )
+    with _stderr_log_lock, (scan_log_dir / _EXPLORE_STDERR_LOG).open(
+        "a", encoding="utf-8",
+    ) as f:
+        f.write(record + "\n")
+
 
 class SectionExplorer:
     """Section exploration dispatching.
@@ -58,31 +100,73 @@ class SectionExplorer:
             model_policy=model_policy,
         )
 
-        for section_file in section_files:
-            section_name = section_file.stem  # e.g. "section-01"
-
-            # If section already has Related Files, run validation pass
-            section_text = section_file.read_text()
-            if "## Related Files" in section_text:
-                if self._related_file_resolver is not None:
-                    self._related_file_resolver.validate_existing_related_files(
-                        section_file=section_file,
-                        section_name=section_name,
-                        ctx=ctx,
-                        artifacts_dir=artifacts_dir,
-                    )
-                continue
-
-            # Fresh exploration
-            self._explore_section(
-                section_file=section_file,
-                section_name=section_name,
-                codemap_path=codemap_path,
-                codespace=codespace,
-                artifacts_dir=artifacts_dir,
-                scan_log_dir=scan_log_dir,
-                model_policy=model_policy,
-            )
+        # Longest jobs first (LPT) so a slow section submitted last cannot
+        # extend the makespan: fresh explorations before validations (which
+        # often hit the hash cache), larger specs before smaller ones.
+        jobs = sorted(
+            (
+                (_has_related_files_marker(section_file), section_file)
+                for section_file in section_files
+            ),
+            key=lambda job: (job[0], -job[1].stat().st_size),
+        )
+
+        # Each section's exploration touches only its own spec and log
+        # directory, so the (long-running) agent dispatches can overlap.
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_EXPLORE_WORKERS) as pool:
+            futures = [
+                pool.submit(
+                    self._process_section_file,
+                    section_file=section_file,
+                    has_related_files=has_related_files,
+                    ctx=ctx,
+                    codemap_path=codemap_path,
+                    codespace=codespace,
+                    artifacts_dir=artifacts_dir,
+                    scan_log_dir=scan_log_dir,
+                    model_policy=model_policy,
+                )
+                for has_related_files, section_file in jobs
+            ]
+            for future in futures:
+                future.result()
+
+    def _process_section_file(
+        self,
+        *,
+        section_file: Path,
+        has_related_files: bool,
+        ctx: ScanContext,
+        codemap_path: Path,
+        codespace: Path,
+        artifacts_dir: Path,
+        scan_log_dir: Path,
+        model_policy: dict[str, str],
+    ) -> None:
+        """Validate existing related files, or explore a fresh section."""
+        section_name = section_file.stem  # e.g. "section-01"
+
+        # If section already has Related Files, run validation pass
+        if has_related_files:
+            if self._related_file_resolver is not None:
+                self._related_file_resolver.validate_existing_related_files(
+                    section_file=section_file,
+                    section_name=section_name,
+                    ctx=ctx,
+                    artifacts_dir=artifacts_dir,
+                )
+            return
+
+        # Fresh exploration
+        self._explore_section(
+            section_file=section_file,
+            section_name=section_name,
+            codemap_path=codemap_path,
+            codespace=codespace,
+            artifacts_dir=artifacts_dir,
+            scan_log_dir=scan_log_dir,
+            model_policy=model_policy,
+        )
 
     # ------------------------------------------------------------------
     # Fresh exploration path
@@ -104,14 +188,18 @@ class SectionExplorer:
         section_log.mkdir(parents=True, exist_ok=True)
         prompt_file = section_log / "explore-prompt.md"
         response_file = section_log / "explore-response.md"
-        stderr_file = section_log / "explore.stderr.log"
 
         corrections_signal = PathRegistry(artifacts_dir.parent).corrections()
+        # Content-keyed notes shared across sections so a file read while
+        # exploring one section need not be re-read for the next.
+        file_notes_dir = scan_log_dir / _EXPLORE_FILE_NOTES_DIR
+        file_notes_dir.mkdir(parents=True, exist_ok=True)
 
         prompt = load_scan_template("explore_section.md").format(
             codemap_path=codemap_path,
             section_file=section_file,
             corrections_signal=corrections_signal,
+            file_notes_dir=file_notes_dir,
         )
         violations = self._prompt_guard.validate_dynamic(prompt)
         if violations:
@@ -130,16 +218,17 @@ class SectionExplorer:
             project=codespace,
             prompt_file=prompt_file,
             stdout_file=response_file,
-            stderr_file=stderr_file,
             concern_scope=section_name,
             submitted_by="scan.section_explore",
         )
+        _append_explore_stderr(scan_log_dir, section_name, result.stderr)
 
         if result.returncode != 0:
             log_phase_failure(
                 "quick-explore",
                 section_name,
-                f"exploration agent failed (see {stderr_file})",
+                "exploration agent failed "
+                f"(see {scan_log_dir / _EXPLORE_STDERR_LOG})",
                 scan_log_dir,
             )
             return
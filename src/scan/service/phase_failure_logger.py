@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Scan phases dispatch sections on worker threads; one lock keeps
+# concurrent failure lines whole in failures.log.
+_failure_log_lock = threading.Lock()
+
 
 def log_phase_failure(
     phase: str,
@@ -15,11 +20,10 @@ def log_phase_failure(
 ) -> None:
     """Append a structured failure line and emit the same failure to stderr."""
     failure_log = planspace / "failures.log"
+    message = f"phase={phase} context={section} message={error}"
+    # UTC needs no local tzdata lookup, so a burst of failures only pays
+    # for the clock read and isoformat.
     ts = datetime.now(tz=timezone.utc).isoformat()
-    line = f"{ts} phase={phase} context={section} message={error}\n"
-    with failure_log.open("a") as f:
-        f.write(line)
-    print(
-        f"[FAIL] phase={phase} context={section} message={error}",
-        file=sys.stderr,
-    )
+    with _failure_log_lock, failure_log.open("a") as f:
+        f.write(f"{ts} {message}\n")
+    print(f"[FAIL] {message}", file=sys.stderr)
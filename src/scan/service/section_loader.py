@@ -7,6 +7,8 @@ from pathlib import Path
 
 from orchestrator.types import Section
 
+_SECTION_FILE_RE = re.compile(r"^section-(\d+)\.md$")
+
 
 def parse_related_files(section_path: Path) -> list[str]:
     """Extract file paths from a section spec's related-files block."""
@@ -19,7 +21,7 @@ def load_sections(sections_dir: Path) -> list[Section]:
     """Load section specs and their related file maps."""
     sections: list[Section] = []
     for path in sorted(sections_dir.glob("section-*.md")):
-        match = re.match(r"^section-(\d+)\.md$", path.name)
+        match = _SECTION_FILE_RE.match(path.name)
         if not match:
             continue
         sections.append(
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 _SCAN_TEMPLATES = Path(__file__).resolve().parent.parent.parent / "templates" / "scan"
 
 
+@lru_cache(maxsize=None)
+def _read_template(path: Path) -> str:
+    return path.read_text()
+
+
 def load_scan_template(name: str) -> str:
-    """Load a scan prompt template by filename."""
-    return (_SCAN_TEMPLATES / name).read_text()
+    """Load a scan prompt template by filename (read once per process)."""
+    return _read_template(_SCAN_TEMPLATES / name)
@@ -21,11 +21,12 @@ def read_json(path: Path) -> dict | list | None:
     On parse failure, renames the file to .malformed.json (corruption
     preservation protocol) and logs a warning.
     """
-    if not path.exists():
-        return None
     try:
-        text = path.read_text(encoding="utf-8")
-        return json.loads(text)
+        # json.loads decodes UTF-8 bytes itself, so the text-mode
+        # wrapper and the separate exists() stat are both skipped.
+        return json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Malformed JSON at %s: %s", path, exc)
         rename_malformed(path)
@@ -44,11 +45,14 @@ def write_json(path: Path, data: object, *, indent: int = 2) -> None:
         data = asdict(data)
     elif isinstance(data, list) and data and is_dataclass(data[0]):
         data = [asdict(item) for item in data]
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(data, indent=indent) + "\n",
-        encoding="utf-8",
-    )
+    text = json.dumps(data, indent=indent) + "\n"
+    # Parents almost always exist already; create them only when the
+    # write fails instead of paying a mkdir on every artifact write.
+    try:
+        path.write_text(text, encoding="utf-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
 
 
 def rename_malformed(path: Path) -> Path | None:
@@ -70,9 +74,10 @@ def rename_malformed(path: Path) -> Path | None:
 
 def read_if_exists(path: Path) -> str:
     """Return file contents as a string, or empty string if the file does not exist."""
-    if path.exists():
+    try:
         return path.read_text(encoding="utf-8")
-    return ""
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
 
 
 def read_json_or_default(path: Path, default: object) -> dict | list:
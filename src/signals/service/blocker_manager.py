@@ -35,6 +35,7 @@ _SHARED_SEAM_PREFIX = (
     "shared seam candidate requires cross-section substrate work:"
 )
 _SEAM_HASH_LENGTH = 12
+_OPEN_PROBLEMS_HEADER = "## Open Problems\n"
 
 # Signal state → blocker category mapping (used in update_blocker_rollup)
 _STATE_TO_CATEGORY: dict[str, str] = {
@@ -73,15 +74,27 @@ def append_open_problem(
     content = sec_file.read_text(encoding="utf-8")
     entry = f"- **[{source}]** {problem}\n"
     if "## Open Problems" in content:
-        # Append to existing section
-        content = content.replace(
-            "## Open Problems\n",
-            f"## Open Problems\n{entry}",
-        )
+        # Splice the entry in right under the existing header
+        index = content.find(_OPEN_PROBLEMS_HEADER)
+        if index < 0:
+            return
+        cut = index + len(_OPEN_PROBLEMS_HEADER)
+        # A retry that surfaces the same problem leaves the file untouched
+        if entry in content[cut:]:
+            return
+        sec_file.write_text(content[:cut] + entry + content[cut:], encoding="utf-8")
+        return
+    # Add new section at the end; a file ending in at most one newline
+    # only needs the new section appended, not rewritten.
+    body = content.rstrip()
+    tail = content[len(body):]
+    if tail in ("", "\n"):
+        with sec_file.open("a", encoding="utf-8") as f:
+            f.write("\n\n"[len(tail):] + _OPEN_PROBLEMS_HEADER + entry)
     else:
-        # Add new section at the end
-        content = content.rstrip() + f"\n\n## Open Problems\n{entry}"
-    sec_file.write_text(content, encoding="utf-8")
+        sec_file.write_text(
+            body + "\n\n" + _OPEN_PROBLEMS_HEADER + entry, encoding="utf-8",
+        )
 
 
 def _collect_signal_blockers(signals_dir: Path) -> list[dict]:
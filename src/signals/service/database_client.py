@@ -1,8 +1,11 @@
 """DatabaseClient: thin wrapper around ``db.sh`` subprocess calls.
 
-Most operations delegate to ``db.sh`` via subprocess.  ``recv`` is
-implemented in pure Python to avoid the performance penalty of
-spawning a new ``python3`` interpreter on every 0.5 s poll iteration.
+Most operations delegate to ``db.sh`` via subprocess.  ``recv``, batched
+sends, event logging, and the latest-event lookup are implemented in
+pure Python:
+``recv`` to avoid spawning a new ``python3`` interpreter on every 0.5 s
+poll iteration, and the others because a single-row statement is
+dwarfed by the bash and ``python3`` start-up it would otherwise pay.
 """
 
 from __future__ import annotations
@@ -15,6 +18,10 @@ from pathlib import Path
 _POLL_INTERVAL = 0.5
 _SQLITE_TIMEOUT = 5.0
 _SQLITE_BUSY_TIMEOUT_MS = 5000
+_LATEST_EVENT_BODY_SQL = (
+    "SELECT body FROM events WHERE kind = ? AND tag = ? "
+    "ORDER BY id DESC LIMIT 1"
+)
 
 
 def _connect(db_path: Path) -> sqlite3.Connection:
@@ -25,6 +32,35 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+def _insert_event(
+    conn: sqlite3.Connection,
+    kind: str,
+    tag: str,
+    body: str,
+    agent: str,
+    *,
+    ts: str | None = None,
+) -> int:
+    """Insert one ``events`` row under a fresh shared id; return the id.
+
+    Without *ts* the column default stamps the row, as ``db.sh log`` does.
+    """
+    cur = conn.execute("INSERT INTO id_seq DEFAULT VALUES")
+    nid = cur.lastrowid
+    if ts is None:
+        conn.execute(
+            "INSERT INTO events(id, kind, tag, body, agent) VALUES(?, ?, ?, ?, ?)",
+            (nid, kind, tag, body, agent),
+        )
+    else:
+        conn.execute(
+            "INSERT INTO events(id, ts, kind, tag, body, agent) "
+            "VALUES(?, ?, ?, ?, ?, ?)",
+            (nid, ts, kind, tag, body, agent),
+        )
+    return nid
+
+
 class DatabaseClient:
     """Execute ``db.sh`` commands against a specific database path."""
 
@@ -53,6 +89,19 @@ class DatabaseClient:
             check=check,
         )
 
+    def run_quiet(self, command: str, *args: str) -> None:
+        """Run a fire-and-forget ``db.sh`` command, ignoring its result.
+
+        Output goes straight to ``/dev/null``, so no pipes are created,
+        drained, or decoded for a result nobody reads.
+        """
+        subprocess.run(  # noqa: S603
+            ["bash", str(self._db_sh), command, str(self._db_path), *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+
     def execute(self, command: str, *args: str, check: bool = True) -> str:
         """Run a ``db.sh`` command and return stripped stdout."""
         return self.run(command, *args, check=check).stdout.strip()
@@ -72,6 +121,32 @@ class DatabaseClient:
         args.append(message)
         return self.execute("send", *args, check=check)
 
+    def send_many(
+        self,
+        target: str,
+        messages: list[str],
+        *,
+        sender: str | None = None,
+    ) -> None:
+        """Send *messages* to *target* in order, in one transaction.
+
+        Mirrors ``db.sh send`` row for row, in-process like ``recv``, so
+        replaying a backlog pays for one commit instead of one
+        subprocess and commit per message.
+        """
+        conn = _connect(self._db_path)
+        try:
+            for message in messages:
+                nid = conn.execute("INSERT INTO id_seq DEFAULT VALUES").lastrowid
+                conn.execute(
+                    "INSERT INTO messages(id, sender, target, body) "
+                    "VALUES(?, ?, ?, ?)",
+                    (nid, sender or "", target, message),
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
     def recv(
         self,
         name: str,
@@ -200,16 +275,58 @@ class DatabaseClient:
         agent: str | None = None,
         check: bool = True,
     ) -> str:
-        """Record an event row."""
-        args = [kind]
-        if tag:
-            args.append(tag)
-            args.append(body)
-        elif body:
-            args.extend(["", body])
-        if agent:
-            args.extend(["--agent", agent])
-        return self.execute("log", *args, check=check)
+        """Record an event row.
+
+        Writes in-process with the same row, return value, and failure
+        behaviour as ``db.sh log``: ``check=False`` swallows database
+        errors and returns ``""``.
+        """
+        try:
+            conn = _connect(self._db_path)
+            try:
+                nid = _insert_event(conn, kind, tag, body, agent or "")
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            if check:
+                raise subprocess.CalledProcessError(
+                    1, ["db.sh", "log", str(self._db_path), kind],
+                    stderr=str(exc),
+                ) from exc
+            return ""
+        return f"logged:{nid}:{kind}:{tag}"
+
+    def log_events(self, events: list[tuple[str, str, str, str, str]]) -> None:
+        """Record ``(ts, kind, tag, body, agent)`` event rows in one transaction.
+
+        Mirrors ``db.sh log`` row for row, in-process like ``recv``, but
+        keeps each caller-supplied timestamp so deferred events still
+        carry the time they happened.
+        """
+        conn = _connect(self._db_path)
+        try:
+            for ts, kind, tag, body, agent in events:
+                _insert_event(conn, kind, tag, body, agent, ts=ts)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def latest_event_body(self, kind: str, tag: str) -> str | None:
+        """Return the body of the newest *kind*/*tag* event, if any.
+
+        Read in-process for pollers such as the pipeline-state check; a
+        database error reads as no event, like ``query(check=False)``.
+        """
+        try:
+            conn = _connect(self._db_path)
+            try:
+                row = conn.execute(_LATEST_EVENT_BODY_SQL, (kind, tag)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
 
     def query(
         self,
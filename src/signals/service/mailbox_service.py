@@ -12,6 +12,7 @@ from signals.types import MAILBOX_COMPLETE, TRUNCATE_SUMMARY
 if TYPE_CHECKING:
     from containers import LogService
 
+_DRAIN_SEPARATOR_RE = re.compile(r"\n---\n")
 _SUMMARY_PREFIXES = (
     "summary:",
     "done:",
@@ -67,6 +68,15 @@ class MailboxService:
     def send(self, target: str, message: str) -> None:
         """Send a message and emit summary events for monitored prefixes."""
         self._db.send(target, message, sender=self._agent_name)
+        self._record_sent(target, message)
+
+    def send_many(self, target: str, messages: list[str]) -> None:
+        """Send *messages* to *target* in order with a single database write."""
+        self._db.send_many(target, messages, sender=self._agent_name)
+        for message in messages:
+            self._record_sent(target, message)
+
+    def _record_sent(self, target: str, message: str) -> None:
         self._log(f"  mail → {target}: {message[:TRUNCATE_SUMMARY]}")
         for prefix in _SUMMARY_PREFIXES:
             if message.startswith(prefix):
@@ -93,7 +103,7 @@ class MailboxService:
         """Read all pending messages without blocking."""
         drained = self._db.drain(self._agent_name, check=False)
         messages: list[str] = []
-        for chunk in re.split(r"\n---\n", drained):
+        for chunk in _DRAIN_SEPARATOR_RE.split(drained):
             chunk = chunk.strip()
             if chunk:
                 messages.append(chunk)
@@ -105,8 +115,8 @@ class MailboxService:
 
     def cleanup(self) -> None:
         """Clean up and unregister the mailbox."""
-        self._db.cleanup(self._agent_name, check=False)
-        self._db.unregister(self._agent_name, check=False)
+        self._db.run_quiet("cleanup", self._agent_name)
+        self._db.run_quiet("unregister", self._agent_name)
 
     def _log(self, message: str) -> None:
         if self._logger is not None:
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import sqlite3
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +22,82 @@ if TYPE_CHECKING:
 
 AGENT_NAME = "section-loop"
 
+_ARTIFACT_LOG_FLUSH_AT = 64
+
+_LogKey = tuple[Path, Path]
+_LogEvent = tuple[str, str, str, str, str]
+
+
+class ArtifactLogBatch:
+    """Artifact lifecycle events deferred by one batching scope.
+
+    Each ``db.sh log`` call spawns bash and python3, so events are queued
+    per database with their own timestamps and written in one transaction
+    when the owning scope closes or a queue reaches
+    ``_ARTIFACT_LOG_FLUSH_AT`` events.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[_LogKey, list[_LogEvent]] = {}
+
+    def add(self, key: _LogKey, event: _LogEvent) -> None:
+        with self._lock:
+            queue = self._pending.setdefault(key, [])
+            queue.append(event)
+            if len(queue) < _ARTIFACT_LOG_FLUSH_AT:
+                return
+            del self._pending[key]
+        _write_events(key, queue)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for key, events in pending.items():
+            _write_events(key, events)
+
+
+def _write_events(key: _LogKey, events: list[_LogEvent]) -> None:
+    db_sh, db_path = key
+    try:
+        DatabaseClient(db_sh, db_path).log_events(events)
+    except sqlite3.Error as exc:
+        # Same fail-open contract as the unbatched check=False path.
+        print(f"[{AGENT_NAME}] artifact log flush failed: {exc}", file=sys.stderr)
+
+
+# Batching scopes are per thread, so a long-lived scope in one pipeline
+# never holds back another thread's events.
+_log_scope = threading.local()
+
+
+@contextmanager
+def batched_artifact_logs(
+    join: ArtifactLogBatch | None = None,
+) -> Iterator[ArtifactLogBatch]:
+    """Defer this thread's artifact lifecycle events until the scope exits.
+
+    Nested scopes on a thread share the outermost one's buffer, which is
+    flushed when that scope exits.  Worker threads do not inherit it;
+    they join by passing the yielded buffer as *join*, and their events
+    are written by the owning scope.
+    """
+    outer = getattr(_log_scope, "buffer", None)
+    buffer = join or outer or ArtifactLogBatch()
+    _log_scope.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _log_scope.buffer = outer
+        if join is None and outer is None:
+            buffer.flush()
+
+
+def _event_timestamp() -> str:
+    """UTC timestamp in the events table's ``strftime('%Y-%m-%dT%H:%M:%f')`` form."""
+    now = datetime.now(tz=timezone.utc)
+    return f"{now:%Y-%m-%dT%H:%M:%S}.{now.microsecond // 1000:03d}"
+
 
 class SectionCommunicator:
     """Communication helpers for section-loop with injected config."""
@@ -52,6 +134,15 @@ class SectionCommunicator:
 
     def log_artifact(self, planspace: Path, name: str) -> None:
         """Log an artifact lifecycle event to the database."""
+        key = (self._config.db_sh, PathRegistry(planspace).run_db())
+        event = (
+            _event_timestamp(), "lifecycle", f"artifact:{name}", "created",
+            self._config.agent_name,
+        )
+        buffer = getattr(_log_scope, "buffer", None)
+        if buffer is not None:
+            buffer.add(key, event)
+            return
         DatabaseClient.for_planspace(planspace, self._config.db_sh).log_event(
             "lifecycle",
             f"artifact:{name}",
@@ -86,6 +177,23 @@ def _record_traceability(
     detail: str = "",
 ) -> None:
     """Append a traceability entry to artifacts/traceability.json."""
+    _record_traceability_many(planspace, section, [artifact], source, detail)
+
+
+def _record_traceability_many(
+    planspace: Path,
+    section: str,
+    artifacts: list[str],
+    source: str,
+    detail: str = "",
+) -> None:
+    """Append one traceability entry per artifact in a single rewrite.
+
+    The index is read, and the proposal-state governance loaded, once for
+    the whole batch instead of once per artifact.
+    """
+    if not artifacts:
+        return
     from signals.repository.artifact_io import read_json, write_json
     from proposal.repository.state import State as ProposalStateRepo
     from containers import Services
@@ -106,15 +214,16 @@ def _record_traceability(
             "profile_id": ps.profile_id,
         }
 
-    entry: dict = {
-        "section": section,
-        "artifact": artifact,
-        "source": source,
-        "detail": detail,
-    }
-    if governance:
-        entry["governance"] = governance
-    entries.append(entry)
+    for artifact in artifacts:
+        entry: dict = {
+            "section": section,
+            "artifact": artifact,
+            "source": source,
+            "detail": detail,
+        }
+        if governance:
+            entry["governance"] = governance
+        entries.append(entry)
     write_json(trace_path, entries)
 
 
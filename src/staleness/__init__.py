@@ -4,6 +4,8 @@ Public API (import from submodules):
     change_tracker: alignment_changed_pending, check_pending,
         invalidate_excerpts, set_flag
     file_differ: diff_files, snapshot_files
+    path_resolver: realpath_under
+    stat_cache: RACY_WINDOW_NS, is_settled
     freshness_calculator: compute_section_freshness
     content_hasher: content_hash, file_hash
 """
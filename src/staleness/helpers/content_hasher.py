@@ -9,15 +9,18 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
+_STREAM_CHUNK_BYTES = 1 << 16
+
 
 def file_hash(path: Path) -> str:
-    """SHA-256 hash of a file's contents. Returns empty string if missing."""
-    if not path.exists():
-        return ""
+    """SHA-256 hash of a file's contents. Returns empty string if missing.
+
+    Streams the file through :func:`hashlib.file_digest` so large files
+    are hashed in fixed-size chunks instead of being loaded whole.
+    """
     try:
-        return hashlib.sha256(
-            path.read_bytes()
-        ).hexdigest()
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
     except OSError:
         return ""
 
@@ -29,6 +32,39 @@ def content_hash(data: str | bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+class StreamingHasher:
+    """Incremental SHA-256 over a sequence of byte strings and files.
+
+    Produces the same digest as ``content_hash(b"".join(parts))`` without
+    holding every part, or their concatenation, in memory at once.
+    """
+
+    def __init__(self) -> None:
+        self._hasher = hashlib.sha256()
+        self._buf: bytearray | None = None
+
+    def update(self, data: bytes) -> None:
+        self._hasher.update(data)
+
+    def update_file(self, path: Path) -> None:
+        """Feed *path*'s contents in fixed-size chunks.
+
+        Chunks are read straight into one reusable buffer through an
+        unbuffered file, so no per-chunk ``bytes`` is allocated.  Raises
+        ``OSError`` like ``Path.read_bytes`` when the file cannot be
+        opened.
+        """
+        if self._buf is None:
+            self._buf = bytearray(_STREAM_CHUNK_BYTES)
+        view = memoryview(self._buf)
+        with path.open("rb", buffering=0) as f:
+            while n := f.readinto(view):
+                self._hasher.update(view[:n])
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
 def fingerprint(items: list[str]) -> str:
     """SHA-256 hash of sorted, concatenated items.
 
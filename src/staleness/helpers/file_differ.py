@@ -1,16 +1,32 @@
+import hashlib
+from functools import partial
 from pathlib import Path
 
 from staleness.helpers.content_hasher import file_hash
 
+# Snapshot digests are compared only against each other within one pass,
+# never persisted, so they use BLAKE2b (faster than SHA-256 in hashlib)
+# at the same 64-hex-character width.
+_snapshot_hasher = partial(hashlib.blake2b, digest_size=32)
+
 
 def hash_file(path: Path) -> str:
     """Return SHA-256 hex digest of a file, or empty string if missing."""
     return file_hash(path)
 
 
+def _snapshot_digest(path: Path) -> str:
+    """Streamed snapshot digest of *path*, or empty string if missing."""
+    try:
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, _snapshot_hasher).hexdigest()
+    except OSError:
+        return ""
+
+
 def snapshot_files(codespace: Path, rel_paths: list[str]) -> dict[str, str]:
     """Hash all files before implementation. Returns {rel_path: hash}."""
-    return {rp: hash_file(codespace / rp) for rp in rel_paths}
+    return {rp: _snapshot_digest(codespace / rp) for rp in rel_paths}
 
 
 def diff_files(codespace: Path, before: dict[str, str],
@@ -18,7 +34,7 @@ def diff_files(codespace: Path, before: dict[str, str],
     """Filter reported modified files to only those that actually changed."""
     changed = []
     for rp in reported:
-        after = hash_file(codespace / rp)
+        after = _snapshot_digest(codespace / rp)
         if after != before.get(rp, ""):
             changed.append(rp)
     return changed
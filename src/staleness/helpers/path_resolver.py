@@ -0,0 +1,24 @@
+import os
+from pathlib import Path
+
+
+def realpath_under(base: Path, rel_path: str, real_dirs: dict[str, str]) -> str:
+    """``os.path.realpath`` of *rel_path* joined onto *base*.
+
+    Callers resolve many files under the same few directories, so a
+    plain relative path resolves its parent directory once through
+    *real_dirs* and pays a single ``lstat`` for the leaf, which still
+    follows a symlinked file.  Absolute paths and paths with ``..`` go
+    through a full ``realpath``.
+    """
+    rel = os.path.normpath(rel_path)
+    if os.path.isabs(rel) or rel == "." or ".." in rel_path.split(os.sep):
+        return os.path.realpath(os.path.join(base, rel_path))
+    parent, name = os.path.split(os.path.join(base, rel))
+    real_parent = real_dirs.get(parent)
+    if real_parent is None:
+        real_parent = real_dirs[parent] = os.path.realpath(parent)
+    full = os.path.join(real_parent, name)
+    if os.path.islink(full):
+        return os.path.realpath(full)
+    return full
@@ -0,0 +1,19 @@
+"""Shared guard for caches keyed on a file's stat."""
+
+import time
+
+# Filesystem mtimes advance in ticks, so a file rewritten within one tick
+# of being read can keep its size and mtime.  Anything modified more
+# recently than this may still change under an unchanged stat.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_settled(mtime_ns: int, now_ns: int | None = None) -> bool:
+    """Whether a result read at *mtime_ns* may be cached against that stat.
+
+    *now_ns* defaults to the current time; pass the time the read started
+    when the result took a while to compute.
+    """
+    if now_ns is None:
+        now_ns = time.time_ns()
+    return mtime_ns < now_ns - RACY_WINDOW_NS
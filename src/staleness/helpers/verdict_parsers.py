@@ -8,58 +8,37 @@ from __future__ import annotations
 
 import json as _json
 
+_DECODER = _json.JSONDecoder()
+
 
 def parse_alignment_verdict(output: str) -> dict | None:
     """Parse structured verdict from alignment judge output.
 
-    Looks for a JSON block containing ``frame_ok``.  Returns the full
+    Looks for a JSON object containing ``frame_ok``.  Returns the full
     dict (which may also contain ``aligned`` and ``problems``), or
     ``None`` if no JSON verdict is found.
 
-    Scanning order:
-
-    1. Single-line JSON — each line is checked for a ``{`` prefix and
-       ``frame_ok`` substring, then parsed.
-    2. Code-fenced JSON — content between triple-backtick fences is
-       collected and parsed if it contains ``frame_ok``.
-
-    The first valid match wins.
+    Each ``{`` is handed to :meth:`json.JSONDecoder.raw_decode`, which
+    consumes exactly one JSON value, so single-line, multi-line, and
+    code-fenced verdicts are all found in one left-to-right pass.  The
+    first object with ``frame_ok`` wins.
     """
+    # Every accepted verdict contains the key, so one C-level substring
+    # scan settles the common no-verdict case.
+    last_key = output.rfind("frame_ok")
+    if last_key == -1:
+        return None
 
-    def _try_parse(text: str) -> dict | None:
+    # An object opening after the last ``frame_ok`` cannot carry the key,
+    # so trailing braces (code samples, prose) are never decoded.
+    pos = output.find("{", 0, last_key)
+    while pos != -1:
         try:
-            data = _json.loads(text)
-            if isinstance(data, dict) and "frame_ok" in data:
-                return data
+            data, end = _DECODER.raw_decode(output, pos)
         except _json.JSONDecodeError:
-            pass
-        return None
-
-    # Single-line JSON
-    for line in output.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("{") and "frame_ok" in stripped:
-            parsed = _try_parse(stripped)
-            if parsed:
-                return parsed
-
-    # Code-fenced JSON
-    in_fence = False
-    fence_lines: list[str] = []
-    for line in output.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("```") and not in_fence:
-            in_fence = True
-            fence_lines = []
-            continue
-        if stripped.startswith("```") and in_fence:
-            candidate = "\n".join(fence_lines)
-            if "frame_ok" in candidate:
-                parsed = _try_parse(candidate)
-                if parsed:
-                    return parsed
-            in_fence = False
+            pos = output.find("{", pos + 1, last_key)
             continue
-        if in_fence:
-            fence_lines.append(line)
+        if isinstance(data, dict) and "frame_ok" in data:
+            return data
+        pos = output.find("{", end, last_key)
     return None
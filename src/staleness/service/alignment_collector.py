@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -27,23 +28,24 @@ class AlignmentCollector:
 
         Returns the relative path string, or ``None`` if the path escapes codespace.
         """
-        pp = Path(line)
-        if pp.is_absolute():
-            try:
-                return str(pp.resolve().relative_to(codespace_resolved))
-            except ValueError:
-                self._logger.log(
-                    f"  WARNING: reported path outside codespace, skipping: {line}",
-                )
-                return None
-        full = (codespace / pp).resolve()
-        try:
-            return str(full.relative_to(codespace_resolved))
-        except ValueError:
+        # os.path.join keeps absolute lines as-is, so one realpath call
+        # covers both cases without building intermediate Path objects.
+        full = os.path.realpath(os.path.join(codespace, line))
+        root = str(codespace_resolved)
+        if full == root:
+            return "."
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        if full.startswith(prefix):
+            return full[len(prefix):]
+        if os.path.isabs(line):
+            self._logger.log(
+                f"  WARNING: reported path outside codespace, skipping: {line}",
+            )
+        else:
             self._logger.log(
                 f"  WARNING: reported path escapes codespace, skipping: {line}",
             )
-            return None
+        return None
 
     def collect_modified_files(
         self,
@@ -59,17 +61,26 @@ class AlignmentCollector:
         """
         paths = PathRegistry(planspace)
         modified_report = paths.impl_modified(section.number)
-        if not modified_report.exists():
+        try:
+            report = modified_report.open(encoding="utf-8")
+        except FileNotFoundError:
             return []
         codespace_resolved = codespace.resolve()
-        modified: set[str] = set()
-        for line in modified_report.read_text(encoding="utf-8").strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            rel = self._resolve_relative(line, codespace_resolved, codespace)
-            if rel is not None:
-                modified.add(rel)
+        # dict keys dedupe like a set but keep report order, so callers
+        # see a deterministic list.
+        modified: dict[str, None] = {}
+        seen: set[str] = set()
+        with report:
+            for line in report:
+                line = line.strip()
+                if not line or line in seen:
+                    continue
+                seen.add(line)
+                rel = self._resolve_relative(
+                    line, codespace_resolved, codespace,
+                )
+                if rel is not None:
+                    modified[rel] = None
         return list(modified)
 
 
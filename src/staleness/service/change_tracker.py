@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Callable
 
@@ -14,7 +15,13 @@ def set_flag(planspace: Path, *, db_sh: Path, agent_name: str) -> None:
     """Persist the alignment-changed flag and record a lifecycle event."""
     flag = PathRegistry(planspace).alignment_changed_flag()
     flag.parent.mkdir(parents=True, exist_ok=True)
-    flag.write_text("1", encoding="utf-8")
+    # Only the flag's existence is read, and O_CREAT makes that appear
+    # atomically; the one-byte body needs no temp file or text wrapper.
+    fd = os.open(flag, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, b"1")
+    finally:
+        os.close(fd)
     DatabaseClient.for_planspace(planspace, db_sh).log_event(
         "lifecycle",
         "alignment-changed",
@@ -31,10 +38,10 @@ def check_pending(planspace: Path) -> bool:
 
 def check_and_clear(planspace: Path, *, db_sh: Path, agent_name: str) -> bool:
     """Atomically consume the alignment-changed flag when present."""
-    flag = PathRegistry(planspace).alignment_changed_flag()
-    if not flag.exists():
+    try:
+        PathRegistry(planspace).alignment_changed_flag().unlink()
+    except FileNotFoundError:
         return False
-    flag.unlink(missing_ok=True)
     DatabaseClient.for_planspace(planspace, db_sh).log_event(
         "lifecycle",
         "alignment-changed",
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import Any
 
 from coordination.repository.notes import list_notes_to
 from orchestrator.path_registry import PathRegistry
 from orchestrator.repository.input_refs import list_input_refs
-from staleness.helpers.content_hasher import content_hash, file_hash
+from staleness.helpers.content_hasher import StreamingHasher, content_hash, file_hash
+from staleness.helpers.stat_cache import is_settled
 
 
 def _static_input_paths(paths: PathRegistry, sec_num: str) -> list[Path]:
@@ -40,65 +42,123 @@ def _static_input_paths(paths: PathRegistry, sec_num: str) -> list[Path]:
     ]
 
 
-def _collect_ref_parts(
-    inputs_dir: Path, hash_parts: list[bytes],
-) -> None:
-    """Collect hash parts from input reference files."""
+# Kinds of hash input: literal bytes, a file's contents, or a file's digest.
+_BYTES, _FILE, _FILE_DIGEST = range(3)
+
+# (planspace, sec_num) -> (stat fingerprint, hex digest)
+_INPUTS_HASH_CACHE: dict[tuple[Path, str], tuple[tuple, str]] = {}
+
+
+def _collect_ref_parts(inputs_dir: Path, inputs: list[tuple[int, Any]]) -> None:
+    """Append input reference files and their targets to *inputs*."""
     for ref_path in list_input_refs(inputs_dir):
-        hash_parts.append(ref_path.read_bytes())
+        inputs.append((_BYTES, ref_path.read_bytes()))
         try:
             referenced = Path(ref_path.read_text(encoding="utf-8").strip())
             if referenced.exists():
-                hash_parts.append(referenced.read_bytes())
+                inputs.append((_FILE, referenced))
         except (OSError, ValueError) as exc:
-            hash_parts.append(f"REF_READ_ERROR:{ref_path}".encode("utf-8"))
+            inputs.append((_BYTES, f"REF_READ_ERROR:{ref_path}".encode("utf-8")))
             print(f"[HASH][WARN] Failed to read ref {ref_path}: {exc}")
 
 
-def section_inputs_hash(
+def _section_inputs(
     sec_num: str,
-    planspace: Path,
+    paths: PathRegistry,
     sections_by_num: dict[str, Any],
-) -> str:
-    """Compute a hash of a section's alignment-relevant inputs."""
-
-    hash_parts: list[bytes] = []
-    paths = PathRegistry(planspace)
-
-    for excerpt_path in (
-        paths.proposal_excerpt(sec_num),
-        paths.alignment_excerpt(sec_num),
-    ):
-        if excerpt_path.exists():
-            hash_parts.append(excerpt_path.read_bytes())
+) -> list[tuple[int, Any]]:
+    """List a section's hash inputs, in hash order, without reading them."""
+    inputs: list[tuple[int, Any]] = [
+        (_FILE, paths.proposal_excerpt(sec_num)),
+        (_FILE, paths.alignment_excerpt(sec_num)),
+    ]
 
     section = sections_by_num.get(sec_num)
     if section and section.related_files:
-        hash_parts.append(
-            "\n".join(sorted(section.related_files)).encode("utf-8"),
+        inputs.append(
+            (_BYTES, "\n".join(sorted(section.related_files)).encode("utf-8")),
         )
 
-    for note in list_notes_to(paths, sec_num):
-        hash_parts.append(note.read_bytes())
-
-    tool_registry_path = paths.tool_registry()
-    if tool_registry_path.exists():
-        hash_parts.append(tool_registry_path.read_bytes())
-
-    for input_path in _static_input_paths(paths, sec_num):
-        if input_path.exists():
-            hash_parts.append(input_path.read_bytes())
-
-    for ms_path in sorted(paths.artifacts.glob(f"microstrategy-{sec_num}*.md")):
-        hash_parts.append(ms_path.read_bytes())
+    inputs.extend((_FILE, note) for note in list_notes_to(paths, sec_num))
+    inputs.append((_FILE, paths.tool_registry()))
+    inputs.extend((_FILE, path) for path in _static_input_paths(paths, sec_num))
+    inputs.extend(
+        (_FILE, ms_path)
+        for ms_path in sorted(paths.artifacts.glob(f"microstrategy-{sec_num}*.md"))
+    )
+    inputs.append((_FILE_DIGEST, paths.governance_packet(sec_num)))
+    _collect_ref_parts(paths.input_refs_dir(sec_num), inputs)
+    return inputs
+
+
+def _stat_fingerprint(inputs: list[tuple[int, Any]]) -> tuple[tuple, int]:
+    """Return ``(fingerprint, newest mtime_ns)`` for *inputs*.
+
+    Files contribute ``(path, mtime_ns, size)``, or ``(path, None)``
+    when missing; literal inputs contribute themselves.
+    """
+    fingerprint = []
+    newest = 0
+    for kind, value in inputs:
+        if kind == _BYTES:
+            fingerprint.append(value)
+            continue
+        try:
+            st = value.stat()
+        except OSError:
+            fingerprint.append((value, None))
+            continue
+        fingerprint.append((value, st.st_mtime_ns, st.st_size))
+        newest = max(newest, st.st_mtime_ns)
+    return tuple(fingerprint), newest
 
-    governance_packet = paths.governance_packet(sec_num)
-    if governance_packet.exists():
-        hash_parts.append(file_hash(governance_packet).encode("utf-8"))
 
-    _collect_ref_parts(paths.input_refs_dir(sec_num), hash_parts)
+def section_inputs_hash(
+    sec_num: str,
+    planspace: Path,
+    sections_by_num: dict[str, Any],
+) -> str:
+    """Compute a hash of a section's alignment-relevant inputs.
 
-    return content_hash(b"".join(hash_parts))
+    Inputs are streamed into one running SHA-256, so large artifacts are
+    never held whole or copied into a joined buffer.  The digest is
+    cached against a stat fingerprint of every input, so a section whose
+    inputs are unchanged since the last call costs stats, not reads.
+    """
+    paths = PathRegistry(planspace)
+    inputs = _section_inputs(sec_num, paths, sections_by_num)
+    fingerprint, newest_mtime = _stat_fingerprint(inputs)
+    cache_key = (planspace, sec_num)
+    cached = _INPUTS_HASH_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    hashed_at = time.time_ns()
+    hasher = StreamingHasher()
+    for (kind, value), entry in zip(inputs, fingerprint):
+        if kind == _BYTES:
+            hasher.update(value)
+        elif entry[1] is None:
+            continue
+        elif kind == _FILE:
+            hasher.update_file(value)
+        else:
+            hasher.update(file_hash(value).encode("utf-8"))
+    digest = hasher.hexdigest()
+
+    if is_settled(newest_mtime, hashed_at):
+        _INPUTS_HASH_CACHE[cache_key] = (fingerprint, digest)
+    return digest
+
+
+def read_modified_contents(codespace: Path, modified_files: list[str]) -> bytes:
+    """Concatenate the bytes of existing *modified_files* in sorted order."""
+    parts: list[bytes] = []
+    for mod_f in sorted(modified_files):
+        mod_path = codespace / mod_f
+        if mod_path.exists():
+            parts.append(mod_path.read_bytes())
+    return b"".join(parts)
 
 
 def coordination_recheck_hash(
@@ -107,12 +167,15 @@ def coordination_recheck_hash(
     codespace: Path,
     sections_by_num: dict[str, Any],
     modified_files: list[str],
+    modified_contents: bytes | None = None,
 ) -> str:
-    """Canonical section-input hash plus coordinator-modified files."""
+    """Canonical section-input hash plus coordinator-modified files.
+
+    Callers rechecking several sections against the same modified set can
+    pass *modified_contents* from :func:`read_modified_contents` so the
+    files are read once instead of once per section.
+    """
     base = section_inputs_hash(sec_num, planspace, sections_by_num)
-    hash_parts = [base.encode("utf-8")]
-    for mod_f in sorted(modified_files):
-        mod_path = codespace / mod_f
-        if mod_path.exists():
-            hash_parts.append(mod_path.read_bytes())
-    return content_hash(b"".join(hash_parts))
+    if modified_contents is None:
+        modified_contents = read_modified_contents(codespace, modified_files)
+    return content_hash(base.encode("utf-8") + modified_contents)
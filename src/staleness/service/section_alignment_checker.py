@@ -11,6 +11,7 @@ from orchestrator.path_registry import PathRegistry
 from pipeline.template import render_template
 from staleness.helpers.verdict_parsers import parse_alignment_verdict as _parse_alignment_verdict
 from orchestrator.types import Section, ControlSignal
+from dispatch.service.prompt_guard import write_prompt_if_changed
 from dispatch.types import ALIGNMENT_CHANGED_PENDING, DispatchStatus
 from signals.types import ALIGNMENT_INVALID_FRAME
 
@@ -136,12 +137,12 @@ class SectionAlignmentChecker:
                 return None
 
             adj_prompt = paths.alignment_adjudicate_prompt()
-            adj_prompt.write_text(
+            write_prompt_if_changed(
+                adj_prompt,
                 render_template(
                     "alignment-adjudicate", dynamic_body,
                     file_paths=[str(output_path)],
                 ),
-                encoding="utf-8",
             )
             adj_result = self._dispatcher.dispatch(
                 adjudicator_model, adj_prompt, paths.alignment_adjudicate_output(),
@@ -183,15 +184,19 @@ class SectionAlignmentChecker:
 
         sec_num = section.number
         paths = PathRegistry(planspace)
+        align_output = paths.artifacts / f"{output_prefix}-{sec_num}-output.md"
+        # Inputs do not change between TIMEOUT retries (an alignment change
+        # returns early), so the prompt is written once on the first attempt.
+        align_prompt: Path | None = None
         for attempt in range(1, max_retries + 2):  # 1 initial + max_retries
             ctrl = self._pipeline_control.poll_control_messages(
                 planspace, current_section=sec_num)
             if ctrl == ControlSignal.ALIGNMENT_CHANGED:
                 return ALIGNMENT_CHANGED_PENDING
-            align_prompt = prompt_writers.write_impl_alignment_prompt(
-                section, planspace, codespace,
-            )
-            align_output = paths.artifacts / f"{output_prefix}-{sec_num}-output.md"
+            if align_prompt is None:
+                align_prompt = prompt_writers.write_impl_alignment_prompt(
+                    section, planspace, codespace,
+                )
             result = self._dispatcher.dispatch(
                 model, align_prompt, align_output,
                 planspace, codespace=codespace,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import signal
 import subprocess
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -26,15 +28,22 @@ def test_run_agent_invokes_agents_binary_with_expected_args(
     codespace.mkdir()
     calls: list[tuple[list[str], int]] = []
 
-    def fake_run(cmd: list[str], **kwargs) -> SimpleNamespace:
-        calls.append((cmd, kwargs["timeout"]))
-        return SimpleNamespace(stdout="out", stderr="err", returncode=3)
+    def fake_popen(cmd: list[str], **kwargs) -> SimpleNamespace:
+        assert kwargs["start_new_session"] is True
+
+        def communicate(timeout=None):
+            calls.append((cmd, timeout))
+            return "out", "err"
+
+        return SimpleNamespace(
+            args=cmd, pid=4242, returncode=3, communicate=communicate,
+        )
 
     monkeypatch.setattr(
         TaskRouterService, "resolve_agent_path",
         lambda self, name: agent_path,
     )
-    monkeypatch.setattr(agent_executor.subprocess, "run", fake_run)
+    monkeypatch.setattr(agent_executor.subprocess, "Popen", fake_popen)
 
     executor = AgentExecutor(task_router=TaskRouterService())
     result = executor.run_agent(
@@ -77,14 +86,27 @@ def test_run_agent_returns_timeout_result(
     prompt_path = tmp_path / "prompt.md"
     prompt_path.write_text("# prompt\n", encoding="utf-8")
 
-    def fake_run(*args, **kwargs):
-        raise subprocess.TimeoutExpired(cmd="agents", timeout=45)
+    killed: list[tuple[int, int]] = []
+
+    def communicate(timeout=None):
+        if not killed:
+            raise subprocess.TimeoutExpired(cmd="agents", timeout=45)
+        return "", ""
+
+    def fake_popen(cmd, **kwargs):
+        return SimpleNamespace(
+            args=cmd, pid=4242, returncode=-9, communicate=communicate,
+        )
 
     monkeypatch.setattr(
         TaskRouterService, "resolve_agent_path",
         lambda self, name: agent_path,
     )
-    monkeypatch.setattr(agent_executor.subprocess, "run", fake_run)
+    monkeypatch.setattr(agent_executor.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(
+        agent_executor.os, "killpg",
+        lambda pid, sig: killed.append((pid, sig)),
+    )
 
     executor = AgentExecutor(task_router=TaskRouterService())
     result = executor.run_agent(
@@ -97,6 +119,94 @@ def test_run_agent_returns_timeout_result(
     assert result.timed_out is True
     assert result.returncode == -1
     assert result.output == "TIMEOUT: Agent exceeded 45s time limit"
+    assert killed == [(4242, signal.SIGTERM)]
+
+
+def test_run_agent_kills_process_group_when_halted(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent_path = tmp_path / "test-agent.md"
+    agent_path.write_text("# test\n", encoding="utf-8")
+    halt_event = threading.Event()
+    killed: list[tuple[int, int]] = []
+    waits: list[float] = []
+
+    def communicate(timeout=None):
+        if killed:
+            return "partial", ""
+        waits.append(timeout)
+        halt_event.set()
+        raise subprocess.TimeoutExpired(cmd="agents", timeout=timeout)
+
+    def fake_popen(cmd, **kwargs):
+        return SimpleNamespace(
+            args=cmd, pid=4242, returncode=-15, communicate=communicate,
+        )
+
+    monkeypatch.setattr(
+        TaskRouterService, "resolve_agent_path",
+        lambda self, name: agent_path,
+    )
+    monkeypatch.setattr(agent_executor.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(
+        agent_executor.os, "killpg",
+        lambda pid, sig: killed.append((pid, sig)),
+    )
+
+    executor = AgentExecutor(task_router=TaskRouterService())
+    result = executor.run_agent(
+        "test-model",
+        tmp_path / "prompt.md",
+        agent_file="test-agent.md",
+        timeout=600,
+        halt_event=halt_event,
+    )
+
+    assert len(waits) == 1 and waits[0] <= 1.0
+    assert killed == [(4242, signal.SIGTERM)]
+    assert result.timed_out is False
+    assert result.returncode == -15
+    assert result.output == "partial"
+
+
+def test_run_agent_kills_process_group_on_interrupt(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent_path = tmp_path / "test-agent.md"
+    agent_path.write_text("# test\n", encoding="utf-8")
+    killed: list[tuple[int, int]] = []
+
+    def communicate(timeout=None):
+        if killed:
+            return "", ""
+        raise KeyboardInterrupt
+
+    def fake_popen(cmd, **kwargs):
+        return SimpleNamespace(
+            args=cmd, pid=4242, returncode=-15, communicate=communicate,
+        )
+
+    monkeypatch.setattr(
+        TaskRouterService, "resolve_agent_path",
+        lambda self, name: agent_path,
+    )
+    monkeypatch.setattr(agent_executor.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(
+        agent_executor.os, "killpg",
+        lambda pid, sig: killed.append((pid, sig)),
+    )
+
+    executor = AgentExecutor(task_router=TaskRouterService())
+    with pytest.raises(KeyboardInterrupt):
+        executor.run_agent(
+            "test-model",
+            tmp_path / "prompt.md",
+            agent_file="test-agent.md",
+        )
+
+    assert killed == [(4242, signal.SIGTERM)]
 
 
 def test_run_agent_requires_existing_agent_file(
@@ -46,6 +46,11 @@ def test_check_and_clear_consumes_flag_and_logs_clear(tmp_path: Path) -> None:
         agent_name="section-loop",
     ) is True
     assert check_pending(planspace) is False
+    assert check_and_clear(
+        planspace,
+        db_sh=DB_SH,
+        agent_name="section-loop",
+    ) is False
 
     rows = DatabaseClient(DB_SH, planspace / "run.db").query(
         "lifecycle",
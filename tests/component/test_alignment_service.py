@@ -50,6 +50,21 @@ def test_collect_modified_files_normalizes_relative_and_absolute_paths(
     assert result == ["src/main.py", "src/util.py"]
 
 
+def test_collect_modified_files_preserves_report_order(
+    planspace: Path,
+    codespace: Path,
+) -> None:
+    report = planspace / "artifacts" / "impl-01-modified.txt"
+    report.write_text(
+        "src/zeta.py\nsrc/alpha.py\n./src/zeta.py\nsrc/mid.py\n",
+        encoding="utf-8",
+    )
+
+    result = _collect_modified_files(planspace, _section(planspace), codespace)
+
+    assert result == ["src/zeta.py", "src/alpha.py", "src/mid.py"]
+
+
 def test_collect_modified_files_rejects_paths_outside_codespace(
     planspace: Path,
     codespace: Path,
@@ -66,6 +81,30 @@ def test_collect_modified_files_rejects_paths_outside_codespace(
     assert result == []
 
 
+def test_collect_modified_files_rejects_symlink_escape_and_sibling_prefix(
+    planspace: Path,
+    codespace: Path,
+    tmp_path: Path,
+) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (codespace / "link").symlink_to(outside)
+    sibling = Path(str(codespace) + "-sibling")
+    sibling.mkdir()
+    report = planspace / "artifacts" / "impl-01-modified.txt"
+    report.write_text(
+        f"link/file.py\n{sibling / 'x.py'}\n", encoding="utf-8",
+    )
+
+    result = _collect_modified_files(
+        planspace,
+        _section(planspace),
+        codespace,
+    )
+
+    assert result == []
+
+
 def test_extract_problems_returns_none_for_aligned_verdict() -> None:
     assert extract_problems({"aligned": True, "problems": []}) is None
 
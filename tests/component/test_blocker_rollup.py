@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from signals.service.blocker_manager import update_blocker_rollup
+from signals.service.blocker_manager import append_open_problem, update_blocker_rollup
 
 
 def test_blocker_rollup_formats_global_philosophy_heading(
@@ -108,3 +108,44 @@ def test_blocker_rollup_separates_shared_seam_coordination_from_scope_expansion(
     assert "- **Detail**: Add a new admin reporting surface." in content
     assert content.count("shared client cache") == 1
     assert "## Section 03 — proposal-state:shared_seam_candidates" not in content
+
+
+def test_append_open_problem_adds_section_then_splices_entries(
+    planspace: Path,
+) -> None:
+    spec = planspace / "artifacts" / "sections" / "section-01.md"
+    spec.parent.mkdir(parents=True, exist_ok=True)
+    spec.write_text("# Section 01\n\nBody.\n", encoding="utf-8")
+
+    append_open_problem(planspace, "01", "first", "scan")
+    append_open_problem(planspace, "01", "second", "proposal")
+
+    assert spec.read_text(encoding="utf-8") == (
+        "# Section 01\n\nBody.\n\n## Open Problems\n"
+        "- **[proposal]** second\n- **[scan]** first\n"
+    )
+
+
+def test_append_open_problem_trims_trailing_blank_lines(planspace: Path) -> None:
+    spec = planspace / "artifacts" / "sections" / "section-02.md"
+    spec.parent.mkdir(parents=True, exist_ok=True)
+    spec.write_text("# Section 02\n\n\n", encoding="utf-8")
+
+    append_open_problem(planspace, "02", "gap", "impl")
+
+    assert spec.read_text(encoding="utf-8") == (
+        "# Section 02\n\n## Open Problems\n- **[impl]** gap\n"
+    )
+
+
+def test_append_open_problem_skips_repeated_entry(planspace: Path) -> None:
+    spec = planspace / "artifacts" / "sections" / "section-03.md"
+    spec.parent.mkdir(parents=True, exist_ok=True)
+    spec.write_text("# Section 03\n", encoding="utf-8")
+
+    append_open_problem(planspace, "03", "gap", "proposal")
+    append_open_problem(planspace, "03", "gap", "proposal")
+
+    assert spec.read_text(encoding="utf-8") == (
+        "# Section 03\n\n## Open Problems\n- **[proposal]** gap\n"
+    )
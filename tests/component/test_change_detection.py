@@ -6,6 +6,7 @@ Pure file I/O — no mocks needed.
 from pathlib import Path
 
 from staleness.helpers.file_differ import diff_files, hash_file, snapshot_files
+from staleness.helpers.path_resolver import realpath_under
 
 
 class TestHashFile:
@@ -75,3 +76,16 @@ class TestDiffFiles:
             codespace, before, ["src/main.py", "src/utils.py"],
         )
         assert changed == ["src/main.py"]
+
+
+class TestRealpathUnder:
+    def test_matches_realpath_through_symlinks(self, tmp_path: Path) -> None:
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "a.py").write_text("a")
+        (tmp_path / "linked").symlink_to(tmp_path / "real")
+        (tmp_path / "real" / "alias.py").symlink_to(tmp_path / "real" / "a.py")
+        real_dirs: dict[str, str] = {}
+        for rel in ("linked/a.py", "linked/alias.py", "real/../real/a.py", "missing.py"):
+            assert realpath_under(tmp_path, rel, real_dirs) == str(
+                (tmp_path / rel).resolve(),
+            )
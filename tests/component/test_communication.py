@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 import subprocess
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
 from _paths import DB_SH
 from src.signals.service.section_communicator import (
     AGENT_NAME,
+    SectionCommunicator,
     _record_traceability,
+    batched_artifact_logs,
     log,
     mailbox_drain,
     mailbox_register,
@@ -55,3 +60,70 @@ def test_mailbox_helpers_round_trip(tmp_path: Path) -> None:
     mailbox_send(tmp_path, AGENT_NAME, "test message")
 
     assert mailbox_drain(tmp_path) == ["test message"]
+
+
+def _artifact_tags(db_path: Path) -> list[str]:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT tag FROM events WHERE kind = 'lifecycle' ORDER BY id ASC",
+    ).fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+def test_batched_artifact_logs_defer_until_outermost_exit(
+    tmp_path: Path,
+) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    db_path = planspace / "run.db"
+    subprocess.run(["bash", str(DB_SH), "init", str(db_path)], check=True,
+                   capture_output=True)
+    communicator = SectionCommunicator(
+        SimpleNamespace(db_sh=DB_SH, agent_name=AGENT_NAME),
+    )
+
+    with batched_artifact_logs():
+        communicator.log_artifact(planspace, "one")
+        with batched_artifact_logs():
+            communicator.log_artifact(planspace, "two")
+        assert _artifact_tags(db_path) == []
+
+    assert _artifact_tags(db_path) == ["artifact:one", "artifact:two"]
+
+    communicator.log_artifact(planspace, "three")
+    assert _artifact_tags(db_path)[-1] == "artifact:three"
+
+
+def test_batched_artifact_logs_hold_back_only_joined_threads(
+    tmp_path: Path,
+) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    db_path = planspace / "run.db"
+    subprocess.run(["bash", str(DB_SH), "init", str(db_path)], check=True,
+                   capture_output=True)
+    communicator = SectionCommunicator(
+        SimpleNamespace(db_sh=DB_SH, agent_name=AGENT_NAME),
+    )
+
+    def _in_thread(target) -> None:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    with batched_artifact_logs() as batch:
+        _in_thread(lambda: communicator.log_artifact(planspace, "other"))
+        assert _artifact_tags(db_path) == ["artifact:other"]
+
+        def _joined() -> None:
+            with batched_artifact_logs(join=batch):
+                communicator.log_artifact(planspace, "worker")
+
+        _in_thread(_joined)
+        communicator.log_artifact(planspace, "owner")
+        assert _artifact_tags(db_path) == ["artifact:other"]
+
+    assert _artifact_tags(db_path) == [
+        "artifact:other", "artifact:worker", "artifact:owner",
+    ]
@@ -10,6 +10,7 @@ from pathlib import Path
 from signals.service.mailbox_service import summary_tag as _summary_tag
 from signals.service.section_communicator import (
     _record_traceability,
+    _record_traceability_many,
     mailbox_drain,
     mailbox_recv,
     mailbox_register,
@@ -73,6 +74,24 @@ class TestRecordTraceability:
         assert len(entries) == 1
         assert entries[0]["section"] == "03"
 
+    def test_many_appends_one_entry_per_artifact(self, planspace: Path) -> None:
+        _record_traceability(planspace, "01", "artifact-a", "source-a")
+        _record_traceability_many(
+            planspace, "02", ["src/a.py", "src/b.py"],
+            "section-02-integration-proposal.md", "implementation change",
+        )
+        entries = json.loads(
+            (planspace / "artifacts" / "traceability.json").read_text(),
+        )
+        assert [e["artifact"] for e in entries] == [
+            "artifact-a", "src/a.py", "src/b.py",
+        ]
+        assert entries[2]["detail"] == "implementation change"
+
+    def test_many_with_no_artifacts_writes_nothing(self, planspace: Path) -> None:
+        _record_traceability_many(planspace, "01", [], "source-a")
+        assert not (planspace / "artifacts" / "traceability.json").exists()
+
 
 class TestMailboxIntegration:
     """Tests mailbox operations using real db.sh + SQLite."""
@@ -57,6 +57,23 @@ def test_resolve_context_skips_unknown_categories_and_returns_empty_for_missing(
     }
 
 
+def test_resolve_context_prefers_explored_over_initial_artifacts(tmp_path) -> None:
+    paths = PathRegistry(tmp_path)
+    paths.ensure_artifacts_tree()
+    paths.global_problems_dir().mkdir(parents=True, exist_ok=True)
+    (paths.global_problems_dir() / "initial-problems.json").write_text("initial", encoding="utf-8")
+    (paths.global_problems_dir() / "explored-problems.json").write_text("", encoding="utf-8")
+    agent_file = tmp_path / "agent.md"
+    agent_file.write_text(
+        "---\ncontext: [problems, values, section_output]\n---\n",
+        encoding="utf-8",
+    )
+
+    result = ContextSidecar(artifact_io=Services.artifact_io()).resolve_context(str(agent_file), tmp_path, section="03")
+
+    assert result == {"problems": "", "values": "", "section_output": ""}
+
+
 def test_resolve_context_appends_codemap_corrections(tmp_path) -> None:
     PathRegistry(tmp_path).ensure_artifacts_tree()
     artifacts = tmp_path / "artifacts"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -90,6 +91,55 @@ def test_execute_coordination_plan_runs_fix_groups_and_persists_modified_files(
     assert executor.read_execution_modified_files(planspace) == ["src/a.py", "src/b.py"]
 
 
+def test_parallel_batch_shares_fix_prompt_blocks_across_groups(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    noop_pipeline_control,
+) -> None:
+    planspace = _planspace(tmp_path)
+    sections_by_num = {
+        num: Section(
+            number=num,
+            path=planspace / "artifacts" / f"section-{num}.md",
+            related_files=[f"src/{num}.py"],
+        )
+        for num in ("01", "02", "03")
+    }
+    executor = _make_executor()
+    built = []
+    real_shared = executor._writers.shared_fix_blocks
+
+    def _counting_shared(planspace_arg):
+        blocks = real_shared(planspace_arg)
+        built.append(blocks)
+        return blocks
+
+    seen = []
+    monkeypatch.setattr(executor._writers, "shared_fix_blocks", _counting_shared)
+    monkeypatch.setattr(
+        PlanExecutor,
+        "_dispatch_fix_group",
+        lambda self, group, group_index, ctx, model, shared_blocks=None, **kwargs: (
+            seen.append(shared_blocks) or (group_index, [group[0].files[0]])
+        ),
+    )
+
+    executor.execute_coordination_plan(
+        [
+            ProblemGroup(
+                problems=[MisalignedProblem(section=num, description="", files=[f"src/{num}.py"])],
+            )
+            for num in ("01", "02", "03")
+        ],
+        sections_by_num,
+        DispatchContext(planspace=planspace, codespace=tmp_path / "codespace", _policies=Services.policies()),
+    )
+
+    assert len(built) == 1
+    assert len(seen) == 3
+    assert all(blocks is built[0] for blocks in seen)
+
+
 def test_execute_coordination_plan_runs_bridge_and_registers_inputs(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -160,6 +210,118 @@ def test_execute_coordination_plan_runs_bridge_and_registers_inputs(
     ).exists()
 
 
+def test_batch_without_bridges_polls_mailbox_once_around_overlaps(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capturing_pipeline_control,
+) -> None:
+    planspace = _planspace(tmp_path)
+    sections_by_num = {
+        num: Section(
+            number=num,
+            path=planspace / "artifacts" / f"section-{num}.md",
+            related_files=[f"src/{num}.py"],
+        )
+        for num in ("01", "02", "03")
+    }
+    monkeypatch.setattr(
+        PlanExecutor,
+        "_dispatch_fix_group",
+        lambda self, group, group_index, *args, **kwargs: (group_index, []),
+    )
+
+    _make_executor().execute_coordination_plan(
+        [
+            ProblemGroup(
+                problems=[MisalignedProblem(section=num, description="", files=[f"src/{num}.py"])],
+            )
+            for num in ("01", "02", "03")
+        ],
+        sections_by_num,
+        DispatchContext(planspace=planspace, codespace=tmp_path / "codespace", _policies=Services.policies()),
+    )
+
+    # One poll before the batch and one after its overlap stats; none per group.
+    assert len(capturing_pipeline_control.poll_calls) == 2
+
+
+def test_write_fix_prompt_lists_files_sections_and_sidecar_once(tmp_path: Path) -> None:
+    planspace = _planspace(tmp_path)
+    codespace = tmp_path / "codespace"
+    group = [
+        MisalignedProblem(section="02", description="d2", files=["src/a.py", "project-spec.md"]),
+        MisalignedProblem(section="01", description="d1", files=["src/b.py", "src/a.py"]),
+    ]
+    writers = _make_executor()._writers
+    shared = writers.shared_fix_blocks(planspace)
+
+    prompt_path = writers.write_fix_prompt(group, planspace, codespace, 3, shared)
+
+    assert prompt_path is not None
+    prompt = prompt_path.read_text(encoding="utf-8")
+    assert f"- `{codespace / 'src/a.py'}`\n- `{codespace / 'src/b.py'}`" in prompt
+    assert "project-spec.md`" not in prompt
+    assert prompt.index("Section 01 specification") < prompt.index("Section 02 specification")
+    assert prompt.index("Section 01 alignment excerpt") < prompt.index("Section 02 alignment excerpt")
+    assert shared.sidecar_path is not None
+    assert prompt.count("## Scoped Context") == 1
+    assert prompt.endswith(f"`{shared.sidecar_path}`\n")
+
+
+def test_escalated_fix_model_is_resolved_once_per_plan(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    noop_pipeline_control,
+) -> None:
+    planspace = _planspace(tmp_path)
+    sections_by_num = {
+        num: Section(
+            number=num,
+            path=planspace / "artifacts" / f"section-{num}.md",
+            related_files=[f"src/{num}.py"],
+        )
+        for num in ("01", "02")
+    }
+    ctx = DispatchContext(
+        planspace=planspace,
+        codespace=tmp_path / "codespace",
+        _policies=Services.policies(),
+    )
+    ctx.paths.coordination_model_escalation().write_text(
+        "escalated-model\n", encoding="utf-8",
+    )
+    calls = []
+    monkeypatch.setattr(
+        PlanExecutor,
+        "_dispatch_fix_group",
+        lambda self, group, group_index, ctx_, fix_model, *args, escalated_from=None: (
+            calls.append((fix_model, escalated_from)) or (group_index, [])
+        ),
+    )
+    resolve_calls = []
+    real_resolve = PlanExecutor._resolve_fix_model
+    monkeypatch.setattr(
+        PlanExecutor,
+        "_resolve_fix_model",
+        lambda self, ctx_: resolve_calls.append(1) or real_resolve(self, ctx_),
+    )
+
+    _make_executor().execute_coordination_plan(
+        [
+            ProblemGroup(
+                problems=[MisalignedProblem(section=num, description="", files=[f"src/{num}.py"])],
+            )
+            for num in ("01", "02")
+        ],
+        sections_by_num,
+        ctx,
+    )
+
+    default_model = ctx.resolve_model("coordination_fix")
+    assert len(resolve_calls) == 1
+    assert calls == [("escalated-model", default_model)] * 2
+
+
 def test_execute_coordination_plan_raises_on_fix_group_sentinel(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -187,3 +349,68 @@ def test_execute_coordination_plan_raises_on_fix_group_sentinel(
             sections_by_num,
             DispatchContext(planspace=planspace, codespace=tmp_path / "codespace", _policies=Services.policies()),
         )
+
+
+def test_write_overlap_stats_counts_pairwise_section_overlaps(tmp_path: Path) -> None:
+    coord_dir = tmp_path / "coordination"
+    coord_dir.mkdir()
+    group = [
+        MisalignedProblem(section="02", description="", files=["a.py", "b.py"]),
+        MisalignedProblem(section="01", description="", files=["a.py"]),
+        MisalignedProblem(section="03", description="", files=["a.py", "b.py", "c.py"]),
+    ]
+
+    _make_executor()._write_overlap_stats(coord_dir, 5, group)
+
+    stats = json.loads(
+        (coord_dir / "overlap-stats-group-5.json").read_text(encoding="utf-8"),
+    )
+    assert stats == {
+        "group": 5,
+        "sections": ["01", "02", "03"],
+        "overlap_count": 4,
+        "overlapping_files": ["a.py", "a.py", "a.py", "b.py", "b.py"],
+    }
+
+
+def test_write_overlap_stats_skips_disjoint_sections(tmp_path: Path) -> None:
+    group = [
+        MisalignedProblem(section="01", description="", files=["a.py"]),
+        MisalignedProblem(section="02", description="", files=["b.py"]),
+    ]
+
+    _make_executor()._write_overlap_stats(tmp_path, 0, group)
+
+    assert not (tmp_path / "overlap-stats-group-0.json").exists()
+
+
+def test_collect_modified_files_keeps_in_tree_paths_and_rejects_escapes(
+    tmp_path: Path,
+) -> None:
+    codespace = tmp_path / "codespace"
+    (codespace / "src").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (codespace / "link").symlink_to(outside)
+    (codespace / "src" / "leaked.py").symlink_to(outside / "leaked.py")
+    report = tmp_path / "fix-modified.txt"
+    report.write_text(
+        "\n".join(
+            [
+                "src/a.py",
+                str(codespace / "src" / "b.py"),
+                "src/a.py",
+                "../elsewhere.py",
+                "/etc/passwd",
+                "link/c.py",
+                "src/leaked.py",
+                "link/../src/d.py",
+                "./src//e.py",
+            ],
+        ),
+        encoding="utf-8",
+    )
+
+    result = _make_executor()._collect_modified_files(report, codespace)
+
+    assert result == ["src/a.py", "src/b.py", "src/a.py", "src/e.py"]
@@ -59,6 +59,21 @@ def test_parse_coordination_plan_rejects_duplicate_problem_indices() -> None:
     assert planner._parse_coordination_plan(agent_output, problems) is None
 
 
+def test_validate_problem_indices_reports_missing_indices(capsys) -> None:
+    planner = _make_planner()
+
+    assert planner._validate_problem_indices(
+        {"groups": [{"problems": [0, 2]}, {"problems": [4]}]}, 5,
+    ) is False
+    assert "missing indices: {1, 3}" in capsys.readouterr().out
+    assert planner._validate_problem_indices(
+        {"groups": [{"problems": [2, 0]}, {"problems": [1]}]}, 3,
+    ) is True
+    assert planner._validate_problem_indices(
+        {"groups": [{"problems": [0, 3]}]}, 3,
+    ) is False
+
+
 def test_write_coordination_plan_prompt_writes_artifacts_and_refs(planspace) -> None:
     problems = [
         MisalignedProblem(section="01", description="drift", files=[]),
@@ -85,3 +100,19 @@ def test_write_coordination_plan_prompt_writes_artifacts_and_refs(planspace) ->
     assert "recurrence.json" in prompt
     assert "section-01-problem-frame.md" in prompt
     assert "interaction_type" in prompt
+
+
+def test_write_coordination_plan_prompt_reuses_persisted_problems(planspace) -> None:
+    problems = [
+        MisalignedProblem(section="01", description="drift", files=[]),
+    ]
+    problems_path = planspace / "artifacts" / "coordination" / "problems.json"
+    problems_path.write_text('["persisted"]\n', encoding="utf-8")
+
+    planner = _make_planner()
+    prompt_path = planner.write_coordination_plan_prompt(
+        problems, planspace, problems_persisted=True,
+    )
+
+    assert problems_path.read_text(encoding="utf-8") == '["persisted"]\n'
+    assert str(problems_path) in prompt_path.read_text(encoding="utf-8")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 
 from containers import Services
 from coordination.problem_types import MisalignedProblem, Problem
@@ -98,6 +100,168 @@ def test_collect_outstanding_problems_with_consequence_notes(planspace) -> None:
     assert p.section == "04"
 
 
+def test_collect_outstanding_problems_reads_each_ack_signal_once(planspace) -> None:
+    """Notes sharing a target reuse one ack read and are classified per note."""
+    section = Section(
+        number="04",
+        path=planspace / "artifacts" / "sections" / "section-04.md",
+        related_files=["src/handler.py"],
+    )
+    section.path.write_text("# Section 04\n", encoding="utf-8")
+
+    notes_dir = planspace / "artifacts" / "notes"
+    notes_dir.mkdir(parents=True, exist_ok=True)
+    for source, note_id in (("01", "note-a"), ("02", "note-b"), ("03", "note-c")):
+        (notes_dir / f"from-{source}-to-04.md").write_text(
+            f"**Note ID**: `{note_id}`\n\nDetails.\n", encoding="utf-8",
+        )
+    ack_path = PathRegistry(planspace).note_ack_signal("04")
+    ack_path.parent.mkdir(parents=True, exist_ok=True)
+    ack_path.write_text(
+        json.dumps({"acknowledged": [
+            {"note_id": "note-a", "action": "accepted"},
+            {"note_id": "note-b", "action": "rejected", "reason": "conflict"},
+        ]}),
+        encoding="utf-8",
+    )
+
+    signals = Services.signals()
+    reads: list[str] = []
+
+    class _CountingSignals:
+        def read(self, path):
+            reads.append(str(path))
+            return signals.read(path)
+
+    resolver = ProblemResolver(
+        artifact_io=Services.artifact_io(),
+        communicator=Services.communicator(),
+        logger=Services.logger(),
+        signals=_CountingSignals(),
+    )
+    problems = resolver.collect_outstanding_problems(
+        {"04": SectionResult(section_number="04", aligned=True)},
+        {"04": section},
+        planspace,
+    )
+
+    assert reads == [str(ack_path)]
+    assert sorted((p.type, p.note_id) for p in problems) == [
+        ("consequence_conflict", "note-b"),
+        ("unaddressed_note", "note-c"),
+    ]
+
+
+def test_collect_outstanding_problems_reuses_unchanged_acks_across_rounds(
+    planspace,
+) -> None:
+    """A later round rereads an ack signal only after it changes on disk."""
+    section = Section(
+        number="04",
+        path=planspace / "artifacts" / "sections" / "section-04.md",
+        related_files=["src/handler.py"],
+    )
+    section.path.write_text("# Section 04\n", encoding="utf-8")
+    notes_dir = planspace / "artifacts" / "notes"
+    notes_dir.mkdir(parents=True, exist_ok=True)
+    (notes_dir / "from-01-to-04.md").write_text(
+        "**Note ID**: `note-a`\n\nDetails.\n", encoding="utf-8",
+    )
+    ack_path = PathRegistry(planspace).note_ack_signal("04")
+    ack_path.parent.mkdir(parents=True, exist_ok=True)
+    ack_path.write_text(
+        json.dumps({"acknowledged": [{"note_id": "note-a", "action": "deferred"}]}),
+        encoding="utf-8",
+    )
+    # Settled outside the racy window, so its parsed acks may be cached.
+    os.utime(ack_path, ns=(0, 0))
+
+    signals = Services.signals()
+    reads: list[str] = []
+
+    class _CountingSignals:
+        def read(self, path):
+            reads.append(str(path))
+            return signals.read(path)
+
+    resolver = ProblemResolver(
+        artifact_io=Services.artifact_io(),
+        communicator=Services.communicator(),
+        logger=Services.logger(),
+        signals=_CountingSignals(),
+    )
+    args = (
+        {"04": SectionResult(section_number="04", aligned=True)},
+        {"04": section},
+        planspace,
+    )
+
+    first = resolver.collect_outstanding_problems(*args)
+    second = resolver.collect_outstanding_problems(*args)
+    assert len(reads) == 1
+    assert [p.type for p in first] == [p.type for p in second]
+
+    ack_path.write_text(
+        json.dumps({"acknowledged": [
+            {"note_id": "note-a", "action": "accepted", "reason": "resolved"},
+        ]}),
+        encoding="utf-8",
+    )
+    third = resolver.collect_outstanding_problems(*args)
+    assert len(reads) == 2
+    assert [p for p in third if getattr(p, "note_id", None) == "note-a"] == []
+
+
+def test_collect_outstanding_problems_rereads_acks_rewritten_in_racy_window(
+    planspace,
+) -> None:
+    """A same-size ack rewrite that keeps its mtime is still reread."""
+    section = Section(
+        number="04",
+        path=planspace / "artifacts" / "sections" / "section-04.md",
+        related_files=["src/handler.py"],
+    )
+    section.path.write_text("# Section 04\n", encoding="utf-8")
+    notes_dir = planspace / "artifacts" / "notes"
+    notes_dir.mkdir(parents=True, exist_ok=True)
+    (notes_dir / "from-01-to-04.md").write_text(
+        "**Note ID**: `note-a`\n\nDetails.\n", encoding="utf-8",
+    )
+    ack_path = PathRegistry(planspace).note_ack_signal("04")
+    ack_path.parent.mkdir(parents=True, exist_ok=True)
+    recent_ns = time.time_ns()
+
+    signals = Services.signals()
+    reads: list[str] = []
+
+    class _CountingSignals:
+        def read(self, path):
+            reads.append(str(path))
+            return signals.read(path)
+
+    resolver = ProblemResolver(
+        artifact_io=Services.artifact_io(),
+        communicator=Services.communicator(),
+        logger=Services.logger(),
+        signals=_CountingSignals(),
+    )
+    args = (
+        {"04": SectionResult(section_number="04", aligned=True)},
+        {"04": section},
+        planspace,
+    )
+
+    for action in ("deferred", "accepted"):
+        ack_path.write_text(
+            json.dumps({"acknowledged": [{"note_id": "note-a", "action": action}]}),
+            encoding="utf-8",
+        )
+        os.utime(ack_path, ns=(recent_ns, recent_ns))
+        resolver.collect_outstanding_problems(*args)
+
+    assert len(reads) == 2
+
+
 # ---------------------------------------------------------------------------
 # collect_outstanding_problems — scope deltas
 # ---------------------------------------------------------------------------
@@ -158,7 +158,7 @@ def test_scaffold_create_dispatches_scaffolder_agent(
         scaffold_calls.append(gid)
         return gid, ["stub/file.py"]
 
-    def _fake_fix(self, group, gid, ctx_, default_fix_model=""):
+    def _fake_fix(self, group, gid, ctx_, fix_model="", *args, **kwargs):
         fix_calls.append(gid)
         return gid, ["real/file.py"]
 
@@ -198,7 +198,7 @@ def test_seam_repair_dispatches_fixer(
     fix_calls: list[int] = []
     scaffold_calls: list[int] = []
 
-    def _fake_fix(self, group, gid, ctx_, default_fix_model=""):
+    def _fake_fix(self, group, gid, ctx_, fix_model="", *args, **kwargs):
         fix_calls.append(gid)
         return gid, ["src/api.py"]
 
@@ -247,7 +247,7 @@ def test_spec_ambiguity_writes_need_decision_and_skips_dispatch(
     fix_calls: list[int] = []
     scaffold_calls: list[int] = []
 
-    def _fake_fix(self, group, gid, ctx_, default_fix_model=""):
+    def _fake_fix(self, group, gid, ctx_, fix_model="", *args, **kwargs):
         fix_calls.append(gid)
         return gid, []
 
@@ -295,7 +295,7 @@ def test_spec_ambiguity_mixed_with_fixable_group(
 
     fix_calls: list[int] = []
 
-    def _fake_fix(self, group, gid, ctx_, default_fix_model=""):
+    def _fake_fix(self, group, gid, ctx_, fix_model="", *args, **kwargs):
         fix_calls.append(gid)
         return gid, ["src/a.py"]
 
@@ -338,7 +338,7 @@ def test_research_needed_submits_explore_task_and_skips_dispatch(
 
     fix_calls: list[int] = []
 
-    def _fake_fix(self, group, gid, ctx_, default_fix_model=""):
+    def _fake_fix(self, group, gid, ctx_, fix_model="", *args, **kwargs):
         fix_calls.append(gid)
         return gid, []
 
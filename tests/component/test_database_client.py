@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import sqlite3
+import subprocess
 from pathlib import Path
 
+import pytest
+
 from _paths import DB_SH
 from src.signals.service.database_client import DatabaseClient
 
@@ -28,6 +31,7 @@ def test_log_event_and_query_round_trip(tmp_path: Path) -> None:
     )
 
     assert logged.startswith("logged:")
+    assert logged.endswith(":summary:dispatch:01")
     rows = client.query(
         "summary",
         tag="dispatch:01",
@@ -67,3 +71,61 @@ def test_register_cleanup_and_unregister_append_status_rows(
     conn.close()
 
     assert [row[0] for row in rows] == ["running", "cleaned", "exited"]
+
+
+def test_log_events_keeps_supplied_timestamps(tmp_path: Path) -> None:
+    client, db_path = _init_client(tmp_path)
+    client.log_event("summary", "before", "via db.sh")
+
+    client.log_events([
+        ("2026-01-01T00:00:00.000", "lifecycle", "artifact:a", "created", "x"),
+        ("2026-01-01T00:00:01.000", "lifecycle", "artifact:b", "created", "x"),
+    ])
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT ts, tag FROM events WHERE kind = 'lifecycle' ORDER BY id ASC",
+    ).fetchall()
+    conn.close()
+
+    assert rows == [
+        ("2026-01-01T00:00:00.000", "artifact:a"),
+        ("2026-01-01T00:00:01.000", "artifact:b"),
+    ]
+
+
+def test_log_event_failure_follows_check_flag(tmp_path: Path) -> None:
+    client = DatabaseClient(DB_SH, tmp_path / "uninitialized.db")
+
+    assert client.log_event("summary", "tag", "body", check=False) == ""
+    with pytest.raises(subprocess.CalledProcessError):
+        client.log_event("summary", "tag", "body")
+
+
+def test_run_quiet_applies_command_without_capturing(tmp_path: Path) -> None:
+    client, db_path = _init_client(tmp_path)
+    client.register("worker-03")
+
+    assert client.run_quiet("cleanup", "worker-03") is None
+    client.run_quiet("unregister", "worker-03")
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT status FROM agents WHERE name = ? ORDER BY id ASC",
+        ("worker-03",),
+    ).fetchall()
+    conn.close()
+
+    assert [row[0] for row in rows] == ["running", "cleaned", "exited"]
+
+
+def test_send_many_delivers_messages_in_order(tmp_path: Path) -> None:
+    client, _ = _init_client(tmp_path)
+    client.register("worker-04")
+
+    client.send_many("worker-04", ["first", "second"], sender="loop")
+
+    received = [
+        client.recv("worker-04", timeout=1).stdout.strip() for _ in range(3)
+    ]
+    assert received == ["first", "second", "TIMEOUT"]
@@ -4,7 +4,11 @@ import json
 from pathlib import Path
 
 from containers import Services
-from src.orchestrator.repository.decisions import Decision, Decisions
+from src.orchestrator.repository.decisions import (
+    Decision,
+    Decisions,
+    list_section_decisions_md,
+)
 
 _decisions = Decisions(artifact_io=Services.artifact_io())
 
@@ -103,3 +107,16 @@ def test_load_decisions_filters_to_requested_section(tmp_path: Path) -> None:
     decisions = load_decisions(decisions_dir, section="02")
 
     assert [decision.id for decision in decisions] == ["d-02-001"]
+
+
+def test_list_section_decisions_md_matches_section_prefix(tmp_path: Path) -> None:
+    decisions_dir = tmp_path / "decisions"
+    decisions_dir.mkdir()
+    for name in ("section-02.md", "section-01-extra.md", "section-01.md",
+                 "section-01.json", "global.md"):
+        (decisions_dir / name).write_text(name, encoding="utf-8")
+
+    listed = list_section_decisions_md(decisions_dir, "01")
+
+    assert [path.name for path in listed] == ["section-01-extra.md", "section-01.md"]
+    assert list_section_decisions_md(tmp_path / "missing", "01") == []
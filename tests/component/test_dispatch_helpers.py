@@ -6,7 +6,11 @@ import json
 from pathlib import Path
 
 from containers import Services
-from dispatch.helpers.signal_checker import SignalChecker, summarize_output
+from dispatch.helpers.signal_checker import (
+    SignalChecker,
+    extract_fenced_block,
+    summarize_output,
+)
 
 
 def _checker() -> SignalChecker:
@@ -22,6 +26,12 @@ def test_summarize_output_prefers_summary_line() -> None:
     assert summarize_output(output) == "Important result"
 
 
+def test_summarize_output_matches_indented_case_insensitive_summary() -> None:
+    output = "intro line\n   SUMMARY:   indented result  \r\nmore"
+
+    assert summarize_output(output) == "indented result"
+
+
 def test_summarize_output_falls_back_and_truncates() -> None:
     summary = summarize_output("# H\n---\n" + ("x" * 300), max_len=50)
 
@@ -29,6 +39,29 @@ def test_summarize_output_falls_back_and_truncates() -> None:
     assert summary == "x" * 50
 
 
+def test_extract_fenced_block_skips_blocks_without_marker() -> None:
+    text = (
+        "```python\nprint('x')\n```\n"
+        "prose\n"
+        "  ```json\n{\n  \"groups\": []\n}\n  ```\n"
+    )
+
+    assert extract_fenced_block(text, '"groups"') == '{\n  "groups": []\n}'
+    assert extract_fenced_block(text, "missing") is None
+    assert extract_fenced_block("```\n\"groups\"\n", '"groups"') is None
+
+
+def test_extract_fenced_block_returns_first_match_and_ignores_unfenced_marker() -> None:
+    text = (
+        "```json\n{\"groups\": [1]}\n```\n"
+        "```json\n{\"groups\": [2]}\n```\n"
+    )
+    assert extract_fenced_block(text, '"groups"') == '{"groups": [1]}'
+
+    trailing = "```\nno marker\n```\nthen \"groups\" in prose\n```\nlater\n```\n"
+    assert extract_fenced_block(trailing, '"groups"') is None
+
+
 def test_write_model_choice_signal_writes_structured_artifact(planspace: Path) -> None:
     _checker().write_model_choice_signal(
         planspace,
@@ -5,7 +5,14 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 
-from src.staleness.helpers.content_hasher import content_hash, file_hash, fingerprint
+import pytest
+
+from src.staleness.helpers.content_hasher import (
+    StreamingHasher,
+    content_hash,
+    file_hash,
+    fingerprint,
+)
 
 
 class TestFileHash:
@@ -52,6 +59,28 @@ class TestContentHash:
         assert content_hash(text) == content_hash(text.encode("utf-8"))
 
 
+class TestStreamingHasher:
+    """Tests for StreamingHasher."""
+
+    def test_matches_content_hash_of_joined_parts(self, tmp_path: Path) -> None:
+        big = tmp_path / "big.bin"
+        big_data = bytes(range(256)) * 1024
+        big.write_bytes(big_data)
+        small = tmp_path / "small.txt"
+        small.write_bytes(b"small")
+
+        hasher = StreamingHasher()
+        hasher.update(b"prefix")
+        hasher.update_file(big)
+        hasher.update_file(small)
+
+        assert hasher.hexdigest() == content_hash(b"prefix" + big_data + b"small")
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            StreamingHasher().update_file(tmp_path / "missing")
+
+
 class TestFingerprint:
     """Tests for fingerprint()."""
 
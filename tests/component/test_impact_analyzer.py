@@ -79,7 +79,7 @@ def test_analyze_impacts_parses_material_impacts_from_primary_output(
     ]
 
     monkeypatch.setattr(Services.logger(), "log", lambda _msg: None)
-    monkeypatch.setattr(impact_analyzer.subprocess, "run", lambda *args, **kwargs: None)
+    monkeypatch.setattr(impact_analyzer.DatabaseClient, "log_event", lambda *args, **kwargs: "")
 
     class _NoopContext(ContextAssemblyService):
         def materialize_context_sidecar(self, *_args, **_kwargs):
@@ -130,7 +130,7 @@ def test_analyze_impacts_falls_back_to_normalizer_when_primary_is_invalid(
     ]
 
     monkeypatch.setattr(Services.logger(), "log", lambda _msg: None)
-    monkeypatch.setattr(impact_analyzer.subprocess, "run", lambda *args, **kwargs: None)
+    monkeypatch.setattr(impact_analyzer.DatabaseClient, "log_event", lambda *args, **kwargs: "")
 
     class _NoopContext(ContextAssemblyService):
         def materialize_context_sidecar(self, *_args, **_kwargs):
@@ -162,3 +162,33 @@ def test_analyze_impacts_falls_back_to_normalizer_when_primary_is_invalid(
         Services.dispatcher.reset_override()
         Services.prompt_guard.reset_override()
         Services.context_assembly.reset_override()
+
+
+def test_parse_material_impacts_skips_fences_without_marker() -> None:
+    output = (
+        "Reasoning:\n"
+        "```python\nprint('no marker here')\n```\n"
+        "```json\n"
+        '{"impacts": [{"to": "2", "impact": "MATERIAL", "reason": "api",'
+        ' "contract_risk": true},'
+        ' {"to": "3", "impact": "NO_IMPACT"}]}\n'
+        "```\n"
+    )
+
+    impacts = impact_analyzer._parse_material_impacts(output, {2: "02", 3: "03"})
+
+    assert impacts == [("02", "api", True, "")]
+
+
+def test_parse_material_impacts_decodes_unfenced_json_amid_prose() -> None:
+    output = (
+        "Checked {all} sections.\n"
+        '{"summary": "done"}\n'
+        '{"impacts": [{"to": "3", "impact": "MATERIAL", "reason": "schema"}]}\n'
+        "Trailing note with a stray } brace."
+    )
+
+    impacts = impact_analyzer._parse_material_impacts(output, {3: "03"})
+
+    assert impacts == [("03", "schema", False, "")]
+    assert impact_analyzer._parse_material_impacts("{no json}", {}) is None
@@ -228,3 +228,20 @@ def test_run_implementation_loop_returns_result_on_alignment_problems(
         Services.flow_ingestion.reset_override()
         Services.section_alignment.reset_override()
         Services.policies.reset_override()
+
+
+def test_existing_paths_batches_shared_parents(tmp_path: Path) -> None:
+    from implementation.service.change_verifier import _existing_paths
+
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "a.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "pkg" / "b.py").write_text("", encoding="utf-8")
+    (tmp_path / "top.py").write_text("", encoding="utf-8")
+    (tmp_path / "src" / "pkg" / "dangling").symlink_to(tmp_path / "nope")
+
+    present = _existing_paths(str(tmp_path), [
+        "src/pkg/a.py", "src/pkg/b.py", "src/pkg/c.py", "src/pkg/dangling",
+        "top.py", "gone/x.py", "gone/y.py",
+    ])
+
+    assert present == {"src/pkg/a.py", "src/pkg/b.py", "top.py"}
@@ -116,3 +116,35 @@ def test_run_microstrategy_retries_with_escalation_and_returns_path(
         Services.dispatcher.reset_override()
         Services.prompt_guard.reset_override()
         Services.flow_ingestion.reset_override()
+
+
+def test_extract_todos_from_files_skips_files_without_markers(tmp_path: Path) -> None:
+    from implementation.service.microstrategy_decider import extract_todos_from_files
+
+    (tmp_path / "plain.py").write_text("todo = 1\n", encoding="utf-8")
+    (tmp_path / "binary.bin").write_bytes(b"\xff\xfe no markers")
+    (tmp_path / "work.py").write_text(
+        "a = 1\r\n# TODO: split this\r\nb = 2\r\n", encoding="utf-8",
+    )
+
+    result = extract_todos_from_files(
+        tmp_path, ["plain.py", "binary.bin", "missing.py", "work.py"],
+    )
+
+    assert "### work.py" in result
+    assert "**Line 2**: `# TODO: split this`" in result
+    assert "  3: b = 2" in result
+    assert "plain.py" not in result
+
+
+def test_extract_todos_from_files_keeps_non_utf8_files(tmp_path: Path) -> None:
+    from implementation.service.microstrategy_decider import extract_todos_from_files
+
+    (tmp_path / "legacy.c").write_bytes(
+        b"/* caf\xe9 */\n// TODO: handle latin-1\nint x;\n",
+    )
+
+    result = extract_todos_from_files(tmp_path, ["legacy.c"])
+
+    assert "**Line 2**: `// TODO: handle latin-1`" in result
+    assert "  1: /* caf� */" in result
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
+import pytest
+
 from src.orchestrator.path_registry import PathRegistry
+from src.coordination.repository import notes as notes_module
 from src.coordination.repository.notes import (
+    index_notes_by_target,
+    list_notes_to,
     read_incoming_notes,
     write_consequence_note,
 )
@@ -23,6 +30,67 @@ def test_read_incoming_notes_returns_sorted_note_records(tmp_path: Path) -> None
     assert [note["content"] for note in notes] == ["first", "second"]
 
 
+def test_index_notes_by_target_matches_per_section_listing(tmp_path: Path) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    paths = PathRegistry(planspace)
+    paths.ensure_artifacts_tree()
+    notes_dir = planspace / "artifacts" / "notes"
+    for name in (
+        "from-02-to-01.md",
+        "from-bridge-03-to-01.md",
+        "from-01-to-02.md",
+        "from-01-to-12.md",
+        "from-to-01.md",
+        "notes.md",
+    ):
+        (notes_dir / name).write_text(name)
+
+    index = index_notes_by_target(paths)
+
+    assert sorted(index) == ["01", "02", "12"]
+    for target in ("01", "02", "12"):
+        assert index[target] == list_notes_to(paths, target)
+    assert [p.name for p in index["01"]] == ["from-02-to-01.md", "from-bridge-03-to-01.md"]
+    assert read_incoming_notes(planspace, "01", index) == read_incoming_notes(planspace, "01")
+
+
+def test_index_notes_by_target_without_notes_dir(tmp_path: Path) -> None:
+    paths = PathRegistry(tmp_path / "missing")
+
+    assert index_notes_by_target(paths) == {}
+    assert list_notes_to(paths, "01") == []
+
+
+def test_list_notes_to_reuses_listing_until_notes_dir_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    paths = PathRegistry(planspace)
+    paths.ensure_artifacts_tree()
+    notes_dir = planspace / "artifacts" / "notes"
+    (notes_dir / "from-02-to-01.md").write_text("first")
+    aged = time.time_ns() - 10_000_000_000
+    os.utime(notes_dir, ns=(aged, aged))
+    assert [p.name for p in list_notes_to(paths, "01")] == ["from-02-to-01.md"]
+
+    def _no_scan(path):
+        raise AssertionError(f"unexpected rescan of {path}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(notes_module.os, "scandir", _no_scan)
+        assert [p.name for p in list_notes_to(paths, "01")] == ["from-02-to-01.md"]
+        assert list(index_notes_by_target(paths)) == ["01"]
+
+    (notes_dir / "from-03-to-01.md").write_text("second")
+
+    assert [p.name for p in list_notes_to(paths, "01")] == [
+        "from-02-to-01.md",
+        "from-03-to-01.md",
+    ]
+
+
 def test_write_consequence_note_creates_expected_path(tmp_path: Path) -> None:
     planspace = tmp_path / "planspace"
     planspace.mkdir()
@@ -388,3 +388,9 @@ class TestComposabilityAndIsolation:
     def test_artifacts_is_child_of_planspace(self, tmp_path: Path) -> None:
         reg = PathRegistry(tmp_path)
         assert reg.artifacts.parent == reg.planspace
+
+    def test_directory_accessors_reuse_their_path(self, tmp_path: Path) -> None:
+        reg = PathRegistry(tmp_path)
+
+        assert reg.sections_dir() is reg.sections_dir()
+        assert PathRegistry(tmp_path).sections_dir() == reg.sections_dir()
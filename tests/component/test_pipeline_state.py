@@ -58,6 +58,15 @@ def test_check_pipeline_state_reads_latest_logged_value(tmp_path: Path) -> None:
     assert check_pipeline_state(planspace, db_sh=DB_SH) == "paused"
 
 
+def test_check_pipeline_state_prefers_newest_event(tmp_path: Path) -> None:
+    planspace, client = _db(tmp_path)
+    for state in ("paused", "running", "paused|drain"):
+        client.log_event("lifecycle", "pipeline-state", state, check=False)
+    client.log_event("lifecycle", "other-tag", "running", check=False)
+
+    assert check_pipeline_state(planspace, db_sh=DB_SH) == "paused|drain"
+
+
 def test_wait_if_paused_replays_buffered_messages_after_resume(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -89,6 +98,44 @@ def test_wait_if_paused_replays_buffered_messages_after_resume(
     assert replayed == ["resume:now"]
 
 
+def test_wait_if_paused_backs_off_between_timeouts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    planspace, _client = _db(tmp_path)
+    replies = iter(["TIMEOUT"] * 6 + ["note"] + ["TIMEOUT"])
+    timeouts: list[int] = []
+
+    class _Mailbox:
+        def recv(self, timeout: int = 0) -> str:
+            timeouts.append(timeout)
+            return next(replies)
+
+        def send(self, _target: str, _message: str) -> None:
+            pass
+
+        def send_many(self, _target: str, _messages: list[str]) -> None:
+            pass
+
+    monkeypatch.setattr(
+        pipeline_state.MailboxService,
+        "for_planspace",
+        lambda *_args, **_kwargs: _Mailbox(),
+    )
+    states = iter(["paused"] * 9 + ["running"])
+    monkeypatch.setattr(
+        pipeline_state,
+        "check_pipeline_state",
+        lambda _planspace, *, db_sh: next(states),
+    )
+
+    _make_pipeline_state().wait_if_paused(
+        planspace, "parent", db_sh=DB_SH, agent_name="section-loop",
+    )
+
+    assert timeouts == [1, 2, 4, 8, 16, 30, 30, 1]
+
+
 def test_pause_for_parent_consumes_alignment_changed_before_resume(
     tmp_path: Path,
 ) -> None:
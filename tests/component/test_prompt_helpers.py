@@ -33,6 +33,18 @@ def test_agent_mail_instructions_contains_db_send_command(tmp_path: Path) -> Non
     assert "impl-01-monitor" in instructions
 
 
+def test_agent_mail_instructions_reuses_rendered_block(tmp_path: Path) -> None:
+    formatters = PromptFormatters(config=Services.config())
+
+    first = formatters.agent_mail_instructions(tmp_path, "impl-01", "impl-01-monitor")
+    again = formatters.agent_mail_instructions(tmp_path, "impl-01", "impl-01-monitor")
+    other = formatters.agent_mail_instructions(tmp_path, "impl-02", "impl-02-monitor")
+
+    assert again is first
+    assert "impl-02-monitor" in other
+    assert "impl-01" not in other
+
+
 def test_format_existing_file_listing_skips_missing_paths(tmp_path: Path) -> None:
     codespace = tmp_path / "codespace"
     codespace.mkdir()
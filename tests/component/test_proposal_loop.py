@@ -360,3 +360,34 @@ def test_proposal_loop_single_shot_dispatches_once(
         Services.dispatcher.reset_override()
         Services.flow_ingestion.reset_override()
         Services.section_alignment.reset_override()
+
+
+def test_handle_pause_response_requires_exact_resume_command(
+    tmp_path: Path,
+) -> None:
+    from proposal.service.cycle_control import CycleControl
+
+    persisted: list[str] = []
+
+    class _CapturingCrossSection(CrossSectionService):
+        def persist_decision(self, _planspace, _section_number, payload):
+            persisted.append(payload)
+
+    control = CycleControl(
+        logger=Services.logger(),
+        artifact_io=Services.artifact_io(),
+        communicator=Services.communicator(),
+        pipeline_control=Services.pipeline_control(),
+        cross_section=_CapturingCrossSection(),
+        dispatcher=Services.dispatcher(),
+        dispatch_helpers=Services.dispatch_helpers(),
+        task_router=Services.task_router(),
+        flow_ingestion=Services.flow_ingestion(),
+    )
+
+    assert control.handle_pause_response(tmp_path, "01", "resumed") == "abort"
+    assert control.handle_pause_response(tmp_path, "01", "resume") == "continue"
+    assert control.handle_pause_response(
+        tmp_path, "01", "resume: keep going",
+    ) == "continue"
+    assert persisted == ["keep going"]
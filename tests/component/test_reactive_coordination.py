@@ -324,6 +324,16 @@ class TestConsequenceCascadeBounding:
         )
         assert "**Consequence Depth**: `1`" in note
 
+    def test_build_note_with_preformatted_file_changes(self) -> None:
+        """A pre-formatted file list yields the same note as the raw list."""
+        args = (
+            "01", "05", "API changed", None, "note-id-123",
+            "auth module", ["api.py", "db.py"], Path("/tmp/planspace"),
+        )
+        assert _build_consequence_note(
+            *args, file_changes="- `api.py`\n- `db.py`",
+        ) == _build_consequence_note(*args)
+
     def test_no_hardcoded_depth_cap(self) -> None:
         """Consequence depth is tracked but not mechanically capped."""
         # Depth metadata is included in notes for agent observability
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from orchestrator.types import Section
@@ -30,6 +31,33 @@ def test_extract_section_summary_falls_back_to_first_content_line(
     assert extract_section_summary(section_path) == "Handle user login."
 
 
+def test_extract_section_summary_rereads_after_file_changes(
+    tmp_path: Path,
+) -> None:
+    section_path = tmp_path / "section.md"
+    section_path.write_text("First summary.\n", encoding="utf-8")
+    assert extract_section_summary(section_path) == "First summary."
+
+    section_path.write_text("Second, longer summary.\n", encoding="utf-8")
+
+    assert extract_section_summary(section_path) == "Second, longer summary."
+
+
+def test_extract_section_summary_rereads_same_size_rewrite(
+    tmp_path: Path,
+) -> None:
+    section_path = tmp_path / "section.md"
+    section_path.write_text("First summary.\n", encoding="utf-8")
+    first_mtime_ns = section_path.stat().st_mtime_ns
+    assert extract_section_summary(section_path) == "First summary."
+
+    # Same size and, as within one mtime tick, the same mtime.
+    section_path.write_text("Other summary.\n", encoding="utf-8")
+    os.utime(section_path, ns=(first_mtime_ns, first_mtime_ns))
+
+    assert extract_section_summary(section_path) == "Other summary."
+
+
 def test_section_number_helpers_normalize_to_canonical_form(tmp_path: Path) -> None:
     sections = [
         Section(number="01", path=tmp_path / "section-01.md"),
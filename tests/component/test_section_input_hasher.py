@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
+import pytest
+
+from src.staleness.helpers.content_hasher import content_hash
+from src.staleness.service import input_hasher
 from src.staleness.service.input_hasher import (
     coordination_recheck_hash,
+    read_modified_contents,
     section_inputs_hash,
 )
 from src.orchestrator.types import Section
@@ -128,6 +135,53 @@ class TestSectionInputsHash:
 
         assert h1 != h2
 
+    def test_unchanged_settled_inputs_skip_rereading(
+        self,
+        planspace: Path,
+        codespace: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        sections = self._make_sections_by_num(planspace)
+        problem_frame = (
+            planspace / "artifacts" / "sections" / "section-01-problem-frame.md"
+        )
+        problem_frame.write_text("frame", encoding="utf-8")
+        settled = time.time() - 3600
+        for path in planspace.rglob("*"):
+            os.utime(path, (settled, settled))
+
+        h1 = section_inputs_hash("01", planspace, sections)
+
+        def _no_reads(self, path):
+            raise AssertionError(f"re-read {path}")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(input_hasher.StreamingHasher, "update_file", _no_reads)
+            assert section_inputs_hash("01", planspace, sections) == h1
+
+        problem_frame.write_text("frame, revised", encoding="utf-8")
+        os.utime(problem_frame, (settled, settled))
+        assert section_inputs_hash("01", planspace, sections) != h1
+
+    def test_recently_modified_inputs_are_not_cached(
+        self,
+        planspace: Path,
+        codespace: Path,
+    ) -> None:
+        sections = self._make_sections_by_num(planspace)
+        problem_frame = (
+            planspace / "artifacts" / "sections" / "section-01-problem-frame.md"
+        )
+        problem_frame.write_text("frame", encoding="utf-8")
+        mtime_ns = problem_frame.stat().st_mtime_ns
+
+        h1 = section_inputs_hash("01", planspace, sections)
+        # Same size and mtime: only re-reading can see this edit.
+        problem_frame.write_text("FRAME", encoding="utf-8")
+        os.utime(problem_frame, ns=(mtime_ns, mtime_ns))
+
+        assert section_inputs_hash("01", planspace, sections) != h1
+
 
 class TestCoordinationRecheckHash:
     def test_includes_modified_files(self, planspace: Path, codespace: Path) -> None:
@@ -158,3 +212,34 @@ class TestCoordinationRecheckHash:
         )
 
         assert h1 != h2
+
+    def test_shared_modified_contents_match_per_call_read(
+        self, planspace: Path, codespace: Path,
+    ) -> None:
+        sections = {
+            "01": Section(
+                number="01",
+                path=planspace / "artifacts" / "sections" / "section-01.md",
+            ),
+        }
+        for name, body in (("a.py", "A = 1\n"), ("b.py", "B = 2\n")):
+            path = codespace / "src" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(body, encoding="utf-8")
+        modified = ["src/b.py", "src/a.py", "src/missing.py"]
+
+        shared = read_modified_contents(codespace, modified)
+        # Same value as hashing base + sorted file bytes, so persisted
+        # inputs-hashes from earlier rounds stay comparable.
+        expected = content_hash(
+            section_inputs_hash("01", planspace, sections).encode("utf-8")
+            + b"A = 1\nB = 2\n",
+        )
+
+        assert coordination_recheck_hash(
+            "01", planspace, codespace, sections, modified,
+            modified_contents=shared,
+        ) == expected
+        assert coordination_recheck_hash(
+            "01", planspace, codespace, sections, modified,
+        ) == expected
@@ -86,6 +86,26 @@ def test_read_incoming_notes_filters_resolved_notes_and_includes_diff(
     assert "+new line" in notes
 
 
+def test_build_source_diffs_only_diffs_snapshotted_related_files(
+    tmp_path: Path,
+) -> None:
+    planspace, codespace, section = _make_section(tmp_path)
+    section.related_files = ["./src/app.py", "src/other.py"]
+    paths = PathRegistry(planspace)
+    snapshot_dir = paths.snapshot_section("02")
+    (snapshot_dir / "src").mkdir(parents=True)
+    (snapshot_dir / "src" / "app.py").write_text("old\n", encoding="utf-8")
+    (codespace / "src").mkdir(parents=True)
+    (codespace / "src" / "app.py").write_text("new\n", encoding="utf-8")
+    (codespace / "src" / "other.py").write_text("unsnapshotted\n", encoding="utf-8")
+
+    diffs = section_notes._build_source_diffs("02", section, paths, codespace)
+
+    assert "### Diff: `./src/app.py`" in diffs
+    assert "other.py" not in diffs
+    assert section_notes._build_source_diffs("03", section, paths, codespace) is None
+
+
 def test_read_incoming_notes_renames_malformed_ack_file(
     tmp_path: Path,
 ) -> None:
@@ -160,3 +180,20 @@ def test_post_section_completion_writes_note_and_contract_artifact(
         assert flag_calls == [planspace]
     finally:
         Services.change_tracker.reset_override()
+
+
+def test_read_incoming_depth_takes_max_over_marked_notes(tmp_path: Path) -> None:
+    planspace, _codespace, _section = _make_section(tmp_path)
+    notes_dir = planspace / "artifacts" / "notes"
+    (notes_dir / "from-02-to-01.md").write_text(
+        "# Note\n**Consequence Depth**: `2`\n", encoding="utf-8",
+    )
+    (notes_dir / "from-03-to-01.md").write_text("# Legacy note\n", encoding="utf-8")
+    (notes_dir / "from-04-to-01.md").write_text(
+        "**Consequence Depth**: `4`\n", encoding="utf-8",
+    )
+
+    handler = _make_completion_handler()
+
+    assert handler._read_incoming_depth(planspace, "01") == 4
+    assert handler._read_incoming_depth(planspace, "09") == 0
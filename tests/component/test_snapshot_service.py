@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import time
+
+from src.implementation.service import file_snapshotter
 from src.implementation.service.file_snapshotter import (
     compute_text_diff,
     snapshot_modified_files,
@@ -28,6 +32,29 @@ def test_snapshot_modified_files_copies_nested_paths(tmp_path) -> None:
     copied = snapshot_dir / "pkg" / "module.py"
     assert copied.exists()
     assert copied.read_text(encoding="utf-8") == "print('ok')\n"
+    assert copied.stat().st_mtime_ns == nested.stat().st_mtime_ns
+
+
+def test_snapshot_modified_files_copies_many_files(tmp_path) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    PathRegistry(planspace).ensure_artifacts_tree()
+    codespace = tmp_path / "codespace"
+    rel_paths = [f"pkg/mod{i % 3}/file{i}.py" for i in range(20)]
+    for i, rel_path in enumerate(rel_paths):
+        path = codespace / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"value = {i}\n", encoding="utf-8")
+
+    snapshot_dir = snapshot_modified_files(
+        planspace, "08", codespace, [*rel_paths, "pkg/missing.py"],
+    )
+
+    for i, rel_path in enumerate(rel_paths):
+        assert (snapshot_dir / rel_path).read_text(encoding="utf-8") == (
+            f"value = {i}\n"
+        )
+    assert not (snapshot_dir / "pkg" / "missing.py").exists()
 
 
 def test_snapshot_modified_files_skips_escaping_paths_and_warns(tmp_path) -> None:
@@ -51,6 +78,35 @@ def test_snapshot_modified_files_skips_escaping_paths_and_warns(tmp_path) -> Non
     assert list(snapshot_dir.rglob("*")) == []
 
 
+def test_snapshot_modified_files_skips_symlinks_out_of_codespace(tmp_path) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    PathRegistry(planspace).ensure_artifacts_tree()
+    codespace = tmp_path / "codespace"
+    (codespace / "pkg").mkdir(parents=True)
+    (codespace / "pkg" / "kept.py").write_text("kept\n", encoding="utf-8")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "secret.txt").write_text("secret\n", encoding="utf-8")
+    (codespace / "pkg" / "leak.txt").symlink_to(outside / "secret.txt")
+    (codespace / "linked").symlink_to(outside)
+
+    warnings: list[str] = []
+    snapshot_dir = snapshot_modified_files(
+        planspace,
+        "04",
+        codespace,
+        ["pkg/kept.py", "pkg/leak.txt", "linked/secret.txt"],
+        warn=warnings.append,
+    )
+
+    assert warnings == [
+        "snapshot path escapes codespace, skipping: pkg/leak.txt",
+        "snapshot path escapes codespace, skipping: linked/secret.txt",
+    ]
+    assert sorted(p.name for p in snapshot_dir.rglob("*")) == ["kept.py", "pkg"]
+
+
 def test_compute_text_diff_returns_empty_when_both_missing(tmp_path) -> None:
     assert compute_text_diff(tmp_path / "a.txt", tmp_path / "b.txt") == ""
 
@@ -65,3 +121,51 @@ def test_compute_text_diff_returns_unified_diff_for_changes(tmp_path) -> None:
 
     assert "-line two" in diff
     assert "+line three" in diff
+
+
+def test_compute_text_diff_reuses_hunks_with_per_call_labels(tmp_path) -> None:
+    current = tmp_path / "current.txt"
+    current.write_text("line one\nline three\n", encoding="utf-8")
+    snapshots = []
+    for name in ("snap-a.txt", "snap-b.txt"):
+        snapshot = tmp_path / name
+        snapshot.write_text("line one\nline two\n", encoding="utf-8")
+        snapshots.append(snapshot)
+
+    first, second = (compute_text_diff(s, current) for s in snapshots)
+
+    assert first.startswith(f"--- {snapshots[0]}\n+++ {current}\n")
+    assert second.startswith(f"--- {snapshots[1]}\n+++ {current}\n")
+    assert first.split("\n")[2:] == second.split("\n")[2:]
+
+
+def test_compute_text_diff_ignores_line_ending_only_changes(tmp_path) -> None:
+    old = tmp_path / "old.txt"
+    new = tmp_path / "new.txt"
+    old.write_bytes(b"line one\r\nline two\r\n")
+    new.write_bytes(b"line one\nline two\n")
+
+    assert compute_text_diff(old, new) == ""
+
+
+def test_compute_text_diff_answers_settled_repeats_from_stats(
+    tmp_path, monkeypatch,
+) -> None:
+    old = tmp_path / "old.txt"
+    new = tmp_path / "new.txt"
+    same = tmp_path / "same.txt"
+    old.write_text("line one\nline two\n", encoding="utf-8")
+    new.write_text("line one\nline three\n", encoding="utf-8")
+    same.write_text("line one\nline two\n", encoding="utf-8")
+    settled = time.time() - 3600
+    for path in (old, new, same):
+        os.utime(path, (settled, settled))
+    first = compute_text_diff(old, new)
+    assert compute_text_diff(old, same) == ""
+
+    def _no_reads(path):
+        raise AssertionError(f"re-read {path}")
+
+    monkeypatch.setattr(file_snapshotter, "_read_bytes", _no_reads)
+    assert compute_text_diff(old, new) == first
+    assert compute_text_diff(old, same) == ""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -10,7 +11,11 @@ from containers import Services
 from orchestrator.path_registry import PathRegistry
 from tests.conftest import WritingGuard, make_dispatcher, StubPolicies
 
-from dispatch.service.tool_surface_writer import ToolSurfaceWriter, write_tool_surface
+from dispatch.service.tool_surface_writer import (
+    ToolSurfaceWriter,
+    load_registry_tools,
+    write_tool_surface,
+)
 from dispatch.service.tool_validator import ToolValidator
 from dispatch.service.tool_bridge import ToolBridge
 
@@ -69,6 +74,64 @@ def test_write_tool_surface_filters_cross_section_and_local_tools(tmp_path) -> N
     assert "tools/c.py" not in content
 
 
+def test_surface_tool_registry_parses_registry_once_across_sections(tmp_path) -> None:
+    planspace = tmp_path / "planspace"
+    planspace.mkdir()
+    paths = PathRegistry(planspace)
+    paths.ensure_artifacts_tree()
+    paths.tool_registry().write_text(
+        json.dumps(
+            {
+                "tools": [
+                    {"path": "tools/a.py", "scope": "cross-section", "created_by": "section-02"},
+                    {"path": "tools/b.py", "scope": "section-local", "created_by": "section-03"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    # Outside the racy window, so the parsed registry may be cached.
+    os.utime(paths.tool_registry(), ns=(0, 0))
+    artifact_io = MagicMock(wraps=Services.artifact_io())
+    writer = ToolSurfaceWriter(
+        artifact_io=artifact_io,
+        logger=MagicMock(),
+        policies=Services.policies(),
+        prompt_guard=Services.prompt_guard(),
+        dispatcher=Services.dispatcher(),
+        task_router=Services.task_router(),
+    )
+
+    for section_number in ("02", "03"):
+        assert writer.surface_tool_registry(
+            section_number=section_number,
+            planspace=planspace,
+            codespace=tmp_path / "codespace",
+        ) == 2
+
+    assert artifact_io.read_json.call_count == 1
+    cached_tools, _index = load_registry_tools(artifact_io, paths.tool_registry())
+    cached_tools.clear()
+    assert len(load_registry_tools(artifact_io, paths.tool_registry())[0]) == 2
+    assert "tools/b.py" not in paths.tools_available("02").read_text(encoding="utf-8")
+    surface = paths.tools_available("03").read_text(encoding="utf-8")
+    assert surface.index("tools/a.py") < surface.index("tools/b.py")
+
+
+def test_load_registry_tools_rereads_freshly_modified_registry(tmp_path) -> None:
+    registry_path = tmp_path / "tool-registry.json"
+    registry_path.write_text(json.dumps([{"path": "tools/a.py"}]), encoding="utf-8")
+    artifact_io = Services.artifact_io()
+
+    first, _index = load_registry_tools(artifact_io, registry_path)
+    # Same size, rewritten within the racy window.
+    registry_path.write_text(json.dumps([{"path": "tools/b.py"}]), encoding="utf-8")
+    second, _index = load_registry_tools(artifact_io, registry_path)
+
+    assert first == [{"path": "tools/a.py"}]
+    assert second == [{"path": "tools/b.py"}]
+
+
 def test_surface_tool_registry_repairs_malformed_registry(tmp_path) -> None:
     planspace = tmp_path / "planspace"
     planspace.mkdir()
@@ -174,3 +174,56 @@ def test_code_fence_without_frame_ok_ignored():
     result = parse_alignment_verdict(output)
 
     assert result is None
+
+
+def test_first_verdict_in_document_order_wins():
+    """A multi-line fenced verdict before a single-line one is chosen."""
+    output = (
+        "```json\n"
+        "{\n"
+        '  "frame_ok": true,\n'
+        '  "aligned": false,\n'
+        '  "problems": ["fenced"]\n'
+        "}\n"
+        "```\n"
+        '{"frame_ok": true, "aligned": true, "problems": []}\n'
+    )
+
+    result = parse_alignment_verdict(output)
+
+    assert result is not None
+    assert result["problems"] == ["fenced"]
+
+
+def test_nested_frame_ok_inside_unrelated_object_is_ignored():
+    """Only top-level objects carrying frame_ok count as verdicts."""
+    output = '{"meta": {"frame_ok": true}}\n'
+
+    assert parse_alignment_verdict(output) is None
+
+
+def test_malformed_brace_before_verdict_is_skipped():
+    """A stray brace that is not JSON does not hide a later verdict."""
+    output = (
+        "Note: {frame_ok is required}\n"
+        '{"frame_ok": false, "aligned": false, "problems": ["bad frame"]}\n'
+    )
+
+    result = parse_alignment_verdict(output)
+
+    assert result is not None
+    assert result["frame_ok"] is False
+
+
+def test_output_without_frame_ok_is_never_decoded(monkeypatch):
+    """Outputs lacking the key short-circuit before any JSON decoding."""
+    import src.staleness.helpers.verdict_parsers as parsers
+
+    class _ExplodingDecoder:
+        def raw_decode(self, *_args, **_kwargs):
+            raise AssertionError("decoder should not run")
+
+    monkeypatch.setattr(parsers, "_DECODER", _ExplodingDecoder())
+    output = '{"aligned": true, "problems": []}\n' * 1000
+
+    assert parsers.parse_alignment_verdict(output) is None
@@ -215,6 +215,9 @@ class NoOpCommunicator(Communicator):
     def record_traceability(self, planspace, section_number, file_path, source, category=""):
         pass
 
+    def record_traceability_many(self, planspace, section_number, file_paths, source, category=""):
+        pass
+
 
 class CapturingCommunicator(Communicator):
     """Test double that captures all communication calls for assertions."""
@@ -238,6 +241,10 @@ class CapturingCommunicator(Communicator):
     def record_traceability(self, planspace, section_number, file_path, source, category=""):
         self.traceability_calls.append((planspace, section_number, file_path, source, category))
 
+    def record_traceability_many(self, planspace, section_number, file_paths, source, category=""):
+        for file_path in file_paths:
+            self.record_traceability(planspace, section_number, file_path, source, category)
+
 
 @pytest.fixture()
 def noop_communicator():
@@ -288,9 +295,12 @@ class NoOpPipelineControl(PipelineControlService):
     def section_inputs_hash(self, section_number, planspace, *args) -> str:
         return "noop-hash"
 
-    def coordination_recheck_hash(self, sec_num, planspace, codespace, *args) -> str:
+    def coordination_recheck_hash(self, sec_num, planspace, codespace, *args, **kwargs) -> str:
         return "noop-hash"
 
+    def read_modified_contents(self, codespace, modified_files) -> bytes:
+        return b""
+
 
 class CapturingPipelineControl(PipelineControlService):
     """Test double that captures pipeline control calls for assertions."""
@@ -345,9 +355,12 @@ class CapturingPipelineControl(PipelineControlService):
     def section_inputs_hash(self, section_number, planspace, *args) -> str:
         return self._section_inputs_hash_return
 
-    def coordination_recheck_hash(self, sec_num, planspace, codespace, *args) -> str:
+    def coordination_recheck_hash(self, sec_num, planspace, codespace, *args, **kwargs) -> str:
         return self._coordination_recheck_hash_return
 
+    def read_modified_contents(self, codespace, modified_files) -> bytes:
+        return b""
+
 
 @pytest.fixture()
 def noop_pipeline_control():
@@ -72,6 +72,30 @@ def dispatch_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     return tmp_path
 
 
+def _fake_popen(
+    *, stdout: str = "", stderr: str = "", returncode: int = 0,
+    timeout: bool = False,
+):
+    """Build a ``subprocess.Popen`` stand-in for the agent executor."""
+
+    def _popen(cmd, **_kwargs):
+        # The first wait times out; the wait after killpg returns.
+        pending_timeout = [timeout]
+
+        def communicate(timeout=None):
+            if pending_timeout[0]:
+                pending_timeout[0] = False
+                raise subprocess.TimeoutExpired(cmd="agents", timeout=600)
+            return stdout, stderr
+
+        return SimpleNamespace(
+            args=cmd, pid=4242, returncode=returncode,
+            communicate=communicate,
+        )
+
+    return _popen
+
+
 # ---------------------------------------------------------------------------
 # Test: dispatch_agent writes .meta.json sidecar
 # ---------------------------------------------------------------------------
@@ -87,10 +111,10 @@ class TestDispatchWritesMeta:
         prompt_path.write_text("# Test\n")
         output_path = tmp_path / "output.md"
 
-        fake_result = SimpleNamespace(
-            stdout="hello", stderr="", returncode=0,
+        monkeypatch.setattr(
+            executor_mod.subprocess, "Popen",
+            _fake_popen(stdout="hello", stderr="", returncode=0),
         )
-        monkeypatch.setattr(executor_mod.subprocess, "run", lambda *a, **kw: fake_result)
 
         _make_dispatcher().dispatch_agent(
             "test-model", prompt_path, output_path,
@@ -111,10 +135,10 @@ class TestDispatchWritesMeta:
         prompt_path.write_text("# Test\n")
         output_path = tmp_path / "output.md"
 
-        fake_result = SimpleNamespace(
-            stdout="error output", stderr="stack trace", returncode=1,
+        monkeypatch.setattr(
+            executor_mod.subprocess, "Popen",
+            _fake_popen(stdout="error output", stderr="stack trace", returncode=1),
         )
-        monkeypatch.setattr(executor_mod.subprocess, "run", lambda *a, **kw: fake_result)
 
         _make_dispatcher().dispatch_agent(
             "test-model", prompt_path, output_path,
@@ -135,10 +159,10 @@ class TestDispatchWritesMeta:
         prompt_path.write_text("# Test\n")
         output_path = tmp_path / "output.md"
 
-        def _raise_timeout(*args, **kwargs):
-            raise subprocess.TimeoutExpired(cmd="agents", timeout=600)
-
-        monkeypatch.setattr(executor_mod.subprocess, "run", _raise_timeout)
+        monkeypatch.setattr(
+            executor_mod.subprocess, "Popen", _fake_popen(timeout=True),
+        )
+        monkeypatch.setattr(executor_mod.os, "killpg", lambda *_a: None)
 
         _make_dispatcher().dispatch_agent(
             "test-model", prompt_path, output_path,